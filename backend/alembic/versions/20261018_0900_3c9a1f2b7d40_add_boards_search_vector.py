@@ -0,0 +1,54 @@
+"""add boards search vector
+
+Revision ID: 3c9a1f2b7d40
+Revises: f73744b6e280
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f2b7d40'
+down_revision: Union[str, None] = 'f73744b6e280'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 조사가 붙은 단어 뒤에 원형을 덧붙임 ('가방을 팝니다' → '가방을 가방 팝니다')
+_PARTICLES = "으로|에서|에게|까지|부터|처럼|보다|이랑|하고|을|를|이|가|은|는|와|과|도|에|의|로|만|랑"
+_STEM_PATTERN = rf"'([^\s[:punct:]]+?)({_PARTICLES})(?=[\s[:punct:]]|$)', '\1\2 \1', 'g'"
+
+
+def upgrade() -> None:
+    # 생성 컬럼 추가는 테이블 재작성(ACCESS EXCLUSIVE 잠금)이 필요하므로 점검 시간에 실행
+    op.add_column(
+        'boards',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                f"setweight(to_tsvector('simple'::regconfig, regexp_replace(title, {_STEM_PATTERN})), 'A') || "
+                f"setweight(to_tsvector('simple'::regconfig, regexp_replace(content, {_STEM_PATTERN})), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_boards_search_vector',
+        'boards',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_boards_search_vector', table_name='boards')
+    op.drop_column('boards', 'search_vector')
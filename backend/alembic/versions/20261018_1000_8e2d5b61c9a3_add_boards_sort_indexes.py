@@ -0,0 +1,45 @@
+"""add boards sort indexes
+
+Revision ID: 8e2d5b61c9a3
+Revises: 3c9a1f2b7d40
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2d5b61c9a3'
+down_revision: Union[str, None] = '3c9a1f2b7d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 목록 정렬 keyset 인덱스, 쓰기를 막지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_boards_view_count_id',
+            'boards',
+            ['view_count', 'id'],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_boards_created_at_id',
+            'boards',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_boards_created_at_id', table_name='boards', postgresql_concurrently=True)
+        op.drop_index('ix_boards_view_count_id', table_name='boards', postgresql_concurrently=True)
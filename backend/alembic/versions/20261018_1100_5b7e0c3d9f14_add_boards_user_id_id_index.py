@@ -0,0 +1,36 @@
+"""add boards user_id id index
+
+Revision ID: 5b7e0c3d9f14
+Revises: 8e2d5b61c9a3
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e0c3d9f14'
+down_revision: Union[str, None] = '8e2d5b61c9a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 작성자별 목록 (최신순) 인덱스, 쓰기를 막지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_boards_user_id_id',
+            'boards',
+            ['user_id', sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_boards_user_id_id', table_name='boards', postgresql_concurrently=True)
@@ -1,12 +1,12 @@
 """
 API 의존성
 """
-from typing import AsyncGenerator, Optional
+from typing import AsyncContextManager, AsyncGenerator, Callable, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db, replica_router
 from app.core.security import decode_access_token
 from app.models.user import User
 from app.services.user import UserService
@@ -27,15 +27,14 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db_session),
-) -> User:
+def _get_token_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials],
+) -> int:
     """
-    현재 인증된 사용자 조회 (필수)
+    토큰에서 사용자 ID(sub) 추출
 
     Raises:
-        HTTPException: 인증 실패 시 401 에러
+        HTTPException: 토큰이 없거나 유효하지 않은 경우 401 에러
     """
     if not credentials:
         raise HTTPException(
@@ -62,8 +61,23 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return int(user_id)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db_session),
+) -> User:
+    """
+    현재 인증된 사용자 조회 (필수)
+
+    Raises:
+        HTTPException: 인증 실패 시 401 에러
+    """
+    user_id = _get_token_user_id(credentials)
+
     user_service = UserService(db)
-    user = await user_service.get_by_id(int(user_id))
+    user = await user_service.get_by_id_cached(user_id)
 
     if not user:
         raise HTTPException(
@@ -97,3 +111,87 @@ async def get_current_user_optional(
         return await get_current_user(credentials, db)
     except HTTPException:
         return None
+
+
+async def get_current_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> int:
+    """
+    토큰의 사용자 ID만 조회 (필수, DB 조회 없음)
+
+    본인 게시글 목록처럼 사용자 ID만 필요한 읽기 엔드포인트에서 사용.
+
+    Raises:
+        HTTPException: 토큰이 없거나 유효하지 않은 경우 401 에러
+    """
+    return _get_token_user_id(credentials)
+
+
+async def get_current_user_id_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> Optional[int]:
+    """
+    토큰의 사용자 ID만 조회 (선택적, DB 조회 없음)
+
+    is_author 판단처럼 사용자 ID만 필요한 읽기 엔드포인트에서 사용.
+    계정 상태(is_active)는 확인하지 않으므로 쓰기 권한 검사에는 get_current_user 사용
+    """
+    if not credentials:
+        return None
+
+    try:
+        return _get_token_user_id(credentials)
+    except HTTPException:
+        return None
+
+
+async def get_read_db_session(
+    user_id: Optional[int] = Depends(get_current_user_id_optional),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 데이터베이스 세션 의존성
+
+    복제본이 설정된 경우 복제본으로 라우팅하며,
+    최근 쓰기를 한 사용자는 일정 시간 primary를 사용한다 (read-your-writes).
+
+    Yields:
+        AsyncSession: 데이터베이스 세션
+    """
+    async for session in get_read_db(user_id):
+        yield session
+
+
+# 스냅샷 읽기 세션 생성 함수 (호출할 때마다 새 세션 컨텍스트)
+SnapshotSessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def get_snapshot_session_factory(
+    user_id: Optional[int] = Depends(get_current_user_id_optional),
+) -> SnapshotSessionFactory:
+    """
+    스냅샷 읽기 세션 팩토리 의존성 (REPEATABLE READ 읽기 전용 트랜잭션)
+
+    서버 사이드 커서로 대량 데이터를 스트리밍하는 엔드포인트에서 사용.
+    스트리밍 응답 본문은 핸들러가 반환된 뒤에 만들어지므로 세션을 의존성으로
+    열지 않고, 응답 본문 생성기 안에서 직접 열고 닫는다.
+    """
+    return lambda: replica_router.session(user_id, snapshot=True)
+
+
+async def get_current_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db_session),
+) -> User:
+    """
+    현재 인증된 관리자 조회
+
+    Raises:
+        HTTPException: 인증 실패 시 401, 관리자가 아니면 403 에러
+    """
+    user = await get_current_user(credentials, db)
+    if not user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
+    return user
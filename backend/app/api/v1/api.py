@@ -3,13 +3,14 @@ API v1 라우터 통합
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, boards
+from app.api.v1.endpoints import auth, boards, users
 
 api_router = APIRouter()
 
 # 엔드포인트 라우터 등록
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(boards.router, prefix="/boards", tags=["boards"])
+api_router.include_router(users.router, prefix="/users", tags=["users"])
 
 
 @api_router.get("/ping")
@@ -1,14 +1,24 @@
 """
 Auth API 엔드포인트
 """
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session, get_current_user
-from app.models.user import User
+from app.api.deps import (
+    get_db_session,
+    get_read_db_session,
+    get_current_user,
+    security,
+)
+from app.config import settings
+from app.core.responses import ModelJSONResponse
+from app.core.security import decode_access_token
 from app.schemas.auth import LoginRequest, LoginResponse
 from app.schemas.user import UserResponse
 from app.services.auth import AuthService
+from app.services.user import UserService
 
 router = APIRouter()
 
@@ -28,7 +38,9 @@ async def login(
         access_token, token_type, user 정보
     """
     auth_service = AuthService(db)
-    result = await auth_service.login(login_request.email, login_request.password)
+    result = await auth_service.login(
+        login_request.email, login_request.password
+    )
 
     if not result:
         raise HTTPException(
@@ -38,20 +50,40 @@ async def login(
         )
 
     token, user = result
-    return LoginResponse(
-        access_token=token,
-        token_type="bearer",
-        user=UserResponse.model_validate(user),
+    return ModelJSONResponse(
+        LoginResponse(
+            access_token=token,
+            token_type="bearer",
+            user=UserResponse.model_validate(user),
+        )
     )
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     """
     현재 로그인한 사용자 정보 조회
 
     인증 필요
+    AUTH_ME_FROM_CLAIMS 설정 시 사용자 캐시로 활성 계정임이 확인되면 토큰 클레임으로 응답 (DB 조회 생략)
+    사용자명/이메일은 로그인 시점 값이며, 캐시 miss나 비활성 계정은 DB 조회 경로로 처리한다.
     """
-    return UserResponse.model_validate(current_user)
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if settings.AUTH_ME_FROM_CLAIMS:
+        user = AuthService.user_from_claims(
+            decode_access_token(credentials.credentials)
+        )
+        if user and UserService.is_active_cached(user.id):
+            return ModelJSONResponse(user)
+
+    current_user = await get_current_user(credentials, db)
+    return ModelJSONResponse(UserResponse.model_validate(current_user))
@@ -1,19 +1,41 @@
 """
 Boards API 엔드포인트 (게시판)
 """
-from typing import Optional
-from fastapi import APIRouter, Depends, status, Query
+from datetime import datetime
+from typing import AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, Header, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session, get_current_user, get_current_user_optional
+from app.api.deps import (
+    get_db_session,
+    get_read_db_session,
+    get_snapshot_session_factory,
+    get_current_admin,
+    get_current_user,
+    get_current_user_id_optional,
+    SnapshotSessionFactory,
+)
+from app.config import settings
+from app.core.cache import board_list_cache
+from app.core.compression import no_compression
+from app.core.etag import etag_matches, make_etag
+from app.core.responses import ModelJSONResponse, dump_json
+from app.core.trending import trending_boards
+from app.database import replica_router
 from app.models.user import User
-from app.services.board import BoardService
+from app.services.board import EXPORT_FIELDS, BoardService
 from app.schemas.board import (
+    BoardBulkCreate,
+    BoardBulkCreateResponse,
     BoardCreate,
     BoardUpdate,
     BoardResponse,
     BoardListResponse,
-    BoardListItem,
+    BoardSearchResponse,
+    BoardTrendingItem,
+    BoardTrendingResponse,
+    to_list_items,
 )
 
 router = APIRouter()
@@ -21,70 +43,280 @@ router = APIRouter()
 
 @router.get("", response_model=BoardListResponse)
 async def get_boards(
-    cursor: Optional[int] = Query(None, description="마지막 게시글 ID (이전 페이지의 마지막 ID)"),
+    cursor: Optional[str] = Query(
+        None, description="이전 페이지 응답의 next_cursor (최신순은 마지막 게시글 ID)"
+    ),
     limit: int = Query(20, ge=1, le=100, description="조회할 게시글 수"),
-    db: AsyncSession = Depends(get_db_session),
+    sort: Literal["latest", "views", "created_desc", "created_asc"] = Query(
+        "latest",
+        description=(
+            "latest(등록순 최신) | views(조회수) | "
+            "created_desc | created_asc(작성 시각)"
+        ),
+    ),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     """
     게시글 목록 조회 (무한스크롤)
 
-    - 최신순 정렬
-    - cursor 기반 페이지네이션
+    - 기본 최신순 (ID 역순), sort로 조회수순/작성 시각순 선택
+    - cursor 기반 페이지네이션 (최신순 외에는 (정렬 값, ID) 불투명 커서)
     - 인증 불필요 (비회원도 조회 가능)
+    - 최신순 앞쪽 페이지는 직렬화된 응답을 캐시 (작성/수정/삭제 시 무효화)
+    - ETag 일치 시 304 (페이지의 ID 순서, 최대 updated_at 기준 약한 ETag)
+      조회수 변경만으로는 ETag가 바뀌지 않아 304 응답의 조회수는 이전 값일 수 있음
     """
     service = BoardService(db)
-    boards, has_more = await service.get_board_list(cursor, limit)
+    if sort != "latest":
+        return await _get_sorted_boards(
+            service, sort, cursor, limit, if_none_match
+        )
 
-    items = [
-        BoardListItem(
-            id=board.id,
-            title=board.title,
-            content=board.content[:100] + "..." if len(board.content) > 100 else board.content,
-            view_count=board.view_count,
-            author_name=board.user.username,
-            created_at=board.created_at,
+    list_cursor = service.parse_list_cursor(cursor)
+    cached = board_list_cache.get(list_cursor, limit)
+    if cached is not None:
+        body, etag = cached
+        headers = {
+            "ETag": etag,
+            "Cache-Control": settings.BOARD_LIST_CACHE_CONTROL,
+        }
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        return ModelJSONResponse(body, headers=headers)
+
+    generation = board_list_cache.generation
+    boards, has_more = await service.get_board_list(list_cursor, limit)
+
+    etag = _list_etag(boards, has_more)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": settings.BOARD_LIST_CACHE_CONTROL,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
         )
-        for board in boards
-    ]
 
-    return BoardListResponse(
-        items=items,
+    result = BoardListResponse(
+        items=to_list_items(boards),
         next_cursor=boards[-1].id if boards else None,
         has_more=has_more,
     )
+    body = dump_json(result)
+    board_list_cache.set(
+        list_cursor, limit, (body, etag), result.next_cursor, generation
+    )
+
+    return ModelJSONResponse(body, headers=headers)
+
+
+def _list_etag(boards, has_more: bool, *scope) -> str:
+    """
+    목록 ETag (정렬 기준 등 scope, 페이지의 ID 순서, 최대 updated_at)
+
+    조회수는 약한 ETag에서 의미상 같은 변경으로 보고 포함하지 않는다.
+    조회수순 정렬에서 순서가 바뀌면 ID 순서가 달라지므로 ETag도 바뀐다.
+    """
+    return make_etag(
+        "boards",
+        *scope,
+        ",".join(str(board.id) for board in boards),
+        max((board.updated_at for board in boards), default=None),
+        has_more,
+    )
+
+
+async def _get_sorted_boards(
+    service: BoardService,
+    sort: str,
+    cursor: Optional[str],
+    limit: int,
+    if_none_match: Optional[str],
+) -> Response:
+    """조회수순/작성 시각순 목록 (캐시하지 않음)"""
+    boards, has_more, next_cursor = await service.get_sorted_board_list(
+        sort, cursor, limit
+    )
+
+    etag = _list_etag(boards, has_more, sort)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": settings.BOARD_LIST_CACHE_CONTROL,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+
+    return ModelJSONResponse(
+        BoardListResponse(
+            items=to_list_items(boards),
+            next_cursor=next_cursor,
+            has_more=has_more,
+        ),
+        headers=headers,
+    )
+
+
+@router.get("/trending", response_model=BoardTrendingResponse)
+async def get_trending_boards(
+    limit: int = Query(
+        10, ge=1, le=settings.TRENDING_MAX_ITEMS, description="조회할 게시글 수"
+    ),
+):
+    """
+    인기 게시글 (시간 감쇠 조회 점수순)
+
+    - 상세 조회 이벤트로 메모리에서 유지하는 점수 상위 목록 (DB 조회 없음)
+    - 조회 1회의 가치는 TRENDING_HALF_LIFE초마다 절반
+    - 제목/조회수 등은 TRENDING_RECONCILE_INTERVAL초마다 DB와 동기화
+    - 프로세스(워커)별 집계
+    - 인증 불필요
+    """
+    return ModelJSONResponse(
+        BoardTrendingResponse(
+            items=[
+                BoardTrendingItem(**item, score=score)
+                for item, score in trending_boards.top(limit)
+            ]
+        )
+    )
+
+
+@router.get("/search", response_model=BoardSearchResponse)
+async def search_boards(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="검색어 (공백으로 구분된 단어 모두 포함)",
+    ),
+    cursor: Optional[str] = Query(None, description="이전 페이지 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 게시글 수"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    """
+    게시글 검색
+
+    - 제목/내용 전문 검색 (GIN 인덱스), 조사가 붙은 단어도 일치 ('가방' → '가방을' 포함)
+    - 관련도순 (제목 일치 우선), 같으면 최신순
+    - 관련도 정렬은 일치 게시글을 최신순으로 SEARCH_MAX_CANDIDATES건씩 나눈 구간 안에서 적용,
+      구간을 다 보면 다음 페이지부터 더 오래된 구간이 이어짐 (전체 일치 게시글 조회 가능)
+    - cursor 기반 페이지네이션 (불투명 커서)
+    - 인증 불필요
+    """
+    service = BoardService(db)
+    boards, has_more, next_cursor = await service.search_boards(
+        q, cursor, limit
+    )
+
+    return ModelJSONResponse(
+        BoardSearchResponse(
+            items=to_list_items(boards),
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+@no_compression
+async def export_boards(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="ndjson | csv"
+    ),
+    user_id: Optional[int] = Query(None, description="작성자 ID"),
+    created_from: Optional[datetime] = Query(
+        None, description="작성 시각 하한 (포함)"
+    ),
+    created_to: Optional[datetime] = Query(None, description="작성 시각 상한 (미포함)"),
+    admin: User = Depends(get_current_admin),
+    snapshot_session: SnapshotSessionFactory = Depends(
+        get_snapshot_session_factory
+    ),
+):
+    """
+    게시글 내보내기 (관리자 전용)
+
+    - NDJSON 또는 CSV 스트리밍 (ID 오름차순, 삭제된 게시글 제외)
+    - 서버 사이드 커서로 EXPORT_BATCH_SIZE건씩 읽어 메모리 사용량 일정
+    - 읽기 전용 스냅샷 트랜잭션에서 실행되어 내보내는 동안의 변경은 반영되지 않음
+    - 응답 압축 제외 (긴 스트림 동안 워커 CPU를 점유하지 않도록)
+    """
+    # 관리자 전용 기능이라 처음 호출될 때 로드 (csv 등)
+    from app.core.export import EXPORT_FORMATS, export_chunks
+
+    async def chunks() -> AsyncIterator[bytes]:
+        # 세션은 응답 본문을 다 보낼 때까지 필요하므로 생성기 안에서 열고 닫음
+        async with snapshot_session() as db:
+            partitions = BoardService(db).export_boards(
+                user_id, created_from, created_to, settings.EXPORT_BATCH_SIZE
+            )
+            async for chunk in export_chunks(
+                partitions, export_format, EXPORT_FIELDS
+            ):
+                yield chunk
+
+    filename = f"boards-{datetime.utcnow():%Y%m%d%H%M%S}.{export_format}"
+    return StreamingResponse(
+        chunks(),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/{board_id}", response_model=BoardResponse)
 async def get_board(
     board_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db_session),
+    current_user_id: Optional[int] = Depends(get_current_user_id_optional),
 ):
     """
     게시글 상세 조회
 
-    - 조회수 자동 증가
+    - 조회수 자동 증가 (304 응답이어도 조회로 집계)
     - 인증 불필요 (비회원도 조회 가능)
     - is_author: 현재 사용자가 작성자인지 여부
+    - ETag 일치 시 304 (ID, updated_at, is_author 기준 약한 ETag)
+      조회수는 포함하지 않으므로 304 응답의 조회수는 이전 값일 수 있음
     """
     service = BoardService(db)
-    board = await service.get_board(board_id)
-    await db.commit()  # 조회수 증가 반영
-
-    return BoardResponse(
-        id=board.id,
-        user_id=board.user_id,
-        title=board.title,
-        content=board.content,
-        view_count=board.view_count,
-        author_name=board.user.username,
-        is_author=current_user.id == board.user_id if current_user else False,
-        created_at=board.created_at,
-        updated_at=board.updated_at,
+    board, view_count = await service.get_board(board_id)
+
+    is_author = current_user_id == board.user_id
+    etag = make_etag("board", board.id, board.updated_at, is_author)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": settings.BOARD_DETAIL_CACHE_CONTROL,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+
+    return ModelJSONResponse(
+        BoardResponse(
+            id=board.id,
+            user_id=board.user_id,
+            title=board.title,
+            content=board.content,
+            view_count=view_count,
+            author_name=board.user.username,
+            is_author=is_author,
+            created_at=board.created_at,
+            updated_at=board.updated_at,
+        ),
+        headers=headers,
     )
 
 
-@router.post("", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "", response_model=BoardResponse, status_code=status.HTTP_201_CREATED
+)
 async def create_board(
     data: BoardCreate,
     db: AsyncSession = Depends(get_db_session),
@@ -100,21 +332,58 @@ async def create_board(
     service = BoardService(db)
     board = await service.create_board(current_user.id, data)
     await db.commit()
-    await db.refresh(board)
-
-    return BoardResponse(
-        id=board.id,
-        user_id=board.user_id,
-        title=board.title,
-        content=board.content,
-        view_count=board.view_count,
-        author_name=current_user.username,
-        is_author=True,
-        created_at=board.created_at,
-        updated_at=board.updated_at,
+    board_list_cache.invalidate()
+    replica_router.pin(current_user.id)
+
+    return ModelJSONResponse(
+        BoardResponse(
+            id=board.id,
+            user_id=board.user_id,
+            title=board.title,
+            content=board.content,
+            view_count=board.view_count,
+            author_name=current_user.username,
+            is_author=True,
+            created_at=board.created_at,
+            updated_at=board.updated_at,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=BoardBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_boards(
+    data: BoardBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    게시글 일괄 작성
+
+    - 인증 필수
+    - 요청당 최대 BOARD_BULK_MAX_ITEMS건
+    - 항목별 검증 후 유효한 항목만 다중 행 INSERT로 한 번에 저장
+    - created: 저장된 항목 (index, id), errors: 실패 항목 (index, 오류 목록)
+    - 저장된 항목이 없으면 422
+    """
+    service = BoardService(db)
+    result = await service.bulk_create_boards(current_user.id, data.items)
+    if not result.created:
+        return ModelJSONResponse(
+            result, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    await db.commit()
+    board_list_cache.invalidate()
+    replica_router.pin(current_user.id)
+
+    return ModelJSONResponse(result, status_code=status.HTTP_201_CREATED)
+
+
 @router.put("/{board_id}", response_model=BoardResponse)
 async def update_board(
     board_id: int,
@@ -126,23 +395,27 @@ async def update_board(
     게시글 수정
 
     - 인증 필수
-    - 작성자만 수정 가능
+    - 작성자만 수정 가능 (작성자 확인과 수정을 UPDATE 1회로 처리)
     """
     service = BoardService(db)
     board = await service.update_board(board_id, current_user.id, data)
     await db.commit()
-    await db.refresh(board)
-
-    return BoardResponse(
-        id=board.id,
-        user_id=board.user_id,
-        title=board.title,
-        content=board.content,
-        view_count=board.view_count,
-        author_name=board.user.username,
-        is_author=True,
-        created_at=board.created_at,
-        updated_at=board.updated_at,
+    board_list_cache.invalidate()
+    trending_boards.update_board(board)
+    replica_router.pin(current_user.id)
+
+    return ModelJSONResponse(
+        BoardResponse(
+            id=board.id,
+            user_id=board.user_id,
+            title=board.title,
+            content=board.content,
+            view_count=board.view_count,
+            author_name=current_user.username,  # 작성자만 수정 가능
+            is_author=True,
+            created_at=board.created_at,
+            updated_at=board.updated_at,
+        )
     )
 
 
@@ -156,9 +429,12 @@ async def delete_board(
     게시글 삭제
 
     - 인증 필수
-    - 작성자만 삭제 가능
+    - 작성자만 삭제 가능 (작성자 확인과 삭제를 UPDATE 1회로 처리)
     - Soft delete (deleted_at 설정)
     """
     service = BoardService(db)
     await service.delete_board(board_id, current_user.id)
     await db.commit()
+    board_list_cache.invalidate()
+    trending_boards.discard(board_id)
+    replica_router.pin(current_user.id)
@@ -0,0 +1,69 @@
+"""
+Users API 엔드포인트 (작성자별 게시글)
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_id, get_read_db_session
+from app.core.responses import ModelJSONResponse
+from app.schemas.board import BoardListResponse, to_list_items
+from app.services.board import BoardService
+
+router = APIRouter()
+
+
+async def _user_boards(
+    db: AsyncSession, user_id: int, cursor: Optional[int], limit: int
+) -> ModelJSONResponse:
+    service = BoardService(db)
+    boards, has_more = await service.get_user_board_list(
+        user_id, cursor, limit
+    )
+
+    return ModelJSONResponse(
+        BoardListResponse(
+            items=to_list_items(boards),
+            next_cursor=boards[-1].id if boards else None,
+            has_more=has_more,
+        )
+    )
+
+
+# /me/boards는 /{user_id}/boards보다 먼저 등록
+@router.get("/me/boards", response_model=BoardListResponse)
+async def get_my_boards(
+    cursor: Optional[int] = Query(
+        None, description="마지막 게시글 ID (이전 페이지의 마지막 ID)"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="조회할 게시글 수"),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    """
+    내 게시글 목록 조회 (최신순)
+
+    - 인증 필요 (토큰의 사용자 ID만 사용, DB 조회 없음)
+    - cursor 기반 페이지네이션
+    """
+    return await _user_boards(db, user_id, cursor, limit)
+
+
+@router.get("/{user_id}/boards", response_model=BoardListResponse)
+async def get_user_boards(
+    user_id: int,
+    cursor: Optional[int] = Query(
+        None, description="마지막 게시글 ID (이전 페이지의 마지막 ID)"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="조회할 게시글 수"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    """
+    작성자별 게시글 목록 조회 (최신순)
+
+    - (user_id, id DESC) 부분 인덱스로 작성자 게시글만 조회
+    - cursor 기반 페이지네이션
+    - 인증 불필요
+    - 존재하지 않는 사용자는 404
+    """
+    return await _user_boards(db, user_id, cursor, limit)
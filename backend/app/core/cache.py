@@ -0,0 +1,215 @@
+"""
+인메모리 캐시
+TTL + LRU 기반의 프로세스 로컬 캐시
+"""
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from app.config import settings
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 페이지 커서 (최신순은 게시글 ID, 그 외 정렬은 불투명 문자열)
+PageCursor = Union[int, str]
+
+
+class TTLCache(Generic[K, V]):
+    """
+    크기 제한(LRU) + 만료 시간(TTL) 캐시
+
+    - 이벤트 루프 단일 스레드에서 사용하므로 별도의 락을 두지 않는다
+    - maxsize <= 0 이면 캐시 비활성화 (항상 miss)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        캐시 조회
+
+        Returns:
+            Optional[V]: 캐시된 값 또는 None (없거나 만료된 경우)
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self.timer():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 키
+            value: 값
+            ttl: 항목별 만료 시간 (기본값: 캐시 TTL)
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (
+            self.timer() + (self.ttl if ttl is None else ttl),
+            value,
+        )
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """캐시 항목 삭제"""
+        self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        조건에 맞는 항목 삭제 (전체 순회)
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        keys = [
+            key
+            for key, (_, value) in self._data.items()
+            if predicate(key, value)
+        ]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit/miss 카운터)"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+class PageCache(Generic[V]):
+    """
+    커서 페이지 응답 캐시 (직렬화된 응답 등)
+
+    - 첫 페이지(cursor=None)부터 max_pages 깊이까지만 캐시
+    - 캐시된 페이지의 next_cursor만 다음 깊이로 인정하여 임의의 커서는 캐시하지 않음
+    - invalidate() 시 세대(generation)를 올려, 무효화 이전에 시작된 조회 결과는 저장하지 않음
+    """
+
+    def __init__(self, max_pages: int, maxsize: int, ttl: float):
+        self.max_pages = max_pages
+        self.generation = 0
+        self._pages: TTLCache[Tuple[Optional[PageCursor], int], V] = TTLCache(
+            maxsize, ttl
+        )
+        self._depths: Dict[Tuple[Optional[PageCursor], int], int] = {}
+
+    def _depth(
+        self, cursor: Optional[PageCursor], limit: int
+    ) -> Optional[int]:
+        """커서의 페이지 깊이 (캐시 대상이 아니면 None)"""
+        if self.max_pages <= 0:
+            return None
+        if cursor is None:
+            return 0
+        return self._depths.get((cursor, limit))
+
+    def get(self, cursor: Optional[PageCursor], limit: int) -> Optional[V]:
+        """캐시된 페이지 조회"""
+        if self._depth(cursor, limit) is None:
+            return None
+        return self._pages.get((cursor, limit))
+
+    def set(
+        self,
+        cursor: Optional[PageCursor],
+        limit: int,
+        value: V,
+        next_cursor: Optional[PageCursor],
+        generation: int,
+    ) -> None:
+        """
+        페이지 저장
+
+        Args:
+            generation: 조회 시작 시점의 세대 (그 사이 무효화되었으면 저장하지 않음)
+        """
+        depth = self._depth(cursor, limit)
+        if depth is None or generation != self.generation:
+            return
+
+        self._pages.set((cursor, limit), value)
+        if next_cursor is not None and depth + 1 < self.max_pages:
+            self._depths[(next_cursor, limit)] = depth + 1
+
+    def invalidate(self) -> None:
+        """전체 무효화 (게시글 작성/수정/삭제 시)"""
+        self.generation += 1
+        self._pages.clear()
+        self._depths.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {**self._pages.stats, "generation": self.generation}
+
+
+# 인증 사용자 캐시 (user_id → User 컬럼 스냅샷)
+user_cache: TTLCache[int, Dict[str, Any]] = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+)
+
+# 검증된 JWT 캐시 (token → payload, 항목별 TTL은 토큰 만료까지)
+token_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+# 게시글 목록 첫 페이지 캐시 ((cursor, limit) → (직렬화된 응답, ETag))
+board_list_cache: PageCache[Tuple[bytes, str]] = PageCache(
+    max_pages=settings.BOARD_LIST_CACHE_PAGES,
+    maxsize=settings.BOARD_LIST_CACHE_SIZE,
+    ttl=settings.BOARD_LIST_CACHE_TTL,
+)
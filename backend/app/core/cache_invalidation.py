@@ -0,0 +1,125 @@
+"""
+프로세스 간 캐시 무효화 (PostgreSQL LISTEN/NOTIFY)
+
+사용자 캐시/토큰 캐시는 워커(프로세스)별 메모리에 있으므로, 한 워커에서 사용자를
+비활성화해도 다른 워커는 TTL 동안 이전 상태를 사용한다.
+변경 트랜잭션 안에서 pg_notify를 보내면 커밋될 때만 모든 워커의 리스너에 전달된다.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.cache import token_cache, user_cache
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_user(user_id: int) -> None:
+    """현재 프로세스의 사용자 캐시와 해당 사용자의 검증된 토큰 캐시 삭제"""
+    user_cache.invalidate(user_id)
+    subject = str(user_id)
+    token_cache.invalidate_where(
+        lambda token, payload: payload.get("sub") == subject
+    )
+
+
+async def notify_user_changed(session: AsyncSession, user_id: int) -> None:
+    """
+    사용자 변경 알림 (현재 트랜잭션이 커밋될 때만 전달)
+
+    CACHE_INVALIDATION_CHANNEL이 비어 있으면 아무것도 하지 않는다.
+    """
+    if not settings.CACHE_INVALIDATION_CHANNEL:
+        return
+    await session.execute(
+        select(
+            func.pg_notify(settings.CACHE_INVALIDATION_CHANNEL, str(user_id))
+        )
+    )
+
+
+class CacheInvalidationListener:
+    """
+    캐시 무효화 알림 수신기 (워커당 전용 커넥션 1개)
+
+    - 알림의 사용자 ID로 invalidate_user 호출
+    - 연결이 끊기면 reconnect_delay 후 다시 연결하고, 끊긴 동안의 알림은
+      알 수 없으므로 사용자/토큰 캐시 전체를 비운다
+    """
+
+    def __init__(
+        self,
+        url: str = settings.DATABASE_URL,
+        channel: str = settings.CACHE_INVALIDATION_CHANNEL,
+        reconnect_delay: float = 1.0,
+    ):
+        # asyncpg에 직접 연결 (SQLAlchemy 드라이버 이름, 쿼리 옵션 제거)
+        self.dsn = (
+            make_url(url)
+            .set(drivername="postgresql", query={})
+            .render_as_string(hide_password=False)
+        )
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str):
+        try:
+            invalidate_user(int(payload))
+        except ValueError:
+            logger.warning("잘못된 캐시 무효화 알림: %r", payload)
+
+    async def _listen_once(self) -> None:
+        """연결 후 끊길 때까지 알림 수신"""
+        connection = await asyncpg.connect(self.dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            await connection.add_listener(self.channel, self._on_notify)
+            self.connected.set()
+            await closed.wait()
+        finally:
+            self.connected.clear()
+            if not connection.is_closed():
+                await connection.close()
+
+    async def _run(self) -> None:
+        reconnecting = False
+        while True:
+            try:
+                if reconnecting:
+                    user_cache.clear()
+                    token_cache.clear()
+                await self._listen_once()
+                logger.warning("캐시 무효화 리스너 연결 끊김")
+            except Exception:
+                logger.exception("캐시 무효화 리스너 연결 실패")
+            reconnecting = True
+            await asyncio.sleep(self.reconnect_delay)
+
+    def start(self) -> None:
+        """백그라운드 수신 태스크 시작 (채널이 비어 있으면 시작하지 않음)"""
+        if self._task is not None or not self.channel:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 태스크 종료 (커넥션 닫기)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 애플리케이션 전역 캐시 무효화 리스너
+cache_invalidation_listener = CacheInvalidationListener()
@@ -0,0 +1,294 @@
+"""
+응답 압축 미들웨어
+gzip 기본 지원, brotli(Brotli 패키지) / zstd(zstandard 패키지)는 설치된 경우에만 사용
+"""
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # brotli 미설치 시 br 인코딩 비활성화
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 zstd 인코딩 비활성화
+    zstandard = None  # type: ignore[assignment]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _BrotliCompressor:
+    """brotli.Compressor를 compress/flush 인터페이스로 감싼 어댑터"""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _gzip_compressor() -> Any:
+    return zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+def _brotli_compressor() -> Any:
+    return _BrotliCompressor(settings.COMPRESSION_BROTLI_QUALITY)
+
+
+def _zstd_compressor() -> Any:
+    return zstandard.ZstdCompressor(
+        level=settings.COMPRESSION_ZSTD_LEVEL
+    ).compressobj()
+
+
+# 인코딩 → 스트리밍 압축기 팩토리 (설치된 것만)
+_COMPRESSORS: Dict[str, Callable[[], Any]] = {"gzip": _gzip_compressor}
+if brotli is not None:
+    _COMPRESSORS["br"] = _brotli_compressor
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = _zstd_compressor
+
+
+def no_compression(endpoint: F) -> F:
+    """
+    라우트별 압축 제외 데코레이터
+
+    사용 예:
+        @router.get("/export")
+        @no_compression
+        async def export(): ...
+    """
+    setattr(endpoint, "__no_compression__", True)
+    return endpoint
+
+
+class CompressionStats:
+    """인코딩별 압축 통계 (응답 수, 원본/압축 바이트, CPU 시간)"""
+
+    def __init__(self) -> None:
+        self.responses: Dict[str, int] = {}
+        self.bytes_in: Dict[str, int] = {}
+        self.bytes_out: Dict[str, int] = {}
+        self.cpu_seconds: Dict[str, float] = {}
+
+    def record(
+        self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float
+    ) -> None:
+        self.bytes_in[encoding] = self.bytes_in.get(encoding, 0) + bytes_in
+        self.bytes_out[encoding] = self.bytes_out.get(encoding, 0) + bytes_out
+        self.cpu_seconds[encoding] = (
+            self.cpu_seconds.get(encoding, 0.0) + cpu_seconds
+        )
+
+    def count(self, encoding: str) -> None:
+        self.responses[encoding] = self.responses.get(encoding, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """인코딩별 통계 (ratio = 압축 후 / 원본)"""
+        return {
+            encoding: {
+                "responses": self.responses.get(encoding, 0),
+                "bytes_in": self.bytes_in.get(encoding, 0),
+                "bytes_out": self.bytes_out.get(encoding, 0),
+                "ratio": (
+                    self.bytes_out.get(encoding, 0) / self.bytes_in[encoding]
+                    if self.bytes_in.get(encoding)
+                    else 0.0
+                ),
+                "cpu_seconds": self.cpu_seconds.get(encoding, 0.0),
+            }
+            for encoding in self.bytes_in
+        }
+
+
+compression_stats = CompressionStats()
+
+
+def select_encoding(
+    accept_encoding: str, preferred: Sequence[str]
+) -> Optional[str]:
+    """
+    Accept-Encoding 협상
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+        preferred: 서버 선호 순서
+
+    Returns:
+        Optional[str]: 사용할 인코딩 (없으면 None)
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in preferred:
+        if encoding not in _COMPRESSORS:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 ASGI 미들웨어
+
+    - 최소 크기(minimum_size) 미만, 허용되지 않은 Content-Type, 이미 인코딩된 응답은 제외
+    - no_compression 데코레이터가 붙은 라우트는 제외
+    - 스트리밍 응답은 청크 단위로 압축 (크기 임계치 미적용)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MIN_SIZE,
+        content_types: Sequence[str] = tuple(
+            settings.COMPRESSION_CONTENT_TYPES
+        ),
+        encodings: Sequence[str] = tuple(settings.COMPRESSION_ENCODINGS),
+        stats: CompressionStats = compression_stats,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        self.encodings = tuple(encodings)
+        self.stats = stats
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """응답 메시지를 가로채 압축 여부를 결정하고 압축된 본문을 전송"""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: Scope,
+        send: Send,
+        encoding: str,
+    ):
+        self.middleware = middleware
+        self.scope = scope
+        self.send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.compressor: Any = None
+        self.passthrough = False
+
+    def _eligible(self, start_message: Message) -> bool:
+        """압축 대상 응답인지 확인 (본문 크기 제외)"""
+        if getattr(self.scope.get("endpoint"), "__no_compression__", False):
+            return False
+        if start_message["status"] in (204, 304):
+            return False
+        headers = Headers(raw=start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(self.middleware.content_types)
+
+    def _set_headers(
+        self, start_message: Message, content_length: Optional[int]
+    ) -> None:
+        headers = MutableHeaders(scope=start_message)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # 인코딩별로 본문이 다르므로 강한 ETag는 약한 ETag로 변경
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    def _compress(self, body: bytes, finish: bool) -> bytes:
+        start = time.thread_time()
+        data = self.compressor.compress(body)
+        if finish:
+            data += self.compressor.flush()
+        self.middleware.stats.record(
+            self.encoding, len(body), len(data), time.thread_time() - start
+        )
+        return data
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        start_message = self.start_message
+        if (
+            message["type"] != "http.response.body"
+            or self.passthrough
+            or start_message is None
+        ):
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            # 첫 본문 메시지에서 압축 여부 결정
+            if not self._eligible(start_message) or (
+                not more_body and len(body) < self.middleware.minimum_size
+            ):
+                self.passthrough = True
+                await self.send(start_message)
+                await self.send(message)
+                return
+
+            self.compressor = _COMPRESSORS[self.encoding]()
+            self.middleware.stats.count(self.encoding)
+            if not more_body:
+                data = self._compress(body, finish=True)
+                self._set_headers(start_message, len(data))
+                await self.send(start_message)
+                await self.send({"type": "http.response.body", "body": data})
+                return
+
+            self._set_headers(start_message, None)
+            await self.send(start_message)
+
+        data = self._compress(body, finish=not more_body)
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": data,
+                "more_body": more_body,
+            }
+        )
@@ -0,0 +1,42 @@
+"""
+불투명(opaque) 페이지네이션 커서
+복합 정렬 키(점수, ID 등)를 URL-safe 문자열로 인코딩
+"""
+import base64
+import json
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 → 커서 문자열
+
+    Args:
+        values: JSON 직렬화 가능한 정렬 키 값 (마지막 항목의 값)
+
+    Returns:
+        str: URL-safe base64 커서 (패딩 제거)
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    커서 문자열 → 정렬 키
+
+    Args:
+        cursor: encode_cursor로 만든 커서
+        size: 정렬 키 개수
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("invalid cursor")
+    return values
@@ -0,0 +1,135 @@
+"""
+DB 커넥션 풀 계측
+체크아웃 대기 시간 집계, 풀 상태 조회, 시작 시 pre-warm
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """커넥션 체크아웃 대기 통계"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        if wait_seconds > self.wait_seconds_max:
+            self.wait_seconds_max = wait_seconds
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.stats = self.stats
+        return pool
+
+
+def pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    커넥션 풀 상태
+
+    Returns:
+        dict: 풀 크기, 사용 중(checked_out), 유휴(idle), overflow, 대기 시간 통계
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        status.update(
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            wait_seconds_total=stats.wait_seconds_total,
+            wait_seconds_max=stats.wait_seconds_max,
+            wait_seconds_avg=(
+                stats.wait_seconds_total / stats.checkouts
+                if stats.checkouts
+                else 0.0
+            ),
+        )
+    return status
+
+
+async def prewarm_pool(
+    engine: AsyncEngine,
+    connections: int,
+    warmup: Optional[Callable[[AsyncConnection], Awaitable[None]]] = None,
+) -> int:
+    """
+    커넥션 풀 pre-warm (시작 시 커넥션을 미리 열어 둠)
+
+    DB에 연결할 수 없어도 애플리케이션 시작은 막지 않는다.
+    connections개를 동시에 체크아웃하므로 이미 열린 유휴 커넥션이 있으면 그대로 재사용된다.
+
+    Args:
+        engine: 비동기 엔진
+        connections: 미리 열 커넥션 수
+        warmup: 열린 커넥션마다 실행할 함수 (쿼리 warm-up, 끝나면 rollback)
+
+    Returns:
+        int: 열린 커넥션 수
+    """
+    if connections <= 0:
+        return 0
+
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+
+    if warmup is not None:
+        failures = await asyncio.gather(
+            *(warmup(conn) for conn in opened), return_exceptions=True
+        )
+        for failure in failures:
+            if isinstance(failure, BaseException):
+                logger.warning("커넥션 warm-up 실패: %r", failure)
+    for conn in opened:
+        await conn.rollback()
+        await conn.close()
+
+    if len(opened) < connections:
+        logger.warning("커넥션 풀 pre-warm 실패: %d/%d", len(opened), connections)
+    return len(opened)
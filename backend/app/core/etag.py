@@ -0,0 +1,46 @@
+"""
+ETag / 조건부 GET 유틸리티
+"""
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any, weak: bool = True) -> str:
+    """
+    ETag 생성
+
+    Args:
+        parts: 리소스 버전을 구성하는 값 (ID, updated_at 등)
+        weak: 약한 ETag 여부 (조회수처럼 의미상 동일한 변경은 무시)
+
+    Returns:
+        str: ETag 헤더 값
+    """
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 비교 (GET용 약한 비교)
+
+    Args:
+        if_none_match: If-None-Match 헤더 값 (쉼표로 구분된 목록 또는 *)
+        etag: 현재 리소스의 ETag
+
+    Returns:
+        bool: 일치 여부 (일치 시 304 응답)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
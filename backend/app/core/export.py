@@ -0,0 +1,61 @@
+"""
+대량 내보내기 인코딩
+DB에서 배치(partition) 단위로 받은 행을 NDJSON / CSV 청크로 변환
+"""
+import csv
+import io
+from typing import AsyncIterator, Dict, Sequence
+
+from sqlalchemy.engine import Row
+
+from app.core.responses import dump_json
+
+EXPORT_FORMATS: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",  # text/* 는 starlette가 charset=utf-8 추가
+}
+
+# Excel에서 UTF-8 CSV의 한글이 깨지지 않도록 BOM 추가
+CSV_BOM = "\ufeff"
+
+
+def encode_ndjson(rows: Sequence[Row]) -> bytes:
+    """행 목록 → NDJSON (행마다 JSON 객체 한 줄)"""
+    return b"".join(dump_json(row._asdict()) + b"\n" for row in rows)
+
+
+def encode_csv(rows: Sequence[Row], header: Sequence[str] = ()) -> bytes:
+    """행 목록 → CSV (header가 있으면 BOM과 헤더 행 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        buffer.write(CSV_BOM)
+        writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def export_chunks(
+    partitions: AsyncIterator[Sequence[Row]],
+    export_format: str,
+    columns: Sequence[str],
+) -> AsyncIterator[bytes]:
+    """
+    배치 단위 행 → 응답 청크
+
+    배치 하나를 청크 하나로 인코딩하므로 메모리 사용량은 배치 크기에만 비례한다.
+
+    Args:
+        partitions: 행 배치 비동기 이터레이터
+        export_format: ndjson | csv
+        columns: CSV 헤더 (컬럼 이름)
+    """
+    if export_format == "csv":
+        # 결과가 없어도 헤더는 내보냄
+        yield encode_csv((), columns)
+        async for rows in partitions:
+            yield encode_csv(rows)
+        return
+
+    async for rows in partitions:
+        yield encode_ndjson(rows)
@@ -0,0 +1,423 @@
+"""
+Prometheus 메트릭
+외부 의존성 없이 Prometheus text exposition format(0.0.4)으로 메트릭을 노출
+
+- 이벤트 루프 단일 스레드에서 갱신하므로 락 없이 dict/list 값을 직접 증가
+- 라우트 라벨은 경로 템플릿(/api/v1/boards/{board_id})을 사용하여 카디널리티 제한
+- 풀/캐시 등은 스크레이프 시점에 콜백으로 계산
+"""
+import time
+from bisect import bisect_left
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import (
+    PageCache,
+    TTLCache,
+    board_list_cache,
+    token_cache,
+    user_cache,
+)
+from app.core.compression import compression_stats
+from app.core.db_pool import pool_status
+from app.core.security import password_hash_pool
+from app.core.view_counter import view_counter
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Labels, float]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """메트릭 공통 (이름, 설명, 타입, 라벨)"""
+
+    type = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+    def _sample(self, labels: Sequence[str], value: float) -> str:
+        """샘플 한 줄 (이름{라벨} 값)"""
+        label_str = _format_labels(self.labelnames, labels)
+        return f"{self.name}{label_str} {_format_value(value)}"
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            self._sample(labels, value)
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Counter):
+    """증감 가능한 게이지"""
+
+    type = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (버킷별 개수는 내부적으로 비누적 저장)"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[Labels, List[int]] = {}
+        self._sums: Dict[Labels, float] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        names = self.labelnames + ("le",)
+        for labels, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    names, labels + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            total = _format_value(self._sums[labels])
+            lines.append(f"{self.name}_sum{label_str} {total}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """스크레이프 시점에 값을 계산하는 메트릭"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labelnames: Sequence[str],
+        func: Callable[[], Iterable[Sample]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type = metric_type
+        self.func = func
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            self._sample(labels, value) for labels, value in self.func()
+        ]
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 text format 렌더링"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labelnames: Sequence[str],
+        func: Callable[[], Iterable[Sample]],
+    ) -> CallbackMetric:
+        return self.register(
+            CallbackMetric(name, documentation, metric_type, labelnames, func)
+        )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+
+
+class MetricsMiddleware:
+    """요청 수, 상태 코드, 처리 시간, 처리 중 요청 수 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # 라우터가 scope에 채운 라우트의 경로 템플릿 사용
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            http_requests_total.inc((method, route, str(status_code)))
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start, (method, route)
+            )
+
+
+def register_runtime_metrics(engine: AsyncEngine) -> None:
+    """DB 풀, 캐시, 압축, 백그라운드 큐 메트릭을 스크레이프 콜백으로 등록"""
+
+    def pool_gauges() -> Iterable[Sample]:
+        status = pool_status(engine)
+        for key in ("size", "checked_out", "idle", "overflow"):
+            if key in status:
+                yield (key,), status[key]
+
+    def pool_counters(key: str) -> Callable[[], Iterable[Sample]]:
+        return lambda: [((), pool_status(engine).get(key, 0))]
+
+    caches: Dict[str, Union[TTLCache[Any, Any], PageCache[Any]]] = {
+        "user": user_cache,
+        "token": token_cache,
+        "board_list": board_list_cache,
+    }
+
+    def cache_stat(key: str) -> Callable[[], Iterable[Sample]]:
+        return lambda: [
+            ((name,), cache.stats[key]) for name, cache in caches.items()
+        ]
+
+    def compression_stat(key: str) -> Callable[[], Iterable[Sample]]:
+        return lambda: [
+            ((encoding,), stats[key])
+            for encoding, stats in compression_stats.snapshot().items()
+        ]
+
+    registry.callback(
+        "db_pool_connections",
+        "DB 커넥션 풀 상태별 커넥션 수",
+        "gauge",
+        ("state",),
+        pool_gauges,
+    )
+    registry.callback(
+        "db_pool_checkouts_total",
+        "커넥션 체크아웃 수",
+        "counter",
+        (),
+        pool_counters("checkouts"),
+    )
+    registry.callback(
+        "db_pool_timeouts_total",
+        "커넥션 체크아웃 타임아웃 수",
+        "counter",
+        (),
+        pool_counters("timeouts"),
+    )
+    registry.callback(
+        "db_pool_wait_seconds_total",
+        "커넥션 체크아웃 대기 시간 합계",
+        "counter",
+        (),
+        pool_counters("wait_seconds_total"),
+    )
+    registry.callback(
+        "cache_hits_total",
+        "캐시 hit 수",
+        "counter",
+        ("cache",),
+        cache_stat("hits"),
+    )
+    registry.callback(
+        "cache_misses_total",
+        "캐시 miss 수",
+        "counter",
+        ("cache",),
+        cache_stat("misses"),
+    )
+    registry.callback(
+        "cache_hit_ratio",
+        "캐시 hit 비율",
+        "gauge",
+        ("cache",),
+        cache_stat("hit_ratio"),
+    )
+    registry.callback(
+        "cache_entries", "캐시 항목 수", "gauge", ("cache",), cache_stat("size")
+    )
+    registry.callback(
+        "compression_bytes_in_total",
+        "압축 전 바이트",
+        "counter",
+        ("encoding",),
+        compression_stat("bytes_in"),
+    )
+    registry.callback(
+        "compression_bytes_out_total",
+        "압축 후 바이트",
+        "counter",
+        ("encoding",),
+        compression_stat("bytes_out"),
+    )
+    registry.callback(
+        "compression_cpu_seconds_total",
+        "압축 CPU 시간",
+        "counter",
+        ("encoding",),
+        compression_stat("cpu_seconds"),
+    )
+    registry.callback(
+        "password_hash_pending",
+        "bcrypt 풀 실행/대기 작업 수",
+        "gauge",
+        (),
+        lambda: [((), password_hash_pool.pending)],
+    )
+    registry.callback(
+        "password_hash_rejected_total",
+        "bcrypt 대기열 포화로 거절된 요청 수",
+        "counter",
+        (),
+        lambda: [((), password_hash_pool.rejected)],
+    )
+    registry.callback(
+        "view_count_pending_boards",
+        "DB에 반영되지 않은 조회수가 있는 게시글 수",
+        "gauge",
+        (),
+        lambda: [((), view_counter.pending_boards)],
+    )
@@ -0,0 +1,175 @@
+"""
+요청별 SQL 계측
+SQLAlchemy 이벤트로 요청당 쿼리 수, 총 DB 시간, 가장 느린 쿼리를 집계하고
+Server-Timing 헤더와 구조화 로그로 노출, 느린 쿼리 로그 기록
+"""
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+request_logger = logging.getLogger("app.request")
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+class QueryStats:
+    """요청 하나의 SQL 통계"""
+
+    __slots__ = (
+        "count",
+        "total_seconds",
+        "slowest_seconds",
+        "slowest_statement",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Server-Timing 헤더 값"""
+        return (
+            f"db;dur={self.total_seconds * 1000:.2f};"
+            f'desc="{self.count} queries", '
+            f"app;dur={total_seconds * 1000:.2f}"
+        )
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 SQL 통계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if (
+        elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS
+        and random.random() < settings.SLOW_QUERY_SAMPLE_RATE
+    ):
+        # 파라미터는 개인정보가 포함될 수 있어 기록하지 않음
+        slow_query_logger.warning(
+            "slow query %.1fms",
+            elapsed * 1000,
+            extra={
+                "duration_ms": elapsed * 1000,
+                "statement": statement,
+                "executemany": executemany,
+            },
+        )
+
+
+def _handle_error(exception_context: Any) -> None:
+    # 실패한 쿼리의 시작 시각 제거
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 SQL 계측 이벤트 등록"""
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 통계 미들웨어
+
+    - 응답 헤더: Server-Timing (db 시간/쿼리 수, 전체 처리 시간)
+    - 요청 종료 시 app.request 로거에 구조화 필드 기록
+      (응답 이후 실행되는 세션 commit까지 포함)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = settings.SERVER_TIMING_ENABLED,
+    ):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        stats.server_timing(time.perf_counter() - start),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            request_logger.info(
+                "%s %s %d",
+                scope["method"],
+                scope["path"],
+                status_code,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                    "db_queries": stats.count,
+                    "db_time_ms": stats.total_seconds * 1000,
+                    "db_slowest_ms": stats.slowest_seconds * 1000,
+                    "db_slowest_statement": stats.slowest_statement,
+                },
+            )
@@ -0,0 +1,181 @@
+"""
+읽기 전용 복제본(read replica) 라우팅
+"""
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List, Optional, Sequence
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+from sqlalchemy.pool import QueuePool
+
+from app.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+
+def read_only_bind(
+    engine: AsyncEngine, read_only_transactions: bool = False
+) -> AsyncEngine:
+    """
+    읽기 세션용 엔진 (같은 커넥션 풀 공유)
+
+    기본은 AUTOCOMMIT으로 BEGIN/COMMIT 왕복을 생략하고,
+    read_only_transactions이면 BEGIN READ ONLY 트랜잭션을 사용한다 (종료 시 rollback).
+    """
+    if read_only_transactions:
+        return engine.execution_options(postgresql_readonly=True)
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def snapshot_bind(engine: AsyncEngine) -> AsyncEngine:
+    """
+    스냅샷 읽기용 엔진 (REPEATABLE READ, READ ONLY 트랜잭션)
+
+    내보내기처럼 서버 사이드 커서로 오래 읽으면서 일관된 결과가 필요한 경우 사용
+    """
+    return engine.execution_options(
+        isolation_level="REPEATABLE READ", postgresql_readonly=True
+    )
+
+
+def _checked_out(engine: AsyncEngine) -> int:
+    """엔진 풀에서 사용 중인 커넥션 수 (QueuePool이 아니면 0)"""
+    pool = engine.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class ReplicaRouter:
+    """
+    읽기 세션 라우터
+
+    - 복제본 선택: round_robin 또는 least_connections (체크아웃된 커넥션 수 기준)
+    - 복제본 연결 실패 시 retry_seconds 동안 제외하고 다음 후보(최종적으로 primary) 사용
+    - 쓰기 직후 pin_seconds 동안 해당 클라이언트는 primary로 고정 (read-your-writes)
+    - 읽기 세션은 commit하지 않음 (read_only_bind 참고)
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        strategy: str = ROUND_ROBIN,
+        pin_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+        max_pins: int = 100000,
+        read_only_transactions: bool = False,
+    ):
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"unknown replica strategy: {strategy}")
+
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.retry_seconds = retry_seconds
+        self._session_factories = {
+            engine: self._session_factory(
+                read_only_bind(engine, read_only_transactions)
+            )
+            for engine in [primary, *self.replicas]
+        }
+        self._snapshot_session_factories = {
+            engine: self._session_factory(snapshot_bind(engine))
+            for engine in [primary, *self.replicas]
+        }
+        self._pins: TTLCache[Hashable, bool] = TTLCache(
+            maxsize=max_pins, ttl=pin_seconds
+        )
+        self._down_until: Dict[AsyncEngine, float] = {}
+        self._round_robin = itertools.count()
+
+    @staticmethod
+    def _session_factory(bind: AsyncEngine) -> async_sessionmaker:
+        return async_sessionmaker(
+            bind, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+
+    def pin(self, client_key: Optional[Hashable]) -> None:
+        """쓰기 후 클라이언트를 일정 시간 primary로 고정"""
+        if client_key is not None and self.replicas:
+            self._pins.set(client_key, True)
+
+    def is_pinned(self, client_key: Optional[Hashable]) -> bool:
+        """클라이언트가 primary에 고정되어 있는지 여부"""
+        return (
+            client_key is not None and self._pins.get(client_key) is not None
+        )
+
+    def _healthy_replicas(self) -> List[AsyncEngine]:
+        now = time.monotonic()
+        return [
+            engine
+            for engine in self.replicas
+            if self._down_until.get(engine, 0) <= now
+        ]
+
+    def candidates(
+        self, client_key: Optional[Hashable] = None
+    ) -> List[AsyncEngine]:
+        """
+        읽기 세션 후보 엔진 (우선순위 순, 마지막은 항상 primary)
+        """
+        if self.is_pinned(client_key):
+            return [self.primary]
+
+        replicas = self._healthy_replicas()
+        if replicas:
+            if self.strategy == LEAST_CONNECTIONS:
+                replicas.sort(key=_checked_out)
+            else:
+                offset = next(self._round_robin) % len(replicas)
+                replicas = replicas[offset:] + replicas[:offset]
+        return replicas + [self.primary]
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        """복제본을 일정 시간 후보에서 제외"""
+        self._down_until[engine] = time.monotonic() + self.retry_seconds
+
+    @asynccontextmanager
+    async def session(
+        self, client_key: Optional[Hashable] = None, snapshot: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        읽기 세션
+
+        복제본은 커넥션을 먼저 확보하여 연결 실패 시 다음 후보로 넘어간다.
+
+        Args:
+            client_key: read-your-writes 고정 판단용 클라이언트 키
+            snapshot: 스냅샷 트랜잭션 세션 사용 여부 (snapshot_bind 참고)
+        """
+        factories = (
+            self._snapshot_session_factories
+            if snapshot
+            else self._session_factories
+        )
+        for engine in self.candidates(client_key):
+            session = factories[engine]()
+            if engine is not self.primary:
+                try:
+                    await session.connection()
+                except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+                    logger.warning("복제본 연결 실패, 다음 후보 사용: %s", engine.url)
+                    await session.close()
+                    self.mark_down(engine)
+                    continue
+
+            try:
+                yield session
+            finally:
+                await session.close()
+            return
@@ -0,0 +1,66 @@
+"""
+JSON 응답 유틸리티
+pydantic 모델을 바로 bytes로 직렬화하여 response_model 재검증과 jsonable_encoder를 생략
+"""
+import json
+from datetime import date, datetime
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 pydantic/표준 json 직렬화 사용
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_default(value: Any) -> Any:
+    # 표준 json 경로의 datetime 직렬화 (orjson과 같은 ISO 8601 형식)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    JSON 직렬화
+
+    Args:
+        content: pydantic 모델 또는 JSON 호환 객체
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if isinstance(content, BaseModel):
+        if orjson is None:
+            return content.model_dump_json().encode()
+        content = content.model_dump()
+
+    if orjson is None:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=_json_default,
+        ).encode()
+    return orjson.dumps(content)
+
+
+class ModelJSONResponse(Response):
+    """
+    pydantic 모델 응답 (orjson 직렬화)
+
+    엔드포인트가 이미 응답 스키마로 생성한 모델을 반환할 때 사용한다.
+    Response를 직접 반환하므로 FastAPI의 response_model 재검증을 거치지 않으며,
+    response_model은 문서화 용도로만 사용된다. 이미 직렬화된 bytes도 그대로 받는다.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
@@ -2,12 +2,26 @@
 보안 관련 유틸리티
 JWT 토큰 생성, 비밀번호 해싱 등
 """
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from jose import JWTError, jwt
 import bcrypt
 
 from app.config import settings
+from app.core.cache import token_cache
+
+T = TypeVar("T")
+
+
+class PasswordHashBusyError(Exception):
+    """비밀번호 해싱 대기열 포화"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("password hash queue is full")
+        self.retry_after = retry_after
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -22,8 +36,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: 검증 결과
     """
     return bcrypt.checkpw(
-        plain_password.encode('utf-8'),
-        hashed_password.encode('utf-8')
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
@@ -37,13 +50,99 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: 해시된 비밀번호
     """
-    return bcrypt.hashpw(
-        password.encode('utf-8'),
-        bcrypt.gensalt()
-    ).decode('utf-8')
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
+        "utf-8"
+    )
+
+
+class PasswordHashPool:
+    """
+    bcrypt 전용 스레드 풀
+
+    bcrypt는 해싱 중 GIL을 해제하므로 별도 스레드에서 실행하면 이벤트 루프가 멈추지 않는다.
+    동시 실행 수(max_workers)와 대기열 길이(max_queue)를 제한하고,
+    대기열이 가득 차면 PasswordHashBusyError로 즉시 거절한다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, retry_after: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.rejected = 0
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        """실행 중 + 대기 중인 작업 수"""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        풀에서 함수 실행
+
+        Raises:
+            PasswordHashBusyError: 대기열이 가득 찬 경우
+        """
+        if self._pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHashBusyError(self.retry_after)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="bcrypt",
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 애플리케이션 전역 bcrypt 풀
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """
+    비밀번호 검증 (bcrypt 풀에서 실행)
+
+    Raises:
+        PasswordHashBusyError: 대기열이 가득 찬 경우
+    """
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    비밀번호 해싱 (bcrypt 풀에서 실행)
+
+    Raises:
+        PasswordHashBusyError: 대기열이 가득 찬 경우
+    """
+    return await password_hash_pool.run(get_password_hash, password)
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+def create_access_token(
+    data: dict, expires_delta: Optional[timedelta] = None
+) -> str:
     """
     JWT 액세스 토큰 생성
 
@@ -59,10 +158,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.utcnow() + timedelta(
+            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(
+        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    )
 
     return encoded_jwt
 
@@ -71,14 +174,26 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     JWT 토큰 디코딩
 
+    이미 검증된 토큰은 만료 시각까지 캐시하여 서명 검증을 생략한다.
+
     Args:
         token: JWT 토큰
 
     Returns:
         Optional[dict]: 디코딩된 데이터 또는 None
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    payload = token_cache.get(token)
+    if payload is not None:
         return payload
+
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(token, payload, ttl=exp - time.time())
+    return payload
@@ -0,0 +1,288 @@
+"""
+인기 게시글 (trending) 집계
+상세 조회 이벤트로 시간 감쇠 점수를 메모리에서 유지하고 상위 K개를 제공
+"""
+import asyncio
+import heapq
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.view_counter import view_counter
+from app.database import replica_router
+from app.models.board import Board
+from app.repositories.board import BoardRepository, make_preview
+
+logger = logging.getLogger(__name__)
+
+# 목록 아이템 스냅샷 필드 (BoardListItem)
+ITEM_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "view_count",
+    "author_name",
+    "created_at",
+)
+
+# 지수가 이 값을 넘으면 기준 시각을 옮겨 점수를 다시 맞춤 (float 범위 보호)
+_MAX_EXPONENT = 50.0
+
+
+def _timestamp(value: datetime) -> float:
+    # created_at은 timezone 없는 UTC
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class TrendingBoards:
+    """
+    시간 감쇠 조회 점수 상위 K 집계기
+
+    - 조회 1회의 가치는 half_life마다 절반으로 줄어든다 (지수 감쇠)
+    - 점수는 기준 시각(epoch)에서 본 값(조회마다 exp(rate * (t - epoch)) 누적)으로 저장하여
+      시간이 흘러도 점수끼리의 순서가 바뀌지 않으므로 전체 재계산이 필요 없다
+    - 점수는 dict, 최소 점수 제거용으로 min-heap을 두며 heap의 낡은 항목은 꺼낼 때 건너뛴다
+    - capacity를 넘으면 최소 점수 게시글을 제거하여 메모리 사용량 일정
+    - 목록 아이템 스냅샷을 함께 보관하여 상위 목록은 DB 조회 없이 응답
+    """
+
+    def __init__(
+        self,
+        capacity: int = settings.TRENDING_CAPACITY,
+        half_life: float = settings.TRENDING_HALF_LIFE,
+        session_factory: Callable[
+            [], AsyncContextManager[AsyncSession]
+        ] = replica_router.session,
+        timer: Callable[[], float] = time.time,
+    ):
+        self.capacity = capacity
+        self.session_factory = session_factory
+        self.rate = math.log(2) / half_life
+        self.timer = timer
+        self._epoch = timer()
+        self._scores: Dict[int, float] = {}
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._heap: List[Tuple[float, int]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, board_id: int) -> bool:
+        return board_id in self._scores
+
+    def add(
+        self,
+        board_id: int,
+        item: Optional[Dict[str, Any]] = None,
+        views: float = 1.0,
+        at: Optional[float] = None,
+    ) -> None:
+        """
+        조회 반영
+
+        Args:
+            board_id: 게시글 ID
+            item: 목록 아이템 스냅샷 (ITEM_FIELDS, 주어지면 교체)
+            views: 조회 수
+            at: 조회 시각 (기본값: 현재)
+        """
+        exponent = self.rate * (
+            (self.timer() if at is None else at) - self._epoch
+        )
+        if exponent > _MAX_EXPONENT:
+            self._rebase()
+            exponent = self.rate * (
+                (self.timer() if at is None else at) - self._epoch
+            )
+        gain = views * math.exp(exponent)
+
+        score = self._scores.get(board_id)
+        if score is None:
+            if len(self._scores) >= self.capacity:
+                # 가득 찬 경우 최소 점수보다 높을 때만 교체
+                if not self._heap or gain <= self._peek_min():
+                    return
+                self._evict_min()
+            score = 0.0
+
+        score += gain
+        self._scores[board_id] = score
+        heapq.heappush(self._heap, (score, board_id))
+        if item is not None:
+            self._items[board_id] = item
+        if len(self._heap) > 2 * self.capacity + 64:
+            self._compact()
+
+    def update_board(self, board: Union[Board, Row]) -> None:
+        """집계 중인 게시글의 제목/미리보기 갱신 (수정 시, 게시글 또는 수정 RETURNING 행)"""
+        board_id = cast(int, board.id)
+        item = self._items.get(board_id)
+        if item is not None:
+            self._items[board_id] = {
+                **item,
+                "title": board.title,
+                "content": make_preview(cast(str, board.content)),
+            }
+
+    def discard(self, board_id: int) -> None:
+        """게시글 제외 (삭제 시, heap 항목은 꺼낼 때 건너뜀)"""
+        self._scores.pop(board_id, None)
+        self._items.pop(board_id, None)
+
+    def top(self, k: int) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        상위 k개
+
+        Returns:
+            (목록 아이템 스냅샷, 현재 시각 기준 감쇠 점수) 목록 (점수 내림차순)
+        """
+        decay = math.exp(-self.rate * (self.timer() - self._epoch))
+        ranked = heapq.nlargest(
+            k,
+            (
+                (board_id, score)
+                for board_id, score in self._scores.items()
+                if board_id in self._items
+            ),
+            key=itemgetter(1),
+        )
+        return [
+            (self._items[board_id], score * decay)
+            for board_id, score in ranked
+        ]
+
+    def tracked_ids(self) -> List[int]:
+        """집계 중인 게시글 ID"""
+        return list(self._scores)
+
+    def clear(self) -> None:
+        self._scores.clear()
+        self._items.clear()
+        self._heap.clear()
+        self._epoch = self.timer()
+
+    def _peek_min(self) -> float:
+        self._drop_stale()
+        return self._heap[0][0]
+
+    def _evict_min(self) -> None:
+        self._drop_stale()
+        _, board_id = heapq.heappop(self._heap)
+        self._scores.pop(board_id, None)
+        self._items.pop(board_id, None)
+
+    def _drop_stale(self) -> None:
+        # 점수가 갱신되었거나 제외된 게시글의 heap 항목 제거
+        heap = self._heap
+        while heap and self._scores.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [
+            (score, board_id) for board_id, score in self._scores.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _rebase(self) -> None:
+        # 기준 시각을 현재로 옮기고 저장된 점수를 같은 비율로 축소
+        now = self.timer()
+        factor = math.exp(-self.rate * (now - self._epoch))
+        self._epoch = now
+        self._scores = {
+            board_id: score * factor
+            for board_id, score in self._scores.items()
+        }
+        self._compact()
+
+    async def reconcile(self) -> None:
+        """
+        DB와 동기화
+
+        - 비어 있으면 (시작 직후) 최근 seed_hours 안에 작성된 게시글을 조회수순으로 채움
+          (DB에는 조회 시각이 없으므로 조회가 작성 시각에 일어난 것으로 간주)
+        - 집계 중인 게시글은 스냅샷(제목, 조회수 등)을 갱신하고 삭제된 게시글은 제외
+        """
+        async with self.session_factory() as session:
+            repository = BoardRepository(session)
+            if not self._scores:
+                since = datetime.utcnow() - timedelta(
+                    hours=settings.TRENDING_SEED_HOURS
+                )
+                rows = await repository.get_popular_since(since, self.capacity)
+                for row in rows:
+                    if row.view_count > 0:
+                        self.add(
+                            row.id,
+                            self._snapshot(row),
+                            row.view_count,
+                            _timestamp(row.created_at),
+                        )
+                return
+
+            ids = self.tracked_ids()
+            current = {
+                row.id: row for row in await repository.get_list_by_ids(ids)
+            }
+
+        for board_id in ids:
+            latest = current.get(board_id)
+            if latest is None:
+                self.discard(board_id)
+            elif board_id in self._scores:
+                self._items[board_id] = self._snapshot(latest)
+
+    @staticmethod
+    def _snapshot(row: Any) -> Dict[str, Any]:
+        # 저장된 조회수 + 아직 반영되지 않은 증가분
+        item = {field: getattr(row, field) for field in ITEM_FIELDS}
+        item["view_count"] += view_counter.pending(row.id)
+        return item
+
+    async def _run(self, interval: float) -> None:
+        """백그라운드 동기화 루프"""
+        while True:
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("인기 게시글 동기화 실패")
+            await asyncio.sleep(interval)
+
+    def start(
+        self, interval: float = settings.TRENDING_RECONCILE_INTERVAL
+    ) -> None:
+        """백그라운드 동기화 태스크 시작"""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        """백그라운드 태스크 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 애플리케이션 전역 인기 게시글 집계기
+trending_boards = TrendingBoards()
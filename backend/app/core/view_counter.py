@@ -0,0 +1,136 @@
+"""
+조회수 write-behind 버퍼
+상세 조회 시 조회수를 메모리에 누적하고 주기적으로 일괄 반영
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.board import BoardRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    조회수 증가분 집계기
+
+    - increment(): 메모리에만 누적 (DB 접근 없음)
+    - flush(): 누적분을 일괄 UPDATE(executemany)로 반영
+    - 백그라운드 태스크가 주기(interval) 또는 누적 건수(threshold) 도달 시 flush
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        flush_interval: float = settings.VIEW_COUNT_FLUSH_INTERVAL,
+        flush_threshold: int = settings.VIEW_COUNT_FLUSH_THRESHOLD,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[int, int] = {}
+        self._flushing: Dict[int, int] = {}
+        self._total_pending = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def increment(self, board_id: int, n: int = 1) -> int:
+        """
+        조회수 증가분 누적
+
+        Returns:
+            int: 아직 DB에 반영되지 않은 해당 게시글의 증가분
+        """
+        self._pending[board_id] = self._pending.get(board_id, 0) + n
+        self._total_pending += n
+        if (
+            self._total_pending >= self.flush_threshold
+            and self._wakeup is not None
+        ):
+            self._wakeup.set()
+        return self.pending(board_id)
+
+    def pending(self, board_id: int) -> int:
+        """DB에 반영되지 않은 증가분 (반영 중인 값 포함)"""
+        return self._pending.get(board_id, 0) + self._flushing.get(board_id, 0)
+
+    @property
+    def pending_boards(self) -> int:
+        """미반영 증가분이 있는 게시글 수"""
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """
+        누적된 증가분을 DB에 반영
+
+        Returns:
+            int: 반영된 게시글 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            self._total_pending = 0
+            self._flushing = batch
+
+            try:
+                async with self.session_factory() as session:
+                    await BoardRepository(session).increment_view_counts(batch)
+                    await session.commit()
+            except BaseException:
+                # 실패(취소 포함)한 증가분은 다음 flush에서 재시도
+                for board_id, n in batch.items():
+                    self._pending[board_id] = (
+                        self._pending.get(board_id, 0) + n
+                    )
+                    self._total_pending += n
+                raise
+            finally:
+                self._flushing = {}
+
+            return len(batch)
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        """백그라운드 flush 루프 (wakeup: 임계치 도달 시 즉시 flush 신호)"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    wakeup.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("조회수 flush 실패")
+
+    def start(self) -> None:
+        """백그라운드 flush 태스크 시작"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(self._wakeup))
+
+    async def stop(self) -> None:
+        """백그라운드 태스크 종료 후 남은 증가분 flush"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+        await self.flush()
+
+
+# 애플리케이션 전역 조회수 버퍼
+view_counter = ViewCountBuffer()
@@ -1,17 +1,76 @@
 """
 데이터베이스 연결 설정
 """
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Hashable, Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
+from app.core.db_pool import InstrumentedQueuePool
+from app.core.query_stats import instrument_engine
+from app.core.replicas import ReplicaRouter
+
+
+def build_engine(url: str) -> AsyncEngine:
+    """
+    설정 기반 비동기 엔진 생성
+
+    Args:
+        url: 데이터베이스 URL
+    """
+    db_url = make_url(url)
+    connect_args: Dict[str, Any] = {}
+
+    if (
+        db_url.get_backend_name() == "postgresql"
+        and db_url.get_driver_name() == "asyncpg"
+    ):
+        db_url = db_url.update_query_dict(
+            {
+                "prepared_statement_cache_size": str(
+                    settings.DB_STATEMENT_CACHE_SIZE
+                )
+            }
+        )
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            }
+
+    engine = create_async_engine(
+        db_url,
+        echo=settings.DB_ECHO,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine)
+    return engine
+
 
 # 비동기 엔진 생성
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
+engine = build_engine(settings.DATABASE_URL)
+
+# 읽기 복제본 라우터
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=[build_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+    strategy=settings.REPLICA_STRATEGY,
+    pin_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    retry_seconds=settings.REPLICA_RETRY_SECONDS,
+    read_only_transactions=settings.DB_READ_ONLY_TRANSACTIONS,
 )
 
 # 비동기 세션 팩토리
@@ -27,19 +86,48 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+@asynccontextmanager
+async def unit_of_work(
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+) -> AsyncIterator[AsyncSession]:
     """
-    데이터베이스 세션 의존성
+    쓰기 세션 (요청당 commit 1회)
 
-    Yields:
-        AsyncSession: 데이터베이스 세션
+    엔드포인트가 응답 전에 commit한 경우 다시 commit하지 않고,
+    열린 트랜잭션이 남아 있을 때만 종료 시 commit한다.
     """
-    async with AsyncSessionLocal() as session:
+    async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    데이터베이스 세션 의존성 (쓰기용)
+
+    Yields:
+        AsyncSession: 데이터베이스 세션
+    """
+    async with unit_of_work() as session:
+        yield session
+
+
+async def get_read_db(
+    client_key: Optional[Hashable] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 데이터베이스 세션 의존성 (복제본 우선)
+
+    Args:
+        client_key: read-your-writes 고정 판단용 클라이언트 키 (사용자 ID)
+
+    Yields:
+        AsyncSession: 복제본 또는 primary 세션
+    """
+    async with replica_router.session(client_key) as session:
+        yield session
@@ -1,55 +1,196 @@
 """
 FastAPI 메인 애플리케이션
 """
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1.api import api_router
 from app.config import settings
-
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    docs_url="/docs",
-    redoc_url="/redoc",
+from app.core.cache_invalidation import cache_invalidation_listener
+from app.core.compression import CompressionMiddleware
+from app.core.db_pool import pool_status, prewarm_pool
+from app.core.metrics import (
+    MetricsMiddleware,
+    register_runtime_metrics,
+    registry,
 )
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.security import PasswordHashBusyError, password_hash_pool
+from app.core.startup import StartupReport, warm_queries, warm_security
+from app.core.trending import trending_boards
+from app.core.view_counter import view_counter
+from app.database import engine, replica_router
 
-# CORS 설정 (개발 환경)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,  # credentials=False일 때만 allow_origins=["*"] 사용 가능
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 시작/종료 훅
+
+    시작 단계(커넥션 연결, 쿼리/JWT warm-up, 백그라운드 작업 시작)별 소요 시간을
+    app.state.startup 에 기록하고 로그로 남긴다.
+    """
+    report: StartupReport = app.state.startup
+    engines = (engine, *replica_router.replicas)
+    connections = min(settings.DB_POOL_PREWARM, settings.DB_POOL_SIZE)
+
+    with report.phase("db_connect"):
+        await asyncio.gather(*(prewarm_pool(e, connections) for e in engines))
+    if settings.DB_WARM_STATEMENTS:
+        # 미리 열어 둔 유휴 커넥션마다 주요 쿼리 prepare
+        with report.phase("statement_warmup"):
+            await asyncio.gather(
+                *(prewarm_pool(e, connections, warm_queries) for e in engines)
+            )
+    with report.phase("security_warmup"):
+        warm_security()
+    with report.phase("background_workers"):
+        view_counter.start()
+        trending_boards.start()
+        cache_invalidation_listener.start()
+    logger.info("시작 준비 완료: %s", report.summary())
+
+    yield
 
+    await cache_invalidation_listener.stop()
+    await trending_boards.stop()
+    # 종료 시 미반영 조회수 flush
+    await view_counter.stop()
+    password_hash_pool.shutdown()
+    for replica in replica_router.replicas:
+        await replica.dispose()
+    await engine.dispose()
 
-@app.get("/")
+
+async def password_hash_busy_handler(
+    request: Request, exc: PasswordHashBusyError
+):
+    """로그인 폭주로 bcrypt 대기열이 가득 찬 경우 즉시 503 반환"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "요청이 많아 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+# 헬스체크 라우터
+health_router = APIRouter()
+
+
+@health_router.get("/")
 async def root():
     """헬스체크 엔드포인트"""
     return {
         "message": "Infolink API",
         "version": settings.VERSION,
-        "status": "running"
+        "status": "running",
     }
 
 
-@app.get("/health")
+@health_router.get("/health")
 async def health_check():
     """헬스체크"""
     return {"status": "healthy"}
 
 
-# API 라우터 등록
-app.include_router(api_router, prefix=settings.API_V1_STR)
+@health_router.get("/health/db")
+async def db_pool_status():
+    """DB 커넥션 풀 상태 (사용 중/유휴/overflow 커넥션, 체크아웃 대기 시간)"""
+    status = pool_status(engine)
+    if replica_router.replicas:
+        status["replicas"] = [
+            {
+                "url": replica.url.render_as_string(hide_password=True),
+                **pool_status(replica),
+            }
+            for replica in replica_router.replicas
+        ]
+    return status
+
+
+async def metrics():
+    """Prometheus 메트릭 (text exposition format)"""
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def create_app() -> FastAPI:
+    """
+    애플리케이션 생성
+
+    미들웨어, 예외 처리기, 라우터를 등록한다. 엔진/캐시/백그라운드 작업은 모듈 전역 객체를 사용하며
+    커넥션 연결과 백그라운드 작업 시작은 lifespan에서 수행한다.
+    """
+    report = StartupReport()
+    with report.phase("create_app"):
+        app = FastAPI(
+            title=settings.PROJECT_NAME,
+            version=settings.VERSION,
+            openapi_url=f"{settings.API_V1_STR}/openapi.json",
+            docs_url="/docs",
+            redoc_url="/redoc",
+            lifespan=lifespan,
+        )
+        app.state.startup = report
+
+        # 요청별 SQL 계측 (Server-Timing, 구조화 로그)
+        app.add_middleware(QueryStatsMiddleware)
+
+        # 응답 압축
+        if settings.COMPRESSION_ENABLED:
+            app.add_middleware(CompressionMiddleware)
+
+        # Prometheus 메트릭 (요청 수/처리 시간/처리 중 요청 수, 시작 단계별 소요 시간)
+        if settings.METRICS_ENABLED:
+            app.add_middleware(MetricsMiddleware)
+            register_runtime_metrics(engine)
+            registry.callback(
+                "app_startup_seconds",
+                "시작 단계별 소요 시간",
+                "gauge",
+                ("phase",),
+                lambda: [
+                    ((name,), seconds)
+                    for name, seconds in report.phases.items()
+                ],
+            )
+            app.add_api_route(
+                settings.METRICS_PATH, metrics, include_in_schema=False
+            )
+
+        # CORS 설정 (개발 환경)
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            # credentials=False일 때만 allow_origins=["*"] 사용 가능
+            allow_credentials=False,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+        app.add_exception_handler(
+            PasswordHashBusyError, password_hash_busy_handler
+        )
+
+        app.include_router(health_router)
+        # API 라우터 등록
+        app.include_router(api_router, prefix=settings.API_V1_STR)
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
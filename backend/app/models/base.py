@@ -16,9 +16,15 @@ class BaseModel(Base):
     - updated_at: 수정 시각
     - deleted_at: 삭제 시각 (Soft Delete)
     """
+
     __abstract__ = True
 
     id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
     deleted_at = Column(DateTime, nullable=True)
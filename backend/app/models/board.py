@@ -1,11 +1,73 @@
 """
 Board 모델 (게시판)
 """
-from sqlalchemy import Column, String, Text, Integer, BigInteger, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    Computed,
+    Index,
+    String,
+    Text,
+    Integer,
+    BigInteger,
+    ForeignKey,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import MappedSQLExpression, deferred, relationship
 
 from app.models.base import BaseModel
 
+# 검색 색인 시 원형을 함께 넣을 조사
+SEARCH_PARTICLES = (
+    "으로",
+    "에서",
+    "에게",
+    "까지",
+    "부터",
+    "처럼",
+    "보다",
+    "이랑",
+    "하고",
+    "을",
+    "를",
+    "이",
+    "가",
+    "은",
+    "는",
+    "와",
+    "과",
+    "도",
+    "에",
+    "의",
+    "로",
+    "만",
+    "랑",
+)
+
+
+def _with_stems(column: str) -> str:
+    """
+    조사가 붙은 단어 뒤에 원형을 덧붙이는 SQL 식 ('가방을 팝니다' → '가방을 가방 팝니다')
+
+    단어 부분을 최소 일치(+?)로 잡아 가장 긴 조사가 떨어지도록 한다 ('집으로' → '집').
+    """
+    particles = "|".join(SEARCH_PARTICLES)
+    return (
+        f"regexp_replace({column}, "
+        f"'([^\\s[:punct:]]+?)({particles})(?=[\\s[:punct:]]|$)', "
+        "'\\1\\2 \\1', 'g')"
+    )
+
+
+def _weighted_vector(column: str, weight: str) -> str:
+    """원형을 덧붙인 컬럼의 tsvector에 가중치(A~D)를 준 SQL 식"""
+    return (
+        f"setweight(to_tsvector('simple'::regconfig, {_with_stems(column)}), "
+        f"'{weight}')"
+    )
+
 
 class Board(BaseModel):
     """
@@ -16,13 +78,60 @@ class Board(BaseModel):
         title: 게시글 제목 (최대 200자)
         content: 게시글 내용 (최대 10,000자)
         view_count: 조회수
+        search_vector: 검색용 tsvector (제목 가중치 A, 내용 B, DB에서 생성)
     """
+
     __tablename__ = "boards"
+    __table_args__ = (
+        # 작성자별 목록 (최신순)
+        Index(
+            "ix_boards_user_id_id",
+            "user_id",
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # 목록 정렬 keyset 페이지네이션 (조회수순, 작성 시각순)
+        Index(
+            "ix_boards_view_count_id",
+            "view_count",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_boards_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # 전문 검색 (삭제되지 않은 게시글만)
+        Index(
+            "ix_boards_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+    # INSERT/UPDATE 시 생성 컬럼(search_vector)을 RETURNING으로 가져오지 않음
+    __mapper_args__ = {"eager_defaults": False}
 
-    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(
+        BigInteger, ForeignKey("users.id"), nullable=False, index=True
+    )
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
     view_count = Column(Integer, nullable=False, default=0)
+    # 한국어 형태소 분석기 없이 공백 단위 토큰화('simple'), 조사를 뗀 원형도 함께 색인하여
+    # 검색은 접두어가 아닌 정확한 단어 일치(GIN 부분 일치보다 빠름)로 처리
+    search_vector: "MappedSQLExpression[Any]" = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"{_weighted_vector('title', 'A')} || "
+                f"{_weighted_vector('content', 'B')}",
+                persisted=True,
+            ),
+        )
+    )
 
     # 관계 설정
     user = relationship("User", backref="boards")
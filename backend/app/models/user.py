@@ -17,6 +17,7 @@ class User(BaseModel):
         is_active: 활성화 여부
         is_admin: 관리자 여부
     """
+
     __tablename__ = "users"
 
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -2,15 +2,129 @@
 Board Repository
 데이터베이스 액세스 레이어
 """
+import re
 from datetime import datetime
-from typing import Optional, List, Tuple
-from sqlalchemy import select
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Tuple
+from sqlalchemy import (
+    Column,
+    Float,
+    bindparam,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import ColumnElement
 
 from app.models.board import Board
+from app.models.user import User
 from app.schemas.board import BoardCreate, BoardUpdate
 
+# 목록 미리보기 길이
+PREVIEW_LENGTH = 100
+
+_boards = Board.__table__
+
+# 목록 미리보기 (100자 초과 시 잘라서 "..." 추가, DB에서 계산)
+_preview = case(
+    (
+        func.char_length(Board.content) > PREVIEW_LENGTH,
+        func.concat(func.left(Board.content, PREVIEW_LENGTH), "..."),
+    ),
+    else_=Board.content,
+)
+
+
+def make_preview(content: str) -> str:
+    """목록 미리보기 (DB의 _preview와 같은 규칙, 이미 로드한 본문용)"""
+    if len(content) > PREVIEW_LENGTH:
+        return content[:PREVIEW_LENGTH] + "..."
+    return content
+
+
+# 목록 조회용 컬럼 (본문 전체와 ORM 엔티티를 로드하지 않음)
+_list_columns = (
+    Board.id,
+    Board.title,
+    _preview.label("content"),
+    Board.view_count,
+    User.username.label("author_name"),
+    Board.created_at,
+    Board.updated_at,
+)
+
+# 목록 정렬 → (keyset 컬럼, 내림차순 여부), 각각 (컬럼, id) 복합 인덱스 사용
+LIST_SORTS: Dict[str, Tuple[Tuple[Column[Any], ...], bool]] = {
+    "views": ((Board.view_count, Board.id), True),
+    "created_desc": ((Board.created_at, Board.id), True),
+    "created_asc": ((Board.created_at, Board.id), False),
+}
+
+# 검색어 토큰 (한글/영문/숫자)
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def build_tsquery(q: str, max_tokens: int = 8) -> Optional[str]:
+    """
+    검색어 → to_tsquery 입력 (토큰별 단어 일치, AND 결합)
+
+    색인에 조사를 뗀 원형도 들어 있으므로 '가방' 검색 시 '가방을', '가방이'가 포함된 게시글도 일치한다.
+
+    Returns:
+        Optional[str]: 예) "'가방' & '가죽'" (토큰이 없으면 None)
+    """
+    tokens = _SEARCH_TOKEN.findall(q.lower())[:max_tokens]
+    if not tokens:
+        return None
+    return " & ".join(f"'{token}'" for token in tokens)
+
+
+# 내보내기용 컬럼 (본문 전체 포함)
+EXPORT_COLUMNS: Tuple[ColumnElement[Any], ...] = (
+    Board.id,
+    Board.user_id,
+    User.username.label("author_name"),
+    Board.title,
+    Board.content,
+    Board.view_count,
+    Board.created_at,
+    Board.updated_at,
+)
+
+# 수정 결과 컬럼 (작성자 이름은 요청한 사용자 = 작성자)
+_owned_columns = (
+    _boards.c.id,
+    _boards.c.user_id,
+    _boards.c.title,
+    _boards.c.content,
+    _boards.c.view_count,
+    _boards.c.created_at,
+    _boards.c.updated_at,
+)
+
+# 조회수 일괄 증가 (executemany)
+_increment_view_count_stmt = (
+    update(_boards)
+    .where(_boards.c.id == bindparam("b_id"))
+    .values(
+        view_count=_boards.c.view_count + bindparam("b_n"),
+        updated_at=_boards.c.updated_at,
+    )
+)
+
+# 일괄 생성 (insertmanyvalues: 다중 행 INSERT ... RETURNING, 1000행 단위 배치)
+_bulk_insert_stmt = insert(_boards).returning(
+    _boards.c.id, _boards.c.created_at, sort_by_parameter_order=True
+)
+
 
 class BoardRepository:
     """Board 데이터 액세스 레이어"""
@@ -26,10 +140,36 @@ class BoardRepository:
             content=data.content,
         )
         self.db.add(board)
+        # id는 INSERT ... RETURNING, 나머지 기본값은 Python에서 채워지므로 refresh 불필요
         await self.db.flush()
-        await self.db.refresh(board)
         return board
 
+    async def bulk_create(
+        self, user_id: int, items: List[BoardCreate]
+    ) -> List[Row]:
+        """
+        게시글 일괄 생성
+
+        ORM 객체를 만들지 않고 다중 행 INSERT ... RETURNING으로 삽입한다.
+
+        Returns:
+            items 순서대로 (id, created_at) 행 목록
+        """
+        if not items:
+            return []
+        result = await self.db.execute(
+            _bulk_insert_stmt,
+            [
+                {
+                    "user_id": user_id,
+                    "title": item.title,
+                    "content": item.content,
+                }
+                for item in items
+            ],
+        )
+        return list(result.all())
+
     async def get_by_id(self, board_id: int) -> Optional[Board]:
         """ID로 게시글 조회 (작성자 정보 포함)"""
         result = await self.db.execute(
@@ -40,31 +180,41 @@ class BoardRepository:
         return result.scalar_one_or_none()
 
     async def get_list(
-        self, cursor: Optional[int] = None, limit: int = 20
-    ) -> Tuple[List[Board], bool]:
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        user_id: Optional[int] = None,
+    ) -> Tuple[List[Row], bool]:
         """
         게시글 목록 조회 (무한스크롤용 cursor 기반)
 
+        필요한 컬럼만 조회하며, 미리보기(content)는 DB에서 잘라서 가져온다.
+        작성자 목록은 (user_id, id DESC) 부분 인덱스를 사용한다.
+
         Args:
             cursor: 마지막으로 본 게시글 ID (이보다 작은 ID 조회)
             limit: 조회할 개수
+            user_id: 작성자 ID (None이면 전체)
 
         Returns:
-            (게시글 목록, 다음 페이지 존재 여부)
+            (id, title, content(미리보기), view_count, author_name,
+             created_at, updated_at 행 목록, 다음 페이지 존재 여부)
         """
         query = (
-            select(Board)
-            .options(joinedload(Board.user))
+            select(*_list_columns)
+            .join(User, Board.user_id == User.id)
             .where(Board.deleted_at.is_(None))
             .order_by(Board.id.desc())
             .limit(limit + 1)  # 1개 더 조회하여 has_more 판단
         )
 
-        if cursor:
+        if cursor is not None:
             query = query.where(Board.id < cursor)
+        if user_id is not None:
+            query = query.where(Board.user_id == user_id)
 
         result = await self.db.execute(query)
-        boards = list(result.scalars().all())
+        boards = list(result.all())
 
         # limit+1개를 조회했으므로, limit보다 많으면 다음 페이지 있음
         has_more = len(boards) > limit
@@ -73,21 +223,286 @@ class BoardRepository:
 
         return boards, has_more
 
-    async def update(self, board: Board, data: BoardUpdate) -> Board:
-        """게시글 수정"""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(board, field, value)
-        await self.db.flush()
-        await self.db.refresh(board)
-        return board
+    async def get_list_by_ids(self, ids: Sequence[int]) -> List[Row]:
+        """ID 목록으로 목록 컬럼 조회 (삭제된 게시글 제외, 순서 보장 안 함)"""
+        if not ids:
+            return []
+        result = await self.db.execute(
+            select(*_list_columns)
+            .join(User, Board.user_id == User.id)
+            .where(Board.id.in_(ids), Board.deleted_at.is_(None))
+        )
+        return list(result.all())
 
-    async def soft_delete(self, board: Board) -> None:
-        """게시글 soft delete"""
-        board.deleted_at = datetime.utcnow()
-        await self.db.flush()
+    async def get_popular_since(
+        self, since: datetime, limit: int
+    ) -> List[Row]:
+        """since 이후 작성된 게시글 중 조회수 상위 limit건 (목록 컬럼)"""
+        result = await self.db.execute(
+            select(*_list_columns)
+            .join(User, Board.user_id == User.id)
+            .where(Board.created_at >= since, Board.deleted_at.is_(None))
+            .order_by(Board.view_count.desc(), Board.id.desc())
+            .limit(limit)
+        )
+        return list(result.all())
 
-    async def increment_view_count(self, board: Board) -> None:
-        """조회수 증가"""
-        board.view_count += 1
-        await self.db.flush()
+    async def get_sorted_list(
+        self,
+        sort: str,
+        cursor: Optional[Sequence[Any]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Row], bool]:
+        """
+        정렬 기준별 게시글 목록 조회 (복합 keyset 페이지네이션)
+
+        (정렬 컬럼, id) 행 비교로 다음 페이지를 찾으므로 OFFSET 없이 깊은 페이지도 O(limit)이다.
+
+        Args:
+            sort: LIST_SORTS 키 (views | created_desc | created_asc)
+            cursor: 이전 페이지 마지막 행의 (정렬 컬럼 값, id)
+            limit: 조회할 개수
+
+        Returns:
+            (목록 컬럼 행 목록, 다음 페이지 존재 여부)
+        """
+        columns, descending = LIST_SORTS[sort]
+        query = (
+            select(*_list_columns)
+            .join(User, Board.user_id == User.id)
+            .where(Board.deleted_at.is_(None))
+            .order_by(
+                *(
+                    column.desc() if descending else column.asc()
+                    for column in columns
+                )
+            )
+            .limit(limit + 1)  # 1개 더 조회하여 has_more 판단
+        )
+
+        if cursor is not None:
+            keyset, position = tuple_(*columns), tuple_(*cursor)
+            query = query.where(
+                keyset < position if descending else keyset > position
+            )
+
+        result = await self.db.execute(query)
+        boards = list(result.all())
+
+        has_more = len(boards) > limit
+        if has_more:
+            boards = boards[:limit]
+
+        return boards, has_more
+
+    async def get_max_id(self) -> Optional[int]:
+        """가장 최근 게시글 ID (삭제 포함, PK 인덱스 끝 조회)"""
+        result = await self.db.execute(select(func.max(Board.id)))
+        return result.scalar()
+
+    async def search(
+        self,
+        tsquery: str,
+        cursor: Optional[Tuple[float, int]] = None,
+        limit: int = 20,
+        max_candidates: int = 500,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+    ) -> Tuple[List[Row], bool, int]:
+        """
+        게시글 전문 검색 (GIN 인덱스, 관련도순)
+
+        일치하는 게시글 중 최신 max_candidates건(후보 구간)만 관련도를 계산하여
+        흔한 단어를 검색해도 비용이 일정하다.
+        min_id를 주면 그보다 큰 ID 범위(최근 게시글)만 검색하여 읽는 힙 페이지 수를 제한한다.
+        max_id를 주면 그보다 작은 ID 중 최신 후보로 다음(더 오래된) 후보 구간을 만든다.
+        관련도(ts_rank_cd, 제목 일치 가중) 내림차순, 같으면 최신순.
+        (관련도, ID) keyset 페이지네이션.
+
+        Args:
+            tsquery: build_tsquery 결과
+            cursor: 이전 페이지 마지막 행의 (rank, id)
+            limit: 조회할 개수
+            max_candidates: 관련도를 계산할 최대 후보 수
+            min_id: 검색 범위 ID 하한 (미포함, None이면 전체)
+            max_id: 검색 범위 ID 상한 (미포함, None이면 전체)
+
+        Returns:
+            (목록 컬럼 + rank, candidates, oldest(후보 구간의 가장 작은 ID) 행 목록,
+             다음 페이지 존재 여부, 범위 안 후보 수)
+        """
+        query_vector = func.to_tsquery(cast("simple", REGCONFIG), tsquery)
+
+        candidate_query = select(
+            Board.id,
+            cast(
+                func.ts_rank_cd(Board.search_vector, query_vector), Float
+            ).label("rank"),
+        ).where(
+            Board.deleted_at.is_(None),
+            Board.search_vector.op("@@")(query_vector),
+        )
+        if min_id is not None:
+            candidate_query = candidate_query.where(Board.id > min_id)
+        if max_id is not None:
+            candidate_query = candidate_query.where(Board.id < max_id)
+        candidates = (
+            candidate_query.order_by(Board.id.desc())
+            .limit(max_candidates)
+            .subquery("candidates")
+        )
+
+        # 후보 수, 후보 구간의 가장 작은 ID는 커서 조건 적용 전에 계산
+        counted = select(
+            candidates.c.id,
+            candidates.c.rank,
+            func.count().over().label("candidates"),
+            func.min(candidates.c.id).over().label("oldest"),
+        ).subquery("counted")
+
+        page_query = select(
+            counted.c.id,
+            counted.c.rank,
+            counted.c.candidates,
+            counted.c.oldest,
+        )
+        if cursor is not None:
+            page_query = page_query.where(
+                tuple_(counted.c.rank, counted.c.id)
+                < tuple_(*map(literal, cursor))
+            )
+        page = (
+            page_query.order_by(counted.c.rank.desc(), counted.c.id.desc())
+            .limit(limit + 1)  # 1개 더 조회하여 has_more 판단
+            .subquery("page")
+        )
+
+        # 미리보기 등 목록 컬럼은 페이지에 포함된 행만 계산
+        query = (
+            select(
+                *_list_columns, page.c.rank, page.c.candidates, page.c.oldest
+            )
+            .join(page, Board.id == page.c.id)
+            .join(User, Board.user_id == User.id)
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+
+        result = await self.db.execute(query)
+        boards = list(result.all())
+        found = boards[0].candidates if boards else 0
+
+        has_more = len(boards) > limit
+        if has_more:
+            boards = boards[:limit]
+
+        return boards, has_more, found
+
+    async def stream_for_export(
+        self,
+        user_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        내보내기용 게시글 스트리밍 (ID 오름차순)
+
+        서버 사이드 커서(yield_per)로 batch_size건씩 가져오므로
+        테이블 크기와 관계없이 메모리 사용량이 일정하다. 트랜잭션 안에서 호출해야 한다.
+
+        Args:
+            user_id: 작성자 ID 필터
+            created_from: 작성 시각 하한 (포함)
+            created_to: 작성 시각 상한 (미포함)
+            batch_size: 배치 크기
+
+        Yields:
+            EXPORT_COLUMNS 행 배치
+        """
+        query = (
+            select(*EXPORT_COLUMNS)
+            .join(User, Board.user_id == User.id)
+            .where(Board.deleted_at.is_(None))
+            .order_by(Board.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if user_id is not None:
+            query = query.where(Board.user_id == user_id)
+        if created_from is not None:
+            query = query.where(Board.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(Board.created_at < created_to)
+
+        result = await self.db.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+    async def update_owned(
+        self, board_id: int, user_id: int, data: BoardUpdate
+    ) -> Optional[Row]:
+        """
+        작성자 확인 + 게시글 수정 (UPDATE ... RETURNING 1회)
+
+        변경할 필드가 없으면 updated_at을 그대로 두고 현재 값만 반환한다.
+
+        Returns:
+            수정된 행 (_owned_columns), 없거나 작성자가 아니면 None
+        """
+        values = data.model_dump(exclude_unset=True) or {
+            "updated_at": _boards.c.updated_at
+        }
+        result = await self.db.execute(
+            update(_boards)
+            .where(
+                _boards.c.id == board_id,
+                _boards.c.user_id == user_id,
+                _boards.c.deleted_at.is_(None),
+            )
+            .values(**values)
+            .returning(*_owned_columns)
+        )
+        return result.first()
+
+    async def soft_delete_owned(self, board_id: int, user_id: int) -> bool:
+        """
+        작성자 확인 + 게시글 soft delete (UPDATE ... RETURNING 1회)
+
+        Returns:
+            bool: 삭제 여부 (없거나 작성자가 아니면 False)
+        """
+        result = await self.db.execute(
+            update(_boards)
+            .where(
+                _boards.c.id == board_id,
+                _boards.c.user_id == user_id,
+                _boards.c.deleted_at.is_(None),
+            )
+            .values(deleted_at=datetime.utcnow())
+            .returning(_boards.c.id)
+        )
+        return result.first() is not None
+
+    async def get_owner_id(self, board_id: int) -> Optional[int]:
+        """게시글 작성자 ID (삭제되었거나 없으면 None)"""
+        result = await self.db.execute(
+            select(Board.user_id).where(
+                Board.id == board_id, Board.deleted_at.is_(None)
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def increment_view_counts(self, counts: Dict[int, int]) -> None:
+        """
+        조회수 일괄 증가 (UPDATE boards SET view_count = view_count + n)
+
+        조회는 수정이 아니므로 updated_at은 변경하지 않는다.
+
+        Args:
+            counts: {게시글 ID: 증가분}
+        """
+        if not counts:
+            return
+        await self.db.execute(
+            _increment_view_count_stmt,
+            [{"b_id": board_id, "b_n": n} for board_id, n in counts.items()],
+        )
@@ -2,13 +2,45 @@
 User Repository
 데이터베이스 액세스 레이어
 """
-from typing import Optional
-from sqlalchemy import select
+from typing import Any, Dict, Optional, cast
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.cache import user_cache
+from app.core.cache_invalidation import invalidate_user, notify_user_changed
+from app.core.security import get_password_hash_async
+
+_user_columns = [column.key for column in User.__table__.columns]
+
+
+# 커밋 후 캐시에서 제거할 사용자 ID (Session.info 키)
+_PENDING_INVALIDATIONS = "user_cache_invalidations"
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    """캐시 저장용 User 컬럼 스냅샷"""
+    return {key: getattr(user, key) for key in _user_columns}
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """
+    커밋된 사용자 변경을 캐시에서 제거
+
+    커밋 전에 무효화하면 그 사이 다른 요청이 커밋 전 행을 읽어 TTL 동안 다시 캐시할 수 있다.
+    다른 워커는 같은 트랜잭션에서 보낸 NOTIFY로 무효화한다 (app.core.cache_invalidation).
+    """
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    """롤백된 변경은 캐시에 영향 없음"""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
 
 
 class UserRepository:
@@ -24,6 +56,38 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_id_cached(self, user_id: int) -> Optional[User]:
+        """
+        ID로 사용자 조회 (캐시 우선)
+
+        캐시 hit 시 스냅샷을 merge(load=False)로 현재 세션에 붙여 SELECT 없이 반환
+        """
+        snapshot = user_cache.get(user_id)
+        if snapshot is not None:
+            cached = User(**snapshot)
+            make_transient_to_detached(cached)
+            return await self.db.merge(cached, load=False)
+
+        user = await self.get_by_id(user_id)
+        if user:
+            user_cache.set(user_id, _snapshot(user))
+        return user
+
+    @staticmethod
+    def is_active_cached(user_id: int) -> bool:
+        """
+        사용자 캐시만으로 활성 계정 여부 확인 (DB 조회 없음)
+
+        Returns:
+            캐시에 있고 활성 상태면 True, 캐시 miss 또는 비활성/삭제 계정이면 False
+        """
+        snapshot = user_cache.get(user_id)
+        return (
+            snapshot is not None
+            and snapshot["is_active"]
+            and snapshot["deleted_at"] is None
+        )
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
         result = await self.db.execute(
@@ -36,7 +100,9 @@ class UserRepository:
         user = User(
             email=user_create.email,
             username=user_create.username,
-            hashed_password=get_password_hash(user_create.password),
+            hashed_password=await get_password_hash_async(
+                user_create.password
+            ),
         )
         self.db.add(user)
         await self.db.flush()
@@ -48,11 +114,19 @@ class UserRepository:
         update_data = user_update.model_dump(exclude_unset=True)
 
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
 
         for field, value in update_data.items():
             setattr(user, field, value)
 
         await self.db.flush()
         await self.db.refresh(user)
+        # 비밀번호, is_active, is_admin 등 변경 시 커밋 후 캐시 무효화 (모든 워커)
+        user_id = cast(int, user.id)
+        await notify_user_changed(self.db, user_id)
+        self.db.sync_session.info.setdefault(
+            _PENDING_INVALIDATIONS, set()
+        ).add(user_id)
         return user
@@ -6,10 +6,17 @@ from app.schemas.auth import LoginRequest, TokenResponse, LoginResponse
 from app.schemas.board import (
     BoardBase,
     BoardCreate,
+    BoardBulkCreate,
     BoardUpdate,
     BoardResponse,
     BoardListItem,
     BoardListResponse,
+    BoardSearchResponse,
+    BoardTrendingItem,
+    BoardTrendingResponse,
+    BoardBulkCreated,
+    BoardBulkError,
+    BoardBulkCreateResponse,
 )
 
 __all__ = [
@@ -22,8 +29,15 @@ __all__ = [
     "LoginResponse",
     "BoardBase",
     "BoardCreate",
+    "BoardBulkCreate",
     "BoardUpdate",
     "BoardResponse",
     "BoardListItem",
     "BoardListResponse",
+    "BoardSearchResponse",
+    "BoardTrendingItem",
+    "BoardTrendingResponse",
+    "BoardBulkCreated",
+    "BoardBulkError",
+    "BoardBulkCreateResponse",
 ]
@@ -2,29 +2,47 @@
 Board 스키마 (게시판)
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Iterable, Optional, List, Union
 from pydantic import BaseModel, Field
 
+from app.config import settings
+
 
 class BoardBase(BaseModel):
     """게시글 기본 스키마"""
+
     title: str = Field(..., min_length=1, max_length=200)
     content: str = Field(..., min_length=1, max_length=10000)
 
 
 class BoardCreate(BoardBase):
     """게시글 생성 스키마"""
+
     pass
 
 
+class BoardBulkCreate(BaseModel):
+    """
+    게시글 일괄 생성 스키마
+
+    항목별로 검증하여 오류를 항목 단위로 보고하므로 items는 검증 전 원본을 받는다.
+    """
+
+    items: List[Any] = Field(
+        ..., min_length=1, max_length=settings.BOARD_BULK_MAX_ITEMS
+    )
+
+
 class BoardUpdate(BaseModel):
     """게시글 수정 스키마"""
+
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     content: Optional[str] = Field(None, min_length=1, max_length=10000)
 
 
 class BoardResponse(BaseModel):
     """게시글 응답 스키마"""
+
     id: int
     user_id: int
     title: str
@@ -40,6 +58,7 @@ class BoardResponse(BaseModel):
 
 class BoardListItem(BaseModel):
     """게시글 목록 아이템 스키마"""
+
     id: int
     title: str
     content: str  # 미리보기 (100자)
@@ -48,8 +67,66 @@ class BoardListItem(BaseModel):
     created_at: datetime
 
 
+def to_list_items(rows: Iterable[Any]) -> List[BoardListItem]:
+    """목록 컬럼 행(BoardRepository 목록 조회 결과) → 목록 아이템"""
+    return [
+        BoardListItem(
+            id=row.id,
+            title=row.title,
+            content=row.content,  # DB에서 계산된 미리보기
+            view_count=row.view_count,
+            author_name=row.author_name,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
+
+
 class BoardListResponse(BaseModel):
-    """게시글 목록 응답 스키마 (무한스크롤)"""
+    """게시글 목록 응답 스키마 (무한스크롤, next_cursor는 최신순이면 게시글 ID, 그 외 정렬은 불투명 문자열)"""
+
     items: List[BoardListItem]
-    next_cursor: Optional[int] = None
+    next_cursor: Optional[Union[int, str]] = None
     has_more: bool = False
+
+
+class BoardTrendingItem(BoardListItem):
+    """인기 게시글 아이템 스키마"""
+
+    score: float  # 시간 감쇠 조회 점수 (최근 조회일수록 높음)
+
+
+class BoardTrendingResponse(BaseModel):
+    """인기 게시글 응답 스키마"""
+
+    items: List[BoardTrendingItem]
+
+
+class BoardSearchResponse(BaseModel):
+    """게시글 검색 응답 스키마 (관련도순, next_cursor는 불투명 문자열)"""
+
+    items: List[BoardListItem]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class BoardBulkCreated(BaseModel):
+    """일괄 생성된 게시글 (index: 요청 items 내 위치)"""
+
+    index: int
+    id: int
+    created_at: datetime
+
+
+class BoardBulkError(BaseModel):
+    """일괄 생성 실패 항목 (index: 요청 items 내 위치)"""
+
+    index: int
+    errors: List[str]
+
+
+class BoardBulkCreateResponse(BaseModel):
+    """게시글 일괄 생성 응답 스키마"""
+
+    created: List[BoardBulkCreated]
+    errors: List[BoardBulkError]
@@ -0,0 +1,297 @@
+"""
+운영 서버 실행
+gunicorn 마스터 + uvicorn 워커(uvloop, httptools) 멀티 프로세스
+
+- 워커 수: WEB_CONCURRENCY, 0이면 사용 가능한 CPU 코어 수
+- DB 커넥션 예산(DB_CONNECTION_BUDGET)을 워커 수 + 1로 나누어 워커당 풀 크기 결정
+  (롤링 재시작 중 워커가 1개 더 떠 있어도 DB max_connections를 넘지 않음)
+- 리스닝 소켓은 마스터가 소유하므로 워커 교체 중에도 연결이 끊기지 않음
+- 롤링 재시작: 워커를 1개씩 추가(TTIN) → 가장 오래된 워커 graceful 종료(TTOU) 반복
+  종료되는 워커는 새 연결을 받지 않고, keep-alive 연결에는 Connection: close로 응답해
+  클라이언트가 다른 워커로 옮겨 가게 한 뒤(drain) 처리 중 요청을 마치고 lifespan 종료(조회수 flush 등) 수행
+
+실행:
+    python -m app.server            # 서버 시작
+    python -m app.server restart    # 실행 중인 서버 롤링 재시작 (코드 교체 후)
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import uvicorn
+from gunicorn.app.base import BaseApplication  # type: ignore[import-untyped]
+from gunicorn.arbiter import Arbiter  # type: ignore[import-untyped]
+from uvicorn.workers import UvicornWorker
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    종료 시 keep-alive 연결을 drain 하는 uvicorn 서버
+
+    uvicorn 기본 종료는 유휴 keep-alive 연결을 바로 닫기 때문에, 그 순간 같은 연결로
+    요청을 보낸 클라이언트는 응답 대신 연결 끊김을 받는다. 리스닝을 멈춘 뒤
+    drain_seconds 동안은 연결을 유지하고 응답마다 Connection: close를 붙여
+    클라이언트가 요청을 마친 연결을 스스로 닫고 다른 워커로 다시 연결하게 한다.
+    """
+
+    def __init__(self, config: uvicorn.Config, drain_seconds: float):
+        super().__init__(config)
+        self.drain_seconds = drain_seconds
+        self.draining = False
+
+    def wrap(self, app):
+        """drain 중 응답에 Connection: close 헤더 추가 (uvicorn이 응답 후 연결 종료)"""
+
+        async def draining_app(scope, receive, send):
+            if scope["type"] != "http":
+                return await app(scope, receive, send)
+
+            async def send_wrapper(message):
+                if self.draining and message["type"] == "http.response.start":
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"connection", b"close"),
+                        ],
+                    }
+                await send(message)
+
+            await app(scope, receive, send_wrapper)
+
+        return draining_app
+
+    async def shutdown(
+        self, sockets: Optional[List[socket.socket]] = None
+    ) -> None:
+        # 새 연결 수락 중지 (리스닝 소켓은 마스터와 다른 워커가 계속 사용)
+        for server in self.servers:
+            server.close()
+        for sock in sockets or []:
+            sock.close()
+
+        self.draining = True
+        deadline = time.monotonic() + self.drain_seconds
+        while (
+            self.server_state.connections
+            and not self.force_exit
+            and time.monotonic() < deadline
+        ):
+            await asyncio.sleep(0.05)
+
+        # 남은 연결(drain 동안 요청이 없던 유휴 연결, 처리 중 요청)은 uvicorn 기본 종료
+        await super().shutdown()
+
+
+class ServerWorker(UvicornWorker):
+    """uvloop/httptools 고정, 워커당 동시 처리 상한 적용, 종료 시 drain"""
+
+    CONFIG_KWARGS: Dict[str, Any] = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY or None,
+        "lifespan": "on",
+    }
+
+    async def _serve(self) -> None:
+        # UvicornWorker._serve와 같고 서버 클래스만 DrainingServer
+        server = DrainingServer(
+            config=self.config, drain_seconds=settings.SERVER_DRAIN_SECONDS
+        )
+        self.config.app = server.wrap(self.wsgi)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+
+def available_cpus() -> int:
+    """프로세스가 사용할 수 있는 CPU 수 (컨테이너 cpuset 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    return settings.WEB_CONCURRENCY or available_cpus()
+
+
+def divide_pool(
+    budget: int,
+    workers: int,
+    pool_size: int,
+    max_overflow: int,
+    reserved_per_worker: int = 0,
+) -> Tuple[int, int]:
+    """
+    워커당 커넥션 풀 크기
+
+    롤링 재시작 중에는 워커가 1개 더 있으므로 budget을 workers + 1로 나눈다.
+    워커마다 풀 밖에서 여는 커넥션(reserved_per_worker)은 몫에서 뺀다.
+    설정값(pool_size, max_overflow)보다 크게 늘리지는 않는다.
+
+    Returns:
+        (pool_size, max_overflow), budget이 0 이하면 설정값 그대로
+
+    Raises:
+        ValueError: 워커당 풀 커넥션이 1개도 남지 않는 경우
+    """
+    if budget <= 0:
+        return pool_size, max_overflow
+    per_worker = budget // (workers + 1) - reserved_per_worker
+    if per_worker < 1:
+        raise ValueError(
+            f"DB 커넥션 예산 부족: DB_CONNECTION_BUDGET={budget}, 워커 {workers}(+1)개, "
+            f"워커당 예약 {reserved_per_worker}개 → 워커당 풀 커넥션 {per_worker}개. "
+            "DB_CONNECTION_BUDGET을 늘리거나 WEB_CONCURRENCY를 줄이세요."
+        )
+    size = min(pool_size, per_worker)
+    return size, min(max_overflow, per_worker - size)
+
+
+def gunicorn_options(workers: int) -> Dict[str, Any]:
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": workers,
+        "worker_class": f"{__name__}.ServerWorker",
+        "backlog": settings.SERVER_BACKLOG,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "timeout": settings.SERVER_TIMEOUT,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "pidfile": settings.SERVER_PIDFILE,
+        # 워커가 fork 후 앱을 import하므로 롤링 재시작 시 새 코드 적용
+        "preload_app": False,
+    }
+
+
+class Server(BaseApplication):
+    """gunicorn 애플리케이션 (설정 파일 없이 옵션 dict 사용)"""
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+def serve() -> None:
+    workers = worker_count()
+    # 워커마다 캐시 무효화 리스너 커넥션 1개 (풀 밖)
+    reserved = 1 if settings.CACHE_INVALIDATION_CHANNEL else 0
+    # 예산이 부족하면 워커를 띄우기 전에 실패
+    pool_size, max_overflow = divide_pool(
+        settings.DB_CONNECTION_BUDGET,
+        workers,
+        settings.DB_POOL_SIZE,
+        settings.DB_MAX_OVERFLOW,
+        reserved,
+    )
+    # 워커는 마스터의 설정 객체를 fork로 물려받음
+    settings.DB_POOL_SIZE = pool_size
+    settings.DB_MAX_OVERFLOW = max_overflow
+    logger.info(
+        "workers=%d, 워커당 DB 풀 %d + overflow %d",
+        workers,
+        pool_size,
+        max_overflow,
+    )
+    Server(gunicorn_options(workers)).run()
+
+
+def worker_pids(master_pid: int) -> Set[int]:
+    """마스터의 자식(워커) 프로세스 ID (Linux /proc)"""
+    pids = set()
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid 읽기
+        if int(stat.rsplit(")", 1)[1].split()[1]) == master_pid:
+            pids.add(int(entry))
+    return pids
+
+
+def _wait_for(condition, timeout: float, interval: float = 0.2) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(interval)
+    return condition()
+
+
+def rolling_restart(
+    master_pid: int,
+    ready_seconds: float = settings.SERVER_ROLLING_READY_SECONDS,
+    drain_timeout: float = settings.SERVER_GRACEFUL_TIMEOUT + 5,
+) -> None:
+    """
+    워커를 1개씩 교체
+
+    새 워커 추가(TTIN) → ready_seconds 대기(import, 풀 warm-up) →
+    가장 오래된 워커 종료(TTOU, SIGTERM으로 graceful) → 종료될 때까지 대기.
+    동시에 떠 있는 워커는 최대 workers + 1개.
+
+    Raises:
+        TimeoutError: 새 워커가 뜨지 않거나 기존 워커가 제한 시간 안에 종료되지 않은 경우
+    """
+    old = worker_pids(master_pid)
+    for remaining in range(len(old), 0, -1):
+        before = worker_pids(master_pid)
+        os.kill(master_pid, signal.SIGTTIN)
+        if not _wait_for(lambda: worker_pids(master_pid) - before, timeout=30):
+            raise TimeoutError("새 워커가 시작되지 않았습니다.")
+        time.sleep(ready_seconds)
+
+        os.kill(master_pid, signal.SIGTTOU)
+        if not _wait_for(
+            lambda: len(old & worker_pids(master_pid)) < remaining,
+            drain_timeout,
+        ):
+            raise TimeoutError("기존 워커가 종료되지 않았습니다.")
+        logger.info("워커 교체 %d/%d", len(old) - remaining + 1, len(old))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "command", nargs="?", choices=("serve", "restart"), default="serve"
+    )
+    parser.add_argument("--pidfile", default=settings.SERVER_PIDFILE)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+    if args.command == "restart":
+        with open(args.pidfile) as f:
+            rolling_restart(int(f.read().strip()))
+    else:
+        settings.SERVER_PIDFILE = args.pidfile
+        serve()
+
+
+if __name__ == "__main__":
+    main()
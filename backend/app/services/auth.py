@@ -2,12 +2,18 @@
 Auth Service
 인증 비즈니스 로직
 """
-from typing import Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.user import User
+from app.schemas.user import UserResponse
 from app.services.user import UserService
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password_async, create_access_token
+
+# 토큰 사용자 클레임 버전 (클레임 구성이 바뀌면 올려서 이전 토큰은 DB 조회로 처리)
+TOKEN_CLAIMS_VERSION = 2
 
 
 class AuthService:
@@ -26,11 +32,14 @@ class AuthService:
 
         Returns:
             User 또는 None (인증 실패 시)
+
+        Raises:
+            PasswordHashBusyError: bcrypt 대기열이 가득 찬 경우
         """
         user = await self.user_service.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         if not user.is_active:
             return None
@@ -40,15 +49,60 @@ class AuthService:
         """
         액세스 토큰 생성
 
+        AUTH_ME_FROM_CLAIMS 설정 시에만 sub 외에 /auth/me 응답용 사용자 클레임(버전 포함)을 담는다.
+        토큰은 누구나 디코딩할 수 있으므로 사용하지 않을 때는 이메일 등을 넣지 않는다.
+
         Args:
             user: 사용자
 
         Returns:
             JWT 토큰
         """
-        return create_access_token(data={"sub": str(user.id)})
+        data: Dict[str, Any] = {"sub": str(user.id)}
+        if settings.AUTH_ME_FROM_CLAIMS:
+            data.update(
+                {
+                    "cv": TOKEN_CLAIMS_VERSION,
+                    "email": user.email,
+                    "username": user.username,
+                    "is_active": user.is_active,
+                    "is_admin": user.is_admin,
+                    "created_at": user.created_at.isoformat(),
+                    "updated_at": user.updated_at.isoformat(),
+                }
+            )
+        return create_access_token(data=data)
+
+    @staticmethod
+    def user_from_claims(
+        payload: Optional[Dict[str, Any]]
+    ) -> Optional[UserResponse]:
+        """
+        토큰 클레임으로 사용자 응답 생성 (DB 조회 없음)
+
+        클레임은 로그인 시점 정보이므로 이후 변경(사용자명, 비활성화 등)은 토큰 만료 전까지 반영되지 않는다.
+        호출하는 쪽에서 현재 계정 상태를 따로 확인해야 한다 (UserService.is_active_cached).
+
+        Returns:
+            UserResponse 또는 None (클레임 버전이 다르거나 없는 경우, 비활성 계정 클레임인 경우)
+        """
+        if not payload or payload.get("cv") != TOKEN_CLAIMS_VERSION:
+            return None
+        if not payload["is_active"]:
+            return None
+        return UserResponse(
+            id=int(payload["sub"]),
+            email=payload["email"],
+            username=payload["username"],
+            is_active=payload["is_active"],
+            is_admin=payload["is_admin"],
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            updated_at=datetime.fromisoformat(payload["updated_at"]),
+        )
 
-    async def login(self, email: str, password: str) -> Optional[Tuple[str, User]]:
+    async def login(
+        self, email: str, password: str
+    ) -> Optional[Tuple[str, User]]:
         """
         로그인 처리
 
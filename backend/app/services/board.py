@@ -2,13 +2,75 @@
 Board Service
 비즈니스 로직 레이어
 """
-from typing import Optional, List, Tuple
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    NoReturn,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    cast,
+)
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.trending import trending_boards
+from app.core.view_counter import view_counter
 from app.models.board import Board
-from app.repositories.board import BoardRepository
-from app.schemas.board import BoardCreate, BoardUpdate
+from app.repositories.board import (
+    EXPORT_COLUMNS,
+    LIST_SORTS,
+    BoardRepository,
+    build_tsquery,
+    make_preview,
+)
+from app.repositories.user import UserRepository
+from app.schemas.board import (
+    BoardBulkCreated,
+    BoardBulkCreateResponse,
+    BoardBulkError,
+    BoardCreate,
+    BoardUpdate,
+)
+
+# 내보내기 필드 이름 (CSV 헤더)
+EXPORT_FIELDS: Tuple[str, ...] = tuple(
+    str(column.key) for column in EXPORT_COLUMNS
+)
+
+
+# 커서 값 타입별 변환 (created_at은 ISO 8601 문자열로 인코딩)
+_CURSOR_PARSERS: Dict[type, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    int: int,
+}
+
+
+def _invalid_cursor() -> HTTPException:
+    # 커서가 정수 쿼리 파라미터였을 때(검증 실패 422)와 같은 상태 코드 유지
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="잘못된 커서입니다."
+    )
+
+
+def _error_location(loc: Sequence[Any]) -> str:
+    # 검증 오류 위치 (title, content 등, 항목 자체 오류는 item)
+    return ".".join(str(part) for part in loc) or "item"
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # created_at은 timezone 없는 UTC로 저장되므로 timezone 포함 입력은 UTC로 변환
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class BoardService:
@@ -21,50 +83,276 @@ class BoardService:
         """게시글 작성"""
         return await self.repository.create(user_id, data)
 
-    async def get_board(self, board_id: int) -> Board:
+    async def bulk_create_boards(
+        self, user_id: int, items: List[Any]
+    ) -> BoardBulkCreateResponse:
+        """
+        게시글 일괄 작성
+
+        항목별로 검증하여 유효한 항목만 한 번에 삽입하고, 실패 항목은 위치와 함께 보고한다.
+        """
+        valid: List[Tuple[int, BoardCreate]] = []
+        errors: List[BoardBulkError] = []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, BoardCreate.model_validate(item)))
+            except ValidationError as e:
+                errors.append(
+                    BoardBulkError(
+                        index=index,
+                        errors=[
+                            f"{_error_location(error['loc'])}: {error['msg']}"
+                            for error in e.errors()
+                        ],
+                    )
+                )
+
+        rows = await self.repository.bulk_create(
+            user_id, [data for _, data in valid]
+        )
+        created = [
+            BoardBulkCreated(index=index, id=row.id, created_at=row.created_at)
+            for (index, _), row in zip(valid, rows)
+        ]
+        return BoardBulkCreateResponse(created=created, errors=errors)
+
+    async def get_board(self, board_id: int) -> Tuple[Board, int]:
         """
         게시글 상세 조회 + 조회수 증가
 
+        조회수는 메모리 버퍼에 누적되며 주기적으로 DB에 일괄 반영된다.
+
+        Returns:
+            (게시글, 실시간 조회수(저장값 + 미반영분))
+
         Raises:
             HTTPException: 게시글을 찾을 수 없는 경우
         """
         board = await self.repository.get_by_id(board_id)
         if not board:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다."
+                status_code=status.HTTP_404_NOT_FOUND, detail="게시글을 찾을 수 없습니다."
             )
-        # 조회수 증가
-        await self.repository.increment_view_count(board)
-        return board
+        # 조회수 증가 (write-behind, Column 선언 모델이라 인스턴스 값은 타입 지정)
+        pending = view_counter.increment(board_id)
+        view_count = cast(int, board.view_count) + pending
+        trending_boards.add(
+            board_id,
+            {
+                "id": board_id,
+                "title": board.title,
+                "content": make_preview(cast(str, board.content)),
+                "view_count": view_count,
+                "author_name": board.user.username,
+                "created_at": board.created_at,
+            },
+        )
+        return board, view_count
 
     async def get_board_list(
         self, cursor: Optional[int] = None, limit: int = 20
-    ) -> Tuple[List[Board], bool]:
+    ) -> Tuple[List[Row], bool]:
         """게시글 목록 조회 (무한스크롤)"""
         return await self.repository.get_list(cursor, limit)
 
+    async def get_user_board_list(
+        self, user_id: int, cursor: Optional[int] = None, limit: int = 20
+    ) -> Tuple[List[Row], bool]:
+        """
+        작성자별 게시글 목록 조회 (최신순)
+
+        첫 페이지가 비어 있을 때만 사용자 존재 여부를 확인한다.
+
+        Raises:
+            HTTPException: 사용자가 없는 경우 404 에러
+        """
+        boards, has_more = await self.repository.get_list(
+            cursor, limit, user_id=user_id
+        )
+        if not boards and cursor is None:
+            user = await UserRepository(self.repository.db).get_by_id_cached(
+                user_id
+            )
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="사용자를 찾을 수 없습니다.",
+                )
+        return boards, has_more
+
+    @staticmethod
+    def parse_list_cursor(cursor: Optional[str]) -> Optional[int]:
+        """
+        최신순 목록 커서 (게시글 ID) 변환
+
+        Raises:
+            HTTPException: 정수가 아닌 경우 422 에러
+        """
+        if cursor is None:
+            return None
+        try:
+            return int(cursor)
+        except ValueError:
+            raise _invalid_cursor()
+
+    async def get_sorted_board_list(
+        self, sort: str, cursor: Optional[str] = None, limit: int = 20
+    ) -> Tuple[List[Row], bool, Optional[str]]:
+        """
+        정렬 기준별 게시글 목록 조회 (조회수순, 작성 시각순)
+
+        Returns:
+            (목록 행, 다음 페이지 존재 여부, 다음 페이지 커서)
+
+        Raises:
+            HTTPException: 커서가 올바르지 않은 경우 422 에러
+        """
+        columns, _ = LIST_SORTS[sort]
+        position = None
+        if cursor:
+            try:
+                values = decode_cursor(cursor, len(columns))
+                position = tuple(
+                    _CURSOR_PARSERS[column.type.python_type](value)
+                    for column, value in zip(columns, values)
+                )
+            except (ValueError, TypeError):
+                raise _invalid_cursor()
+
+        boards, has_more = await self.repository.get_sorted_list(
+            sort, position, limit
+        )
+
+        next_cursor = None
+        if has_more:
+            last = boards[-1]
+            next_cursor = encode_cursor(
+                *(
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in (
+                        getattr(last, column.key) for column in columns
+                    )
+                )
+            )
+        return boards, has_more, next_cursor
+
+    async def search_boards(
+        self, q: str, cursor: Optional[str] = None, limit: int = 20
+    ) -> Tuple[List[Row], bool, Optional[str]]:
+        """
+        게시글 검색 (관련도순)
+
+        관련도 정렬은 일치 게시글을 최신순으로 SEARCH_MAX_CANDIDATES건씩 나눈
+        후보 구간 안에서 하고, 구간을 다 보면 다음(더 오래된) 구간으로 이어진다.
+        첫 페이지는 최근 SEARCH_WINDOW_SIZE건 ID 범위부터 검색하고,
+        범위 안 일치 게시글이 SEARCH_MAX_CANDIDATES건보다 적으면 일치 비율로 범위를 넓혀 다시 검색한다.
+        후보가 충분한 범위에는 전체 중 최신 후보가 모두 포함되므로 결과는 전체 검색과 같다.
+        결정된 범위는 커서에 담아 다음 페이지에서 그대로 사용한다.
+
+        Returns:
+            (목록 행, 다음 페이지 존재 여부, 다음 페이지 커서)
+
+        Raises:
+            HTTPException: 커서가 올바르지 않은 경우 422 에러
+        """
+        tsquery = build_tsquery(q, settings.SEARCH_MAX_TOKENS)
+        if tsquery is None:
+            return [], False, None
+
+        max_candidates = settings.SEARCH_MAX_CANDIDATES
+        if cursor:
+            try:
+                rank, board_id, min_id, max_id = decode_cursor(cursor, 4)
+                # 다음 후보 구간의 첫 페이지는 (관련도, ID) 위치 없음
+                position = (
+                    None if rank is None else (float(rank), int(board_id))
+                )
+                min_id = None if min_id is None else int(min_id)
+                max_id = None if max_id is None else int(max_id)
+            except (ValueError, TypeError):
+                raise _invalid_cursor()
+            boards, has_more, found = await self.repository.search(
+                tsquery, position, limit, max_candidates, min_id, max_id
+            )
+        else:
+            max_id = None
+            boards, has_more, found, min_id = await self._search_first_page(
+                tsquery, limit
+            )
+
+        next_cursor = None
+        if has_more:
+            last = boards[-1]
+            next_cursor = encode_cursor(last.rank, last.id, min_id, max_id)
+        elif found >= max_candidates:
+            # 후보 구간이 가득 찼으면 더 오래된 일치 게시글이 있을 수 있으므로 다음 구간으로
+            has_more = True
+            next_cursor = encode_cursor(None, None, None, boards[-1].oldest)
+        return boards, has_more, next_cursor
+
+    async def _search_first_page(
+        self, tsquery: str, limit: int
+    ) -> Tuple[List[Row], bool, int, Optional[int]]:
+        """
+        검색 범위를 넓혀 가며 첫 페이지 조회
+
+        Returns:
+            (목록 행, 다음 페이지 존재 여부, 범위 안 후보 수, 범위 ID 하한)
+        """
+        max_candidates = settings.SEARCH_MAX_CANDIDATES
+        latest = await self.repository.get_max_id()
+        if latest is None:
+            return [], False, 0, None
+
+        window = settings.SEARCH_WINDOW_SIZE
+        while True:
+            min_id = latest - window if window < latest else None
+            boards, has_more, found = await self.repository.search(
+                tsquery, None, limit, max_candidates, min_id
+            )
+            if min_id is None or found >= max_candidates:
+                return boards, has_more, found, min_id
+            if found == 0:
+                # 최근 범위에 없는 드문 단어는 일치 건수가 적으므로 전체 검색
+                window = latest
+            else:
+                # 일치 비율로 후보가 충분한 범위를 추정 (25% 여유)
+                window = int(window * max_candidates / found * 1.25) + 1
+
+    def export_boards(
+        self,
+        user_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """게시글 내보내기 (행 배치 스트림, 삭제된 게시글 제외)"""
+        return self.repository.stream_for_export(
+            user_id,
+            _to_naive_utc(created_from),
+            _to_naive_utc(created_to),
+            batch_size,
+        )
+
     async def update_board(
         self, board_id: int, user_id: int, data: BoardUpdate
-    ) -> Board:
+    ) -> Row:
         """
         게시글 수정 (작성자만 가능)
 
+        작성자 확인과 수정을 UPDATE 1회로 처리하며, 실패한 경우에만 원인(404/403)을 조회한다.
+
+        Returns:
+            수정된 행 (id, user_id, title, content, view_count,
+            created_at, updated_at)
+
         Raises:
             HTTPException: 게시글을 찾을 수 없거나 권한이 없는 경우
         """
-        board = await self.repository.get_by_id(board_id)
-        if not board:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다."
-            )
-        if board.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="수정 권한이 없습니다."
-            )
-        return await self.repository.update(board, data)
+        board = await self.repository.update_owned(board_id, user_id, data)
+        if board is None:
+            await self._raise_not_owned(board_id, "수정 권한이 없습니다.")
+        return board
 
     async def delete_board(self, board_id: int, user_id: int) -> None:
         """
@@ -73,15 +361,17 @@ class BoardService:
         Raises:
             HTTPException: 게시글을 찾을 수 없거나 권한이 없는 경우
         """
-        board = await self.repository.get_by_id(board_id)
-        if not board:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="게시글을 찾을 수 없습니다."
-            )
-        if board.user_id != user_id:
+        if not await self.repository.soft_delete_owned(board_id, user_id):
+            await self._raise_not_owned(board_id, "삭제 권한이 없습니다.")
+
+    async def _raise_not_owned(
+        self, board_id: int, forbidden_detail: str
+    ) -> NoReturn:
+        """소유 확인 UPDATE가 실패한 원인 조회 → 404 또는 403"""
+        if await self.repository.get_owner_id(board_id) is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="삭제 권한이 없습니다."
+                status_code=status.HTTP_404_NOT_FOUND, detail="게시글을 찾을 수 없습니다."
             )
-        await self.repository.soft_delete(board)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail=forbidden_detail
+        )
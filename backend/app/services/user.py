@@ -20,6 +20,15 @@ class UserService:
         """ID로 사용자 조회"""
         return await self.repository.get_by_id(user_id)
 
+    async def get_by_id_cached(self, user_id: int) -> Optional[User]:
+        """ID로 사용자 조회 (캐시 우선)"""
+        return await self.repository.get_by_id_cached(user_id)
+
+    @staticmethod
+    def is_active_cached(user_id: int) -> bool:
+        """사용자 캐시로 활성 계정 여부 확인 (miss면 False)"""
+        return UserRepository.is_active_cached(user_id)
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
         return await self.repository.get_by_email(email)
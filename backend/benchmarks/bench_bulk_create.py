@@ -0,0 +1,87 @@
+"""
+게시글 일괄 작성 벤치마크
+같은 건수를 개별 POST /api/v1/boards 와 POST /api/v1/boards/bulk 로 저장할 때 처리량 비교
+
+- 앱을 in-process(ASGI)로 호출하며 DATABASE_URL의 DB를 사용
+- 벤치마크용 사용자와 게시글은 종료 시 삭제
+
+실행:
+    python -m benchmarks.bench_bulk_create [건수]
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from app.config import settings
+from app.core.security import create_access_token, get_password_hash
+from app.database import AsyncSessionLocal, Base, engine
+from app.main import app
+from app.models.board import Board
+from app.models.user import User
+
+DEFAULT_COUNT = 1000
+
+
+def build_items(count: int):
+    return [
+        {"title": f"상품 설명 {i}", "content": "가나다라마바사아자차카타파하 " * 20}
+        for i in range(count)
+    ]
+
+
+async def sequential(client: AsyncClient, headers: dict, items) -> None:
+    for item in items:
+        response = await client.post("/api/v1/boards", json=item, headers=headers)
+        response.raise_for_status()
+
+
+async def bulk(client: AsyncClient, headers: dict, items) -> None:
+    size = settings.BOARD_BULK_MAX_ITEMS
+    for start in range(0, len(items), size):
+        response = await client.post(
+            "/api/v1/boards/bulk", json={"items": items[start:start + size]}, headers=headers
+        )
+        response.raise_for_status()
+
+
+async def main(count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            hashed_password=get_password_hash("password123"),
+            username="벤치마크",
+            is_active=True,
+            is_admin=False,
+        )
+        session.add(user)
+        await session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+    items = build_items(count)
+
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{count}건 저장")
+            for name, func in (("개별 POST", sequential), ("bulk", bulk)):
+                start = time.perf_counter()
+                await func(client, headers, items)
+                elapsed = time.perf_counter() - start
+                print(f"{name:>10}: {elapsed:7.3f}s  {count / elapsed:9.1f} boards/s")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(Board).where(Board.user_id == user.id))
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT))
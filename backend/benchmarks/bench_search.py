@@ -0,0 +1,190 @@
+"""
+게시글 검색 벤치마크
+한국어 게시글을 대량으로 생성한 뒤 GET /api/v1/boards/search 지연 시간(p50/p95/p99) 측정
+
+- 앱을 in-process(ASGI)로 호출하며 DATABASE_URL의 DB를 사용
+- 게시글은 DB 안에서 generate_series로 생성 (setseed로 결정적)
+- 벤치마크용 사용자와 게시글은 종료 시 삭제 (--keep 지정 시 유지)
+
+실행:
+    python -m benchmarks.bench_search [--rows 1000000] [--rounds 200] [--keep]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, text
+
+from app.core.security import get_password_hash
+from app.database import AsyncSessionLocal, Base, engine
+from app.main import app
+from app.models.board import Board
+from app.models.user import User
+
+NOUNS = [
+    "가방", "신발", "노트북", "의자", "책상", "자전거", "카메라", "시계", "모니터", "키보드",
+    "마우스", "냉장고", "세탁기", "청소기", "텐트", "유모차", "소파", "침대", "스피커", "헤드폰",
+    "태블릿", "프린터", "전자레인지", "선풍기", "가습기", "에어컨", "커피머신", "믹서기", "운동화", "코트",
+    "패딩", "원피스", "청바지", "모자", "지갑", "안경", "향수", "화장품", "캠핑의자", "골프채",
+]
+ADJECTIVES = ["새", "중고", "깨끗한", "저렴한", "튼튼한", "가벼운", "정품", "미개봉", "급처분", "인기"]
+PARTICLES = ["을", "를", "이", "가", "은", "는", "와", "과", "도", "에"]
+VERBS = ["판매합니다", "팝니다", "드립니다", "구합니다", "교환합니다", "나눔합니다"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히강민정현수진영성준호"
+
+
+def build_vocabulary(size: int = 5000) -> list:
+    """
+    본문 어휘 (앞쪽일수록 자주 등장)
+
+    상품명(NOUNS) 뒤에 2~3음절 합성 단어를 이어 붙인 결정적 어휘 목록
+    """
+    rng = random.Random(42)
+    words = list(NOUNS)
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+VOCABULARY = build_vocabulary()
+
+# 매우 흔한 단어(가방)부터 드문 단어까지
+QUERIES = [
+    "가방", "노트북", "캠핑의자", "중고 자전거", "미개봉 헤드폰", "급처분 소파",
+    VOCABULARY[500], VOCABULARY[4000], "정품 향수",
+]
+
+SEED_SQL = """
+WITH words AS (
+    SELECT CAST(:nouns AS text[]) AS nouns, CAST(:adjectives AS text[]) AS adjectives,
+           CAST(:particles AS text[]) AS particles, CAST(:verbs AS text[]) AS verbs,
+           CAST(:vocabulary AS text[]) AS vocabulary
+)
+INSERT INTO boards (user_id, title, content, view_count, created_at, updated_at)
+SELECT
+    :user_id,
+    adjectives[1 + floor(random() * array_length(adjectives, 1))::int] || ' '
+        || nouns[1 + floor(random() * array_length(nouns, 1))::int] || ' '
+        || verbs[1 + floor(random() * array_length(verbs, 1))::int],
+    (
+        SELECT string_agg(
+            -- 어휘 앞쪽에 치우친 분포 (power), 절반은 조사 붙임
+            -- w.i 참조로 집계를 서브쿼리 수준에 고정
+            vocabulary[1 + floor(power(random(), 2) * array_length(vocabulary, 1))::int + w.i * 0]
+                || CASE WHEN random() < 0.5
+                    THEN particles[1 + floor(random() * array_length(particles, 1))::int]
+                    ELSE ''
+                END,
+            ' '
+        )
+        FROM generate_series(1, 20 + (g % 40)) AS w(i)
+    ),
+    floor(random() * 1000)::int,
+    now() - make_interval(secs => g),
+    now() - make_interval(secs => g)
+FROM words, generate_series(1, :batch) AS g
+"""
+
+
+async def seed(user_id: int, rows: int, batch: int = 100_000) -> None:
+    """게시글 rows건 생성 (배치 단위 commit)"""
+    params = {
+        "nouns": NOUNS, "adjectives": ADJECTIVES, "particles": PARTICLES,
+        "verbs": VERBS, "vocabulary": VOCABULARY, "user_id": user_id,
+    }
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT setseed(0.42)"))
+        done = 0
+        while done < rows:
+            size = min(batch, rows - done)
+            start = time.perf_counter()
+            await conn.execute(text(SEED_SQL), {**params, "batch": size})
+            done += size
+            print(f"  seeded {done:>9,}/{rows:,} ({time.perf_counter() - start:.1f}s)")
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE boards"))
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure(client: AsyncClient, rounds: int) -> None:
+    print(f"{'query':<16}{'p50':>9}{'p95':>9}{'p99':>9}   (ms, 첫 페이지 / 2페이지)")
+    overall = []
+    for q in QUERIES:
+        for page in (1, 2):
+            samples = []
+            params = {"q": q, "limit": 20}
+            if page == 2:
+                first = (await client.get("/api/v1/boards/search", params=params)).json()
+                if not first["next_cursor"]:
+                    continue
+                params["cursor"] = first["next_cursor"]
+            await client.get("/api/v1/boards/search", params=params)  # warm-up
+            for _ in range(rounds):
+                start = time.perf_counter()
+                response = await client.get("/api/v1/boards/search", params=params)
+                samples.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+            overall.extend(samples)
+            print(
+                f"{q + (' #2' if page == 2 else ''):<16}"
+                f"{statistics.median(samples):9.2f}{percentile(samples, 95):9.2f}"
+                f"{percentile(samples, 99):9.2f}"
+            )
+    print(
+        f"{'전체':<16}{statistics.median(overall):9.2f}{percentile(overall, 95):9.2f}"
+        f"{percentile(overall, 99):9.2f}"
+    )
+
+
+async def main(rows: int, rounds: int, keep: bool) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            hashed_password=get_password_hash("password123"),
+            username="벤치마크",
+            is_active=True,
+            is_admin=False,
+        )
+        session.add(user)
+        await session.commit()
+
+    try:
+        print(f"게시글 {rows:,}건 생성")
+        await seed(user.id, rows)
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            await measure(client, rounds)
+    finally:
+        if not keep:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(Board).where(Board.user_id == user.id))
+                await session.execute(delete(User).where(User.id == user.id))
+                await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--keep", action="store_true", help="생성한 게시글 유지")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.rounds, args.keep))
@@ -0,0 +1,78 @@
+"""
+JSON 직렬화 벤치마크
+게시글 목록 100건 응답의 요청당 CPU 시간 비교
+
+- before: FastAPI 기본 경로 (response_model 재검증 + jsonable_encoder + json.dumps)
+- after: ModelJSONResponse (재검증 생략 + orjson)
+
+실행:
+    python -m benchmarks.bench_serialization
+"""
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import ModelJSONResponse
+from app.schemas.board import BoardListItem, BoardListResponse
+
+ITEMS = 100
+ROUNDS = 500
+
+
+def build_response() -> BoardListResponse:
+    """벤치마크용 목록 응답 (한글 제목 + 100자 미리보기)"""
+    now = datetime.utcnow()
+    return BoardListResponse(
+        items=[
+            BoardListItem(
+                id=i,
+                title=f"상품 설명 게시글 제목 {i}",
+                content="가나다라마바사아자차카타파하" * 7 + "...",
+                view_count=i * 10,
+                author_name="테스터",
+                created_at=now,
+            )
+            for i in range(ITEMS)
+        ],
+        next_cursor=1,
+        has_more=True,
+    )
+
+
+async def before(field, result: BoardListResponse) -> bytes:
+    content = await serialize_response(field=field, response_content=result, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def after(field, result: BoardListResponse) -> bytes:
+    return ModelJSONResponse(result).body
+
+
+async def measure(func, field, result: BoardListResponse) -> float:
+    """요청당 평균 CPU 시간 (마이크로초)"""
+    await func(field, result)  # warm-up
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        await func(field, result)
+    return (time.process_time() - start) / ROUNDS * 1_000_000
+
+
+async def main() -> None:
+    field = create_response_field(name="Response_get_boards", type_=BoardListResponse)
+    result = build_response()
+
+    before_us = await measure(before, field, result)
+    after_us = await measure(after, field, result)
+
+    print(f"목록 {ITEMS}건 직렬화 (요청당 CPU, {ROUNDS}회 평균)")
+    print(f"  before (FastAPI 기본): {before_us:8.1f} us")
+    print(f"  after  (ModelJSON):    {after_us:8.1f} us")
+    print(f"  speedup:               {before_us / after_us:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
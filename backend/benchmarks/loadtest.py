@@ -0,0 +1,368 @@
+"""
+API 부하 테스트 / 지연 시간 회귀 벤치마크
+시나리오별로 동시 사용자(worker)를 띄워 일정 시간 요청을 보내고
+엔드포인트별 처리량(req/s)과 지연 시간(p50/p95/p99)을 측정
+
+- 기본은 앱을 in-process(ASGI, lifespan 포함)로 호출, --url 지정 시 실행 중인 uvicorn에 HTTP로 요청
+- 벤치마크용 사용자는 DATABASE_URL의 DB에 직접 생성하고 게시글은 POST /boards/bulk 로 작성
+  (--url 대상 서버도 같은 DB, 같은 SECRET_KEY를 사용해야 함)
+- 벤치마크용 사용자와 게시글은 종료 시 삭제
+- --save-baseline 으로 결과를 기준값(baselines/loadtest.json)으로 저장하고
+  --check 로 기준값 대비 p50/p95 지연 증가 또는 처리량 감소를 검사 (회귀 시 종료 코드 1)
+
+시나리오:
+    list_scroll   GET /boards 첫 페이지부터 커서로 SCROLL_PAGES 페이지까지 스크롤
+    detail_view   GET /boards/{id} 임의 게시글 상세 조회
+    login_storm   POST /auth/login 반복 (bcrypt 대기열 포화 시 503 응답은 오류로 집계)
+    create_post   POST /boards 게시글 작성
+
+실행:
+    python -m benchmarks.loadtest [--scenarios list_scroll,detail_view] [--concurrency 16]
+        [--duration 10] [--url http://localhost:8000] [--save-baseline | --check]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import delete
+
+from app.config import settings
+from app.core.security import create_access_token, get_password_hash
+from app.database import AsyncSessionLocal, Base, engine
+from app.main import app
+from app.models.board import Board
+from app.models.user import User
+
+API = settings.API_V1_STR
+BASELINE_PATH = Path(__file__).parent / "baselines" / "loadtest.json"
+
+SCROLL_PAGES = 5
+PAGE_SIZE = 20
+PASSWORD = "password123"
+
+# 회귀 판정: 기준값 대비 비율 + 절대 여유 (ms, 수 ms 단위 측정 잡음 흡수)
+DEFAULT_TOLERANCE = 0.3
+DEFAULT_SLACK_MS = 2.0
+
+
+@dataclass
+class Context:
+    """시나리오 공통 데이터 (벤치마크 사용자, 상세 조회 대상 게시글)"""
+
+    user_id: int
+    email: str
+    headers: Dict[str, str]
+    board_ids: List[int]
+    rng: random.Random = field(default_factory=lambda: random.Random(42))
+
+
+class Recorder:
+    """엔드포인트별 지연 시간(ms)과 오류 수 기록"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(
+        self, client: AsyncClient, name: str, method: str, url: str, **kwargs
+    ) -> Response:
+        """
+        요청 후 지연 시간 기록
+
+        Args:
+            name: 집계 이름 (경로 템플릿, 예: "GET /boards/{id}")
+        """
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        else:
+            self.samples[name].append(elapsed)
+        return response
+
+
+Scenario = Callable[[AsyncClient, Context, Recorder], Awaitable[None]]
+
+
+async def list_scroll(client: AsyncClient, ctx: Context, recorder: Recorder) -> None:
+    """목록 첫 페이지 → 커서로 다음 페이지 (무한 스크롤)"""
+    response = await recorder.request(
+        client, "GET /boards", "GET", f"{API}/boards", params={"limit": PAGE_SIZE}
+    )
+    for _ in range(SCROLL_PAGES - 1):
+        cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+        if cursor is None:
+            return
+        response = await recorder.request(
+            client, "GET /boards?cursor", "GET", f"{API}/boards",
+            params={"limit": PAGE_SIZE, "cursor": cursor},
+        )
+
+
+async def detail_view(client: AsyncClient, ctx: Context, recorder: Recorder) -> None:
+    """임의 게시글 상세 조회"""
+    board_id = ctx.rng.choice(ctx.board_ids)
+    await recorder.request(client, "GET /boards/{id}", "GET", f"{API}/boards/{board_id}")
+
+
+async def login_storm(client: AsyncClient, ctx: Context, recorder: Recorder) -> None:
+    """로그인 반복"""
+    await recorder.request(
+        client, "POST /auth/login", "POST", f"{API}/auth/login",
+        json={"email": ctx.email, "password": PASSWORD},
+    )
+
+
+async def create_post(client: AsyncClient, ctx: Context, recorder: Recorder) -> None:
+    """게시글 작성"""
+    await recorder.request(
+        client, "POST /boards", "POST", f"{API}/boards",
+        json={"title": "부하 테스트 게시글", "content": "가나다라마바사아자차카타파하 " * 20},
+        headers=ctx.headers,
+    )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "list_scroll": list_scroll,
+    "detail_view": detail_view,
+    "login_storm": login_storm,
+    "create_post": create_post,
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    concurrency: int,
+    duration: float,
+    warmup: float = 1.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    concurrency개 worker로 duration초 동안 시나리오 반복 (warmup초는 집계 제외)
+
+    Returns:
+        {엔드포인트: {requests, errors, rps, p50, p95, p99}} (지연 시간 ms)
+    """
+    async def worker(recorder: Recorder, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            await scenario(client, ctx, recorder)
+
+    if warmup > 0:
+        deadline = time.perf_counter() + warmup
+        await asyncio.gather(*(worker(Recorder(), deadline) for _ in range(concurrency)))
+
+    recorder = Recorder()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(recorder, start + duration) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for name in sorted(set(recorder.samples) | set(recorder.errors)):
+        samples = recorder.samples.get(name, [])
+        errors = recorder.errors.get(name, 0)
+        results[name] = {
+            "requests": len(samples) + errors,
+            "errors": errors,
+            "rps": round((len(samples) + errors) / elapsed, 1),
+            "p50": round(statistics.median(samples), 2) if samples else None,
+            "p95": round(percentile(samples, 95), 2) if samples else None,
+            "p99": round(percentile(samples, 99), 2) if samples else None,
+        }
+    return results
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    slack_ms: float = DEFAULT_SLACK_MS,
+) -> List[str]:
+    """
+    기준값 대비 회귀 목록
+
+    - p50/p95: 기준값 * (1 + tolerance) + slack_ms 초과
+    - rps: 기준값 * (1 - tolerance) 미만
+    - 기준값에 없는 시나리오/엔드포인트는 비교하지 않음
+
+    Returns:
+        회귀 설명 문자열 목록 (없으면 빈 목록)
+    """
+    regressions = []
+    for scenario, endpoints in results.items():
+        for name, current in endpoints.items():
+            base = baseline.get(scenario, {}).get(name)
+            if base is None:
+                continue
+            for metric in ("p50", "p95"):
+                if base.get(metric) is None or current.get(metric) is None:
+                    continue
+                limit = base[metric] * (1 + tolerance) + slack_ms
+                if current[metric] > limit:
+                    regressions.append(
+                        f"{scenario} {name} {metric}: {current[metric]:.2f}ms "
+                        f"> {limit:.2f}ms (기준 {base[metric]:.2f}ms)"
+                    )
+            if current["rps"] < base["rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{scenario} {name} rps: {current['rps']:.1f} "
+                    f"< {base['rps'] * (1 - tolerance):.1f} (기준 {base['rps']:.1f})"
+                )
+    return regressions
+
+
+def print_results(scenario: str, results: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n[{scenario}]")
+    print(f"{'endpoint':<22}{'requests':>9}{'errors':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, r in results.items():
+        latencies = "".join(
+            f"{r[m]:9.2f}" if r[m] is not None else f"{'-':>9}" for m in ("p50", "p95", "p99")
+        )
+        print(f"{name:<22}{r['requests']:>9}{r['errors']:>8}{r['rps']:>9.1f}{latencies}")
+
+
+async def setup(client: AsyncClient, boards: int) -> Context:
+    """벤치마크 사용자 생성 + 게시글 boards건 작성"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            hashed_password=get_password_hash(PASSWORD),
+            username="벤치마크",
+            is_active=True,
+            is_admin=False,
+        )
+        session.add(user)
+        await session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+    board_ids: List[int] = []
+    size = settings.BOARD_BULK_MAX_ITEMS
+    for start in range(0, boards, size):
+        items = [
+            {"title": f"상품 설명 {i}", "content": "가나다라마바사아자차카타파하 " * 20}
+            for i in range(start, min(boards, start + size))
+        ]
+        response = await client.post(f"{API}/boards/bulk", json={"items": items}, headers=headers)
+        response.raise_for_status()
+        board_ids.extend(item["id"] for item in response.json()["created"])
+    return Context(user_id=user.id, email=user.email, headers=headers, board_ids=board_ids)
+
+
+async def cleanup(ctx: Context) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(Board).where(Board.user_id == ctx.user_id))
+        await session.execute(delete(User).where(User.id == ctx.user_id))
+        await session.commit()
+    await engine.dispose()
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Dict[str, float]]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: Path, results: Dict, args: argparse.Namespace) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "meta": {
+            "target": args.url or "asgi",
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "boards": args.boards,
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with AsyncExitStack() as stack:
+        if args.url:
+            client = await stack.enter_async_context(
+                AsyncClient(base_url=args.url, timeout=30.0)
+            )
+        else:
+            # lifespan 실행 (커넥션 풀 prewarm, 조회수 flush 등 운영과 동일)
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = await stack.enter_async_context(
+                AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+            )
+
+        ctx = await setup(client, args.boards)
+        try:
+            results = {}
+            for name in args.scenarios:
+                results[name] = await run_scenario(
+                    client, SCENARIOS[name], ctx, args.concurrency, args.duration, args.warmup
+                )
+                print_results(name, results[name])
+        finally:
+            await stack.aclose()  # lifespan 종료 (조회수 flush) 후 삭제
+            await cleanup(ctx)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, args)
+        print(f"\n기준값 저장: {args.baseline}")
+    if args.check:
+        regressions = compare(load_baseline(args.baseline), results, args.tolerance)
+        if regressions:
+            print("\n회귀 발견:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n기준값 대비 회귀 없음")
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenarios", type=lambda value: value.split(","), default=list(SCENARIOS),
+        help=f"쉼표로 구분 ({','.join(SCENARIOS)})",
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 worker 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="시나리오별 워밍업 시간(초)")
+    parser.add_argument("--boards", type=int, default=2000, help="미리 작성할 게시글 수")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (미지정 시 in-process ASGI)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장")
+    mode.add_argument("--check", action="store_true", help="기준값 대비 회귀 검사")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,339 @@
+"""
+대용량 합성 데이터 생성
+users / boards 를 수백만 건 단위로 생성하여 인덱스 선택, 커서 깊이, 검색 성능을 실제 규모에서 확인
+
+- asyncpg copy_records_to_table(COPY)로 적재, 배치 생성은 프로세스 풀, 적재는 커넥션 workers개로 병렬
+- 같은 --seed 이면 같은 데이터 (배치마다 seed와 배치 번호로 난수 생성기를 만들어 병렬 순서와 무관)
+  시각은 --until(기본값: 오늘 0시 UTC) 기준 상대값
+- ID를 직접 지정하여 ID 순서 = 작성 시각 순서 (적재 후 시퀀스 조정)
+- 분포
+  - 제목: 수식어 + 상품명 + 동사, 일부는 단어 추가 (10~40자)
+  - 본문: 단어 수 로그정규 분포 (중앙값 약 30단어, 긴 꼬리), 앞쪽 어휘일수록 자주 등장, 절반 가까이 조사 붙임
+  - 조회수: 파레토 분포 (대부분 수십 회 이하, 소수 게시글에 집중)
+  - 작성자: 일부 사용자에게 게시글 집중
+  - 10%는 작성 후 수정, --deleted-fraction 만큼 soft delete
+- 적재 전 boards 보조 인덱스를 삭제하고 적재 후 병렬로 다시 생성 (--keep-indexes 로 유지)
+  검색용 생성 컬럼(search_vector)은 COPY 시 DB가 계산
+
+실행:
+    python -m benchmarks.seed [--users 100000] [--boards 1000000] [--seed 42]
+        [--workers 4] [--truncate] [--keep-indexes]
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import asyncpg
+import bcrypt
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from benchmarks.bench_search import ADJECTIVES, NOUNS, PARTICLES, SYLLABLES, VERBS, VOCABULARY
+
+USER_COLUMNS = (
+    "id", "email", "hashed_password", "username", "is_active", "is_admin",
+    "created_at", "updated_at", "deleted_at",
+)
+BOARD_COLUMNS = (
+    "id", "user_id", "title", "content", "view_count", "created_at", "updated_at", "deleted_at",
+)
+
+PASSWORD = "password123"
+BCRYPT_ALPHABET = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍"
+TITLE_TAGS = ("", "", "", "[판매] ", "[구매] ", "[나눔] ", "[교환] ")
+
+# 본문 어휘 누적 가중치 (지프 분포: r번째 단어 가중치 1/r)
+_CUM_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1)))
+
+MAX_CONTENT_WORDS = 600
+MAX_VIEW_COUNT = 1_000_000
+EDITED_FRACTION = 0.1
+
+
+def seeded_password_hash(seed: int) -> str:
+    """seed로 salt를 고정한 bcrypt 해시 (전 사용자 공유, 해싱은 1회만)"""
+    rng = random.Random(seed)
+    # 22자 salt의 마지막 문자는 하위 비트가 0인 문자만 유효
+    salt = "".join(rng.choice(BCRYPT_ALPHABET) for _ in range(21)) + rng.choice(".Oeu")
+    return bcrypt.hashpw(PASSWORD.encode("utf-8"), f"$2b$12${salt}".encode("utf-8")).decode("utf-8")
+
+
+def generate_users(
+    seed: int, batch: int, first_id: int, count: int, hashed_password: str, before: datetime
+) -> List[Tuple]:
+    """사용자 count건 (ID first_id부터), 가입 시각은 before 이전 1~2년"""
+    rng = random.Random(seed * 1_000_003 + batch)
+    rows = []
+    for user_id in range(first_id, first_id + count):
+        created_at = before - timedelta(days=365 + rng.random() * 365)
+        rows.append((
+            user_id,
+            f"seed{user_id}@example.com",
+            hashed_password,
+            rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES),
+            rng.random() >= 0.01,
+            False,
+            created_at,
+            created_at,
+            None,
+        ))
+    return rows
+
+
+def _title(rng: random.Random) -> str:
+    words = [rng.choice(ADJECTIVES), rng.choice(NOUNS)]
+    if rng.random() < 0.4:
+        words.extend(rng.choices(VOCABULARY, cum_weights=_CUM_WEIGHTS, k=rng.randint(1, 3)))
+    words.append(rng.choice(VERBS))
+    return rng.choice(TITLE_TAGS) + " ".join(words)
+
+
+def _content(rng: random.Random) -> str:
+    count = min(MAX_CONTENT_WORDS, max(3, int(rng.lognormvariate(3.4, 0.8))))
+    words = rng.choices(VOCABULARY, cum_weights=_CUM_WEIGHTS, k=count)
+    for i in range(count):
+        if rng.random() < 0.45:
+            words[i] += rng.choice(PARTICLES)
+    # 대략 12단어마다 줄바꿈
+    lines = [" ".join(words[i:i + 12]) for i in range(0, count, 12)]
+    return "\n".join(lines)
+
+
+def generate_boards(
+    seed: int,
+    batch: int,
+    first_id: int,
+    count: int,
+    first_user_id: int,
+    users: int,
+    start: datetime,
+    step: float,
+    deleted_fraction: float,
+) -> List[Tuple]:
+    """
+    게시글 count건 (ID first_id부터)
+
+    Args:
+        first_user_id, users: 작성자 ID 범위
+        start: 배치 첫 게시글 작성 시각
+        step: 게시글 간 평균 작성 간격 (초)
+    """
+    rng = random.Random(seed * 1_000_003 + batch)
+    rows = []
+    for offset in range(count):
+        created_at = start + timedelta(seconds=(offset + rng.random()) * step)
+        updated_at = created_at
+        if rng.random() < EDITED_FRACTION:
+            updated_at += timedelta(seconds=rng.random() * 86400)
+        deleted_at = None
+        if rng.random() < deleted_fraction:
+            deleted_at = updated_at + timedelta(seconds=rng.random() * 86400)
+        rows.append((
+            first_id + offset,
+            # 앞쪽 사용자에게 게시글 집중
+            first_user_id + int(users * rng.random() ** 3),
+            _title(rng),
+            _content(rng),
+            min(MAX_VIEW_COUNT, int((rng.paretovariate(1.1) - 1) * 20)),
+            created_at,
+            updated_at,
+            deleted_at,
+        ))
+    return rows
+
+
+def _dsn(url: str) -> str:
+    # SQLAlchemy URL → asyncpg DSN
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def _next_id(conn: asyncpg.Connection, table: str) -> int:
+    return await conn.fetchval(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+
+
+async def _sync_sequence(conn: asyncpg.Connection, table: str) -> None:
+    await conn.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+    )
+
+
+async def drop_secondary_indexes(conn: asyncpg.Connection, table: str) -> List[str]:
+    """제약 조건(PK, UNIQUE)이 아닌 인덱스 삭제, 다시 만들 정의 반환"""
+    rows = await conn.fetch(
+        """
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = $1
+          AND indexname NOT IN (
+              SELECT conname FROM pg_constraint WHERE conrelid = $1::regclass
+          )
+        """,
+        table,
+    )
+    for row in rows:
+        await conn.execute(f'DROP INDEX "{row["indexname"]}"')
+    return [row["indexdef"] for row in rows]
+
+
+async def copy_parallel(
+    pool: asyncpg.Pool,
+    executor: ProcessPoolExecutor,
+    table: str,
+    columns: Sequence[str],
+    jobs: Iterable[tuple],
+    generate,
+    total: int,
+    workers: int,
+) -> None:
+    """
+    배치 생성(프로세스 풀) + COPY(커넥션 풀)를 workers개 병렬로 실행
+
+    Args:
+        jobs: generate 인자 튜플 (배치 단위)
+    """
+    loop = asyncio.get_running_loop()
+    jobs = iter(jobs)
+    done = 0
+    started = time.perf_counter()
+
+    async def worker() -> None:
+        nonlocal done
+        for args in jobs:  # 이벤트 루프 단일 스레드라 이터레이터 공유 안전
+            records = await loop.run_in_executor(executor, generate, *args)
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(table, records=records, columns=columns)
+            done += len(records)
+            elapsed = time.perf_counter() - started
+            print(f"  {table} {done:>11,}/{total:,} ({done / elapsed:,.0f} rows/s)")
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+def _batches(first_id: int, total: int, batch_size: int):
+    """(배치 번호, 첫 ID, 건수)"""
+    for batch, offset in enumerate(range(0, total, batch_size)):
+        yield batch, first_id + offset, min(batch_size, total - offset)
+
+
+async def create_indexes(pool: asyncpg.Pool, definitions: List[str], work_mem: str) -> None:
+    """인덱스 병렬 생성 (커넥션마다 1개)"""
+    started = time.perf_counter()
+
+    async def create(definition: str) -> None:
+        async with pool.acquire() as conn:
+            await conn.execute(f"SET maintenance_work_mem = '{work_mem}'")
+            await conn.execute(definition)
+
+    await asyncio.gather(*(create(definition) for definition in definitions))
+    print(f"인덱스 {len(definitions)}개 생성 {time.perf_counter() - started:.1f}s")
+
+
+async def load(
+    pool: asyncpg.Pool,
+    args: argparse.Namespace,
+    first_user_id: int,
+    first_board_id: int,
+    until: datetime,
+) -> None:
+    """users → boards 순서로 적재"""
+    hashed_password = seeded_password_hash(args.seed)
+    span = timedelta(days=args.days).total_seconds()
+    start = until - timedelta(seconds=span)
+    step = span / max(args.boards, 1)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        print(f"users {args.users:,}건")
+        await copy_parallel(
+            pool, executor, "users", USER_COLUMNS,
+            (
+                (args.seed, batch, first_id, count, hashed_password, start)
+                for batch, first_id, count in _batches(first_user_id, args.users, args.batch_size)
+            ),
+            generate_users, args.users, args.workers,
+        )
+
+        print(f"boards {args.boards:,}건")
+        await copy_parallel(
+            pool, executor, "boards", BOARD_COLUMNS,
+            (
+                (
+                    # 사용자 배치와 겹치지 않는 배치 번호
+                    args.seed, 1_000_000 + batch, first_id, count,
+                    first_user_id, args.users,
+                    start + timedelta(seconds=(first_id - first_board_id) * step), step,
+                    args.deleted_fraction,
+                )
+                for batch, first_id, count in _batches(first_board_id, args.boards, args.batch_size)
+            ),
+            generate_boards, args.boards, args.workers,
+        )
+
+
+async def seed(args: argparse.Namespace) -> None:
+    until = args.until or datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+    # 적재 세션은 동기 커밋 대기 생략 (유실돼도 다시 생성하면 되는 데이터)
+    pool = await asyncpg.create_pool(
+        _dsn(args.database_url),
+        min_size=args.workers,
+        max_size=args.workers,
+        init=lambda conn: conn.execute("SET synchronous_commit = off"),
+    )
+    try:
+        async with pool.acquire() as conn:
+            if args.truncate:
+                await conn.execute("TRUNCATE boards, users RESTART IDENTITY")
+            first_user_id = await _next_id(conn, "users")
+            first_board_id = await _next_id(conn, "boards")
+            index_defs = [] if args.keep_indexes else await drop_secondary_indexes(conn, "boards")
+
+        started = time.perf_counter()
+        try:
+            await load(pool, args, first_user_id, first_board_id, until)
+            print(f"적재 {time.perf_counter() - started:.1f}s")
+        finally:
+            # 적재가 실패해도 삭제한 인덱스는 복구
+            if index_defs:
+                await create_indexes(pool, index_defs, args.maintenance_work_mem)
+
+        async with pool.acquire() as conn:
+            for table in ("users", "boards"):
+                await _sync_sequence(conn, table)
+                await conn.execute(f"ANALYZE {table}")
+        print(f"완료 {time.perf_counter() - started:.1f}s")
+    finally:
+        await pool.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--boards", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="병렬 배치 수")
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--deleted-fraction", type=float, default=0.05)
+    parser.add_argument("--days", type=float, default=365, help="게시글 작성 기간 (일)")
+    parser.add_argument(
+        "--until", type=datetime.fromisoformat, help="마지막 게시글 작성 시각 (UTC, 기본값: 오늘 0시)"
+    )
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--truncate", action="store_true", help="기존 users/boards 삭제 후 생성")
+    parser.add_argument("--keep-indexes", action="store_true", help="보조 인덱스 유지 (기존 데이터가 많을 때)")
+    parser.add_argument("--maintenance-work-mem", default="512MB", help="인덱스 생성 메모리")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users 는 1 이상 (게시글 작성자)")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(seed(parse_args()))
@@ -2,6 +2,7 @@
 Pytest 설정 및 공통 픽스처
 """
 import pytest_asyncio
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy import text
@@ -9,8 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 
 from app.main import app
 from app.database import Base
-from app.api.deps import get_db_session
+from app.api.deps import get_db_session, get_read_db_session, get_snapshot_session_factory
 from app.config import settings
+from app.core.cache import board_list_cache
+from app.core.trending import trending_boards
+from app.core.query_stats import instrument_engine
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -21,6 +25,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         echo=False,
         pool_pre_ping=True,
     )
+    instrument_engine(engine)
 
     # 테이블 생성 (checkfirst=True 기본값: 이미 있으면 건너뜀)
     async with engine.begin() as conn:
@@ -45,9 +50,14 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_db_session] = override_get_db_session
+    app.dependency_overrides[get_snapshot_session_factory] = lambda: asynccontextmanager(override_get_db_session)
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
     app.dependency_overrides.clear()
+    # 테스트 간 데이터가 섞이지 않도록 응답 캐시 초기화
+    board_list_cache.invalidate()
+    trending_boards.clear()
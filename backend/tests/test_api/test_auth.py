@@ -0,0 +1,146 @@
+"""
+인증 API 엔드포인트 테스트
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.cache import user_cache
+from app.core.security import decode_access_token, password_hash_pool
+from app.schemas.user import UserUpdate
+from app.services.user import UserService
+from tests.test_api.test_boards import create_test_user, get_auth_header
+
+
+@pytest.mark.asyncio
+async def test_get_me_uses_user_cache(client: AsyncClient, db_session: AsyncSession):
+    """두 번째 요청부터 사용자 캐시 hit"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    hits = user_cache.hits
+
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "test@example.com"
+    assert user_cache.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_get_me_requires_token(client: AsyncClient, monkeypatch):
+    """토큰이 없으면 클레임 응답 설정과 관계없이 401"""
+    monkeypatch.setattr(settings, "AUTH_ME_FROM_CLAIMS", True)
+
+    response = await client.get("/api/v1/auth/me")
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+@pytest.mark.asyncio
+async def test_get_me_cache_invalidated_on_deactivate(client: AsyncClient, db_session: AsyncSession):
+    """is_active 변경 시 캐시 무효화되어 즉시 401"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+
+    await UserService(db_session).update(user, UserUpdate(is_active=False))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_user_cache_invalidated_after_commit(client: AsyncClient, db_session: AsyncSession):
+    """커밋 전에는 캐시를 유지하고 커밋 후 무효화 (커밋 전 행이 다시 캐시되지 않도록)"""
+    user = await create_test_user(db_session)
+    response = await client.get("/api/v1/auth/me", headers=get_auth_header(user.id))
+    assert response.status_code == 200
+
+    await UserService(db_session).update(user, UserUpdate(username="변경"))
+    assert user_cache.get(user.id)["username"] == "테스터"
+
+    await db_session.commit()
+    assert user_cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_login(client: AsyncClient, db_session: AsyncSession):
+    """로그인 성공"""
+    await create_test_user(db_session)
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["access_token"]
+    assert data["user"]["username"] == "테스터"
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_hash_pool_saturated(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    """bcrypt 대기열 포화 시 503 + Retry-After"""
+    await create_test_user(db_session)
+    monkeypatch.setattr(password_hash_pool, "max_workers", 0)
+    monkeypatch.setattr(password_hash_pool, "max_queue", 0)
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(password_hash_pool.retry_after)
+
+
+@pytest.mark.asyncio
+async def test_get_me_from_claims(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    """AUTH_ME_FROM_CLAIMS: 사용자 캐시로 활성 계정 확인 후 클레임으로, 이전 토큰은 DB 조회로 응답"""
+    user = await create_test_user(db_session)
+    monkeypatch.setattr(settings, "AUTH_ME_FROM_CLAIMS", True)
+
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"},
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert decode_access_token(token)["is_active"] is True
+
+    # 첫 요청은 캐시 miss → DB 조회, 이후 클레임으로 응답
+    for _ in range(2):
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == login.json()["user"]
+
+    # 클레임이 없는 토큰은 DB 조회로 처리
+    response = await client.get("/api/v1/auth/me", headers=get_auth_header(user.id))
+    assert response.status_code == 200
+    assert response.json()["id"] == user.id
+
+    # 비활성화되면 클레임 토큰이어도 401
+    await UserService(db_session).update(user, UserUpdate(is_active=False))
+    await db_session.commit()
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_token_has_only_sub_without_claims(client: AsyncClient, db_session: AsyncSession):
+    """AUTH_ME_FROM_CLAIMS 비활성(기본) 시 토큰에 사용자 정보를 넣지 않음"""
+    await create_test_user(db_session)
+
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"},
+    )
+    payload = decode_access_token(login.json()["access_token"])
+    assert set(payload) == {"sub", "exp"}
@@ -1,12 +1,22 @@
 """
 게시판 API 엔드포인트 테스트
 """
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cache import board_list_cache
 from app.core.security import create_access_token, get_password_hash
+from app.models.board import Board
 from app.models.user import User
+from app.repositories.board import BoardRepository
 
 
 async def create_test_user(db: AsyncSession, email: str = "test@example.com", username: str = "테스터") -> User:
@@ -93,6 +103,74 @@ async def test_get_boards_pagination(client: AsyncClient, db_session: AsyncSessi
     assert len(data2["items"]) == 2
 
 
+async def _collect_pages(client: AsyncClient, sort: str, limit: int = 2) -> list:
+    """정렬 목록을 next_cursor로 끝까지 조회하여 ID 목록 반환"""
+    ids, cursor = [], None
+    while True:
+        params = {"sort": sort, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/boards", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not data["has_more"]:
+            return ids
+
+
+@pytest.mark.asyncio
+async def test_get_boards_sorted_by_views(client: AsyncClient, db_session: AsyncSession):
+    """조회수순 (같으면 최신순) keyset 페이지네이션"""
+    user = await create_test_user(db_session)
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(5)]
+    created = (await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=get_auth_header(user.id)
+    )).json()
+    ids = [item["id"] for item in created["created"]]
+    view_counts = [3, 1, 3, 0, 2]
+    for board_id, view_count in zip(ids, view_counts):
+        await db_session.execute(update(Board).where(Board.id == board_id).values(view_count=view_count))
+    await db_session.commit()
+
+    expected = [board_id for _, board_id in sorted(zip(view_counts, ids), reverse=True)]
+    assert await _collect_pages(client, "views") == expected
+
+
+@pytest.mark.asyncio
+async def test_get_boards_sorted_by_created_at(client: AsyncClient, db_session: AsyncSession):
+    """작성 시각순 (ID 순서와 다른 경우 포함), 같은 시각은 ID로 구분"""
+    user = await create_test_user(db_session)
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(5)]
+    created = (await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=get_auth_header(user.id)
+    )).json()
+    ids = [item["id"] for item in created["created"]]
+    # 가져온 게시글처럼 작성 시각을 ID 역순으로, 두 건은 같은 시각
+    base = datetime(2026, 1, 1)
+    offsets = [4, 3, 3, 1, 0]
+    for board_id, offset in zip(ids, offsets):
+        await db_session.execute(
+            update(Board).where(Board.id == board_id).values(created_at=base + timedelta(hours=offset))
+        )
+    await db_session.commit()
+
+    expected = [board_id for _, board_id in sorted(zip(offsets, ids))]
+    assert await _collect_pages(client, "created_asc") == expected
+    assert await _collect_pages(client, "created_desc") == expected[::-1]
+
+
+@pytest.mark.asyncio
+async def test_get_boards_invalid_cursor(client: AsyncClient):
+    """정렬별 커서 형식 검증 (422, 커서가 정수 쿼리 파라미터였을 때와 같은 상태 코드)"""
+    response = await client.get("/api/v1/boards", params={"cursor": "abc"})
+    assert response.status_code == 422
+
+    response = await client.get("/api/v1/boards", params={"sort": "views", "cursor": "123"})
+    assert response.status_code == 422
+
+    response = await client.get("/api/v1/boards", params={"sort": "unknown"})
+    assert response.status_code == 422
+
+
 # ===== 게시글 작성 =====
 
 @pytest.mark.asyncio
@@ -153,6 +231,63 @@ async def test_create_board_validation_title_too_long(client: AsyncClient, db_se
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_boards(client: AsyncClient, db_session: AsyncSession):
+    """일괄 작성: 유효한 항목만 저장, 실패 항목은 위치와 함께 보고"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    response = await client.post(
+        "/api/v1/boards/bulk",
+        json={"items": [
+            {"title": "첫 번째", "content": "내용 1"},
+            {"title": "", "content": "내용 2"},
+            {"title": "세 번째", "content": "내용 3"},
+            "잘못된 항목",
+        ]},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert [item["index"] for item in data["created"]] == [0, 2]
+    assert data["created"][0]["id"] < data["created"][1]["id"]
+    assert [error["index"] for error in data["errors"]] == [1, 3]
+    assert data["errors"][0]["errors"][0].startswith("title:")
+
+    response = await client.get("/api/v1/boards")
+    assert [item["title"] for item in response.json()["items"]] == ["세 번째", "첫 번째"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_boards_all_invalid(client: AsyncClient, db_session: AsyncSession):
+    """저장된 항목이 없으면 422"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    response = await client.post(
+        "/api/v1/boards/bulk",
+        json={"items": [{"title": "가" * 201, "content": "내용"}]},
+        headers=headers,
+    )
+    assert response.status_code == 422
+    assert response.json()["created"] == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_boards_limit(client: AsyncClient, db_session: AsyncSession):
+    """최대 항목 수 초과 / 비로그인"""
+    user = await create_test_user(db_session)
+    items = [{"title": "제목", "content": "내용"}] * (settings.BOARD_BULK_MAX_ITEMS + 1)
+
+    response = await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=get_auth_header(user.id)
+    )
+    assert response.status_code == 422
+
+    response = await client.post("/api/v1/boards/bulk", json={"items": items[:1]})
+    assert response.status_code == 401
+
+
 # ===== 게시글 상세 조회 =====
 
 @pytest.mark.asyncio
@@ -253,6 +388,36 @@ async def test_update_board_forbidden(client: AsyncClient, db_session: AsyncSess
     )
     assert response.status_code == 403
 
+    # 수정되지 않음
+    response = await client.get(f"/api/v1/boards/{board_id}")
+    assert response.json()["title"] == "유저1의 글"
+
+
+@pytest.mark.asyncio
+async def test_update_board_empty_and_not_found(client: AsyncClient, db_session: AsyncSession):
+    """빈 수정은 변경 없이 200, 없는/삭제된 게시글은 404"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    create_res = await client.post(
+        "/api/v1/boards", json={"title": "제목", "content": "내용"}, headers=headers
+    )
+    created = create_res.json()
+
+    response = await client.put(f"/api/v1/boards/{created['id']}", json={}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "제목"
+    assert data["updated_at"] == created["updated_at"]
+
+    await client.delete(f"/api/v1/boards/{created['id']}", headers=headers)
+    for board_id in (created["id"], created["id"] + 1000):
+        response = await client.put(
+            f"/api/v1/boards/{board_id}", json={"title": "수정"}, headers=headers
+        )
+        assert response.status_code == 404
+        response = await client.delete(f"/api/v1/boards/{board_id}", headers=headers)
+        assert response.status_code == 404
+
 
 # ===== 게시글 삭제 =====
 
@@ -313,3 +478,395 @@ async def test_delete_board_unauthorized(client: AsyncClient, db_session: AsyncS
 
     response = await client.delete(f"/api/v1/boards/{board_id}")
     assert response.status_code == 401
+
+
+# ===== 게시글 목록 캐시 =====
+
+@pytest.mark.asyncio
+async def test_get_boards_cached_and_invalidated(client: AsyncClient, db_session: AsyncSession):
+    """첫 페이지는 캐시에서 응답하고, 게시글 작성 시 무효화"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    await client.post("/api/v1/boards", json={"title": "제목 1", "content": "내용"}, headers=headers)
+
+    first = await client.get("/api/v1/boards")
+    hits = board_list_cache.stats["hits"]
+    second = await client.get("/api/v1/boards")
+    assert board_list_cache.stats["hits"] == hits + 1
+    assert second.json() == first.json()
+
+    await client.post("/api/v1/boards", json={"title": "제목 2", "content": "내용"}, headers=headers)
+    response = await client.get("/api/v1/boards")
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_boards_cache_depth(client: AsyncClient, db_session: AsyncSession):
+    """캐시된 페이지의 next_cursor만 캐시 대상, 임의 커서는 캐시하지 않음"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    for i in range(3):
+        await client.post("/api/v1/boards", json={"title": f"제목 {i}", "content": "내용"}, headers=headers)
+
+    page1 = (await client.get("/api/v1/boards?limit=1")).json()
+    await client.get(f"/api/v1/boards?cursor={page1['next_cursor']}&limit=1")
+    hits = board_list_cache.stats["hits"]
+    await client.get(f"/api/v1/boards?cursor={page1['next_cursor']}&limit=1")
+    assert board_list_cache.stats["hits"] == hits + 1
+
+    await client.get("/api/v1/boards?cursor=1&limit=1")
+    await client.get("/api/v1/boards?cursor=1&limit=1")
+    assert board_list_cache.stats["hits"] == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_get_boards_preview(client: AsyncClient, db_session: AsyncSession):
+    """목록의 내용은 100자 미리보기 + '...'"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    await client.post("/api/v1/boards", json={"title": "긴 글", "content": "가" * 150}, headers=headers)
+    await client.post("/api/v1/boards", json={"title": "짧은 글", "content": "나" * 100}, headers=headers)
+
+    items = (await client.get("/api/v1/boards")).json()["items"]
+    assert items[0]["content"] == "나" * 100
+    assert items[1]["content"] == "가" * 100 + "..."
+    assert items[1]["author_name"] == "테스터"
+
+
+# ===== ETag / 조건부 GET =====
+
+@pytest.mark.asyncio
+async def test_get_board_detail_not_modified(client: AsyncClient, db_session: AsyncSession):
+    """상세 ETag 일치 시 304, 304 응답도 조회수에 집계"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    create_res = await client.post("/api/v1/boards", json={"title": "ETag", "content": "내용"}, headers=headers)
+    board_id = create_res.json()["id"]
+
+    first = await client.get(f"/api/v1/boards/{board_id}")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    response = await client.get(f"/api/v1/boards/{board_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # 작성자 여부가 다르면 ETag도 다름
+    response = await client.get(
+        f"/api/v1/boards/{board_id}", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["view_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_board_detail_repeated_revalidation(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """연속 조건부 요청은 다른 사용자의 조회가 있어도 계속 304 (조회수는 ETag에 미포함)"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    create_res = await client.post(
+        "/api/v1/boards", json={"title": "ETag", "content": "내용"}, headers=headers
+    )
+    board_id = create_res.json()["id"]
+
+    etag = (await client.get(f"/api/v1/boards/{board_id}")).headers["ETag"]
+    statuses = []
+    for _ in range(6):
+        # 다른 사용자의 조회
+        await client.get(f"/api/v1/boards/{board_id}")
+        response = await client.get(
+            f"/api/v1/boards/{board_id}", headers={"If-None-Match": etag}
+        )
+        statuses.append(response.status_code)
+        assert response.headers["ETag"] == etag
+    assert statuses == [304] * 6
+
+    # 수정되면 200
+    await client.put(
+        f"/api/v1/boards/{board_id}", json={"title": "수정"}, headers=headers
+    )
+    response = await client.get(
+        f"/api/v1/boards/{board_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["view_count"] == 14
+
+
+@pytest.mark.asyncio
+async def test_get_boards_repeated_revalidation(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """조회수 반영(flush) 후에도 목록 연속 조건부 요청은 304, 조회수순 순서가 바뀌면 200"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(2)]
+    created = await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=headers
+    )
+    ids = [item["id"] for item in created.json()["created"]]
+
+    latest = (await client.get("/api/v1/boards")).headers["ETag"]
+    by_views = (await client.get("/api/v1/boards?sort=views")).headers["ETag"]
+    repository = BoardRepository(db_session)
+    for _ in range(3):
+        # 조회수 flush와 같은 경로로 반영 (updated_at 유지), 목록 캐시는 TTL 만료
+        await repository.increment_view_counts({ids[-1]: 1})
+        await db_session.commit()
+        board_list_cache.invalidate()
+        response = await client.get(
+            "/api/v1/boards", headers={"If-None-Match": latest}
+        )
+        assert response.status_code == 304
+        response = await client.get(
+            "/api/v1/boards?sort=views", headers={"If-None-Match": by_views}
+        )
+        assert response.status_code == 304
+
+    await repository.increment_view_counts({ids[0]: 10})
+    await db_session.commit()
+    response = await client.get(
+        "/api/v1/boards?sort=views", headers={"If-None-Match": by_views}
+    )
+    assert response.status_code == 200
+    assert response.json()["items"][0]["id"] == ids[0]
+
+
+@pytest.mark.asyncio
+async def test_get_boards_not_modified(client: AsyncClient, db_session: AsyncSession):
+    """목록 ETag 일치 시 304, 게시글 작성 후에는 200"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    await client.post("/api/v1/boards", json={"title": "제목", "content": "내용"}, headers=headers)
+
+    etag = (await client.get("/api/v1/boards")).headers["ETag"]
+    response = await client.get("/api/v1/boards", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.post("/api/v1/boards", json={"title": "새 글", "content": "내용"}, headers=headers)
+    response = await client.get("/api/v1/boards", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+# ===== 인기 게시글 =====
+
+@pytest.mark.asyncio
+async def test_trending_boards(client: AsyncClient, db_session: AsyncSession):
+    """상세 조회 수에 따라 정렬, 수정/삭제 반영"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(3)]
+    created = (await client.post("/api/v1/boards/bulk", json={"items": items}, headers=headers)).json()
+    ids = [item["id"] for item in created["created"]]
+
+    for board_id, views in zip(ids, (1, 3, 2)):
+        for _ in range(views):
+            await client.get(f"/api/v1/boards/{board_id}")
+
+    response = await client.get("/api/v1/boards/trending", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()["items"]
+    assert [item["id"] for item in data] == [ids[1], ids[2]]
+    assert data[0]["view_count"] == 3
+    assert data[0]["author_name"] == "테스터"
+    assert data[0]["score"] > data[1]["score"]
+
+    await client.put(f"/api/v1/boards/{ids[1]}", json={"title": "수정"}, headers=headers)
+    await client.delete(f"/api/v1/boards/{ids[2]}", headers=headers)
+    data = (await client.get("/api/v1/boards/trending")).json()["items"]
+    assert [(item["id"], item["title"]) for item in data] == [(ids[1], "수정"), (ids[0], "제목 0")]
+
+
+# ===== 게시글 검색 =====
+
+@pytest.mark.asyncio
+async def test_search_boards(client: AsyncClient, db_session: AsyncSession):
+    """조사 붙은 단어 일치, 제목 일치 우선, 삭제 글 제외"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    items = [
+        {"title": "가죽 가방 판매", "content": "상태 좋습니다"},
+        {"title": "신발 판매", "content": "가방을 함께 드립니다"},
+        {"title": "노트북 판매", "content": "관련 없음"},
+        {"title": "가방 삭제 예정", "content": "삭제"},
+    ]
+    created = (await client.post("/api/v1/boards/bulk", json={"items": items}, headers=headers)).json()
+    await client.delete(f"/api/v1/boards/{created['created'][3]['id']}", headers=headers)
+
+    response = await client.get("/api/v1/boards/search", params={"q": "가방"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["title"] for item in data["items"]] == ["가죽 가방 판매", "신발 판매"]
+    assert data["has_more"] is False
+
+    response = await client.get("/api/v1/boards/search", params={"q": "가방 신발"})
+    assert [item["title"] for item in response.json()["items"]] == ["신발 판매"]
+
+    response = await client.get("/api/v1/boards/search", params={"q": "!!!"})
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_boards_pagination(client: AsyncClient, db_session: AsyncSession):
+    """(관련도, ID) 커서로 중복/누락 없이 페이지 이동"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    items = [{"title": f"상품 {i}", "content": "상품 설명" if i % 2 else "설명"} for i in range(7)]
+    await client.post("/api/v1/boards/bulk", json={"items": items}, headers=headers)
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": "상품", "limit": 3, **({"cursor": cursor} if cursor else {})}
+        data = (await client.get("/api/v1/boards/search", params=params)).json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not data["has_more"]:
+            break
+    assert len(seen) == len(set(seen)) == 7
+
+    response = await client.get("/api/v1/boards/search", params={"q": "상품", "cursor": "invalid"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_boards_window(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    """최근 범위부터 넓혀 가며 검색해도 첫 후보 구간은 전체 중 최신 SEARCH_MAX_CANDIDATES건"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    # 일치 게시글이 드문드문 있도록 섞어서 작성
+    items = [{"title": "상품" if i % 3 == 0 else "기타", "content": "설명"} for i in range(12)]
+    created = (await client.post("/api/v1/boards/bulk", json={"items": items}, headers=headers)).json()
+    matched = sorted((c["id"] for c, item in zip(created["created"], items) if item["title"] == "상품"), reverse=True)
+
+    monkeypatch.setattr(settings, "SEARCH_MAX_CANDIDATES", 3)
+    monkeypatch.setattr(settings, "SEARCH_WINDOW_SIZE", 2)
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": "상품", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        data = (await client.get("/api/v1/boards/search", params=params)).json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not data["has_more"]:
+            break
+    assert sorted(seen[:3], reverse=True) == matched[:3]
+    assert sorted(seen, reverse=True) == matched
+
+
+async def _search_all(client: AsyncClient, q: str, limit: int) -> list:
+    """next_cursor를 따라 마지막 페이지까지 검색 결과 수집"""
+    seen, cursor = [], None
+    while True:
+        params = {"q": q, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/boards/search", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(data["items"])
+        cursor = data["next_cursor"]
+        if not data["has_more"]:
+            assert cursor is None
+            return seen
+
+
+@pytest.mark.asyncio
+async def test_search_boards_beyond_max_candidates(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    """일치 게시글이 SEARCH_MAX_CANDIDATES건보다 많으면 더 오래된 후보 구간으로 이어서 조회"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    # 제목 일치(관련도 높음)와 내용 일치를 섞어서 작성
+    items = [
+        {"title": "상품" if i % 2 else "기타", "content": "상품 설명"}
+        for i in range(8)
+    ]
+    created = await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=headers
+    )
+    ids = sorted((c["id"] for c in created.json()["created"]), reverse=True)
+    monkeypatch.setattr(settings, "SEARCH_MAX_CANDIDATES", 3)
+
+    for limit in (2, 3, 10):
+        seen = [item["id"] for item in await _search_all(client, "상품", limit)]
+        assert len(seen) == len(set(seen))
+        assert set(seen) == set(ids)
+        # 후보 구간(최신 3건씩) 순서로 이어지고, 구간 안에서는 관련도순
+        windows = [ids[i:i + 3] for i in range(0, len(ids), 3)]
+        assert [set(seen[i:i + 3]) for i in range(0, len(seen), 3)] == [
+            set(window) for window in windows
+        ]
+
+
+# ===== 게시글 내보내기 =====
+
+async def create_admin_user(db: AsyncSession) -> User:
+    """테스트용 관리자 생성"""
+    user = await create_test_user(db, email="admin@example.com", username="관리자")
+    user.is_admin = True
+    await db.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_export_boards_ndjson(client: AsyncClient, db_session: AsyncSession):
+    """NDJSON 내보내기 (ID 오름차순, 작성자 필터)"""
+    admin = await create_admin_user(db_session)
+    writer = await create_test_user(db_session)
+    for user in (writer, admin, writer):
+        await client.post(
+            "/api/v1/boards", json={"title": "제목", "content": "가" * 150},
+            headers=get_auth_header(user.id),
+        )
+
+    response = await client.get("/api/v1/boards/export", headers=get_auth_header(admin.id))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "attachment" in response.headers["content-disposition"]
+    assert "content-encoding" not in response.headers  # no_compression
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 3
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    assert rows[0]["content"] == "가" * 150  # 미리보기가 아닌 본문 전체
+    assert rows[0]["author_name"] == "테스터"
+
+    response = await client.get(
+        "/api/v1/boards/export", params={"user_id": writer.id}, headers=get_auth_header(admin.id)
+    )
+    assert len(response.text.splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_boards_csv_created_range(client: AsyncClient, db_session: AsyncSession):
+    """CSV 내보내기 (헤더 포함, 작성 시각 범위 필터)"""
+    admin = await create_admin_user(db_session)
+    headers = get_auth_header(admin.id)
+    await client.post("/api/v1/boards", json={"title": "제목, 쉼표", "content": "내용"}, headers=headers)
+
+    response = await client.get("/api/v1/boards/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["id", "user_id", "author_name", "title", "content",
+                       "view_count", "created_at", "updated_at"]
+    assert rows[1][3] == "제목, 쉼표"
+
+    response = await client.get(
+        "/api/v1/boards/export",
+        params={"format": "csv", "created_from": "2999-01-01T00:00:00+09:00"},
+        headers=headers,
+    )
+    assert len(list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))) == 1
+
+
+@pytest.mark.asyncio
+async def test_export_boards_admin_only(client: AsyncClient, db_session: AsyncSession):
+    """비로그인 401, 일반 사용자 403"""
+    user = await create_test_user(db_session)
+
+    response = await client.get("/api/v1/boards/export")
+    assert response.status_code == 401
+
+    response = await client.get("/api/v1/boards/export", headers=get_auth_header(user.id))
+    assert response.status_code == 403
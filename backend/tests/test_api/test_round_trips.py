@@ -0,0 +1,173 @@
+"""
+엔드포인트별 DB 왕복 수 테스트
+
+운영과 같은 세션 모드(읽기: 복제본 라우터 세션, 쓰기: unit_of_work)로
+요청당 서버에 보내는 SQL 문(BEGIN/COMMIT 포함) 수를 검증한다.
+prepared statement의 prepare 단계는 커넥션별 statement cache에 의해 한 번만 발생하므로 제외.
+"""
+import asyncio
+from typing import AsyncGenerator, List, Optional, Tuple
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.deps import get_current_user_id_optional, get_db_session, get_read_db_session
+from app.config import settings
+from app.core.cache import board_list_cache, user_cache
+from app.core.replicas import ReplicaRouter
+from app.database import unit_of_work
+from app.main import app
+from tests.test_api.test_boards import create_test_user, get_auth_header
+
+
+class RoundTrips:
+    """서버로 보낸 SQL 문의 첫 키워드 기록"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def record(self, statement: str) -> None:
+        self.statements.append(statement.split(None, 1)[0].rstrip(";").upper())
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+async def _client_with(
+    read_only_transactions: bool,
+) -> AsyncGenerator[Tuple[AsyncClient, RoundTrips], None]:
+    engine = create_async_engine(
+        settings.DATABASE_URL_TEST or settings.DATABASE_URL,
+        pool_pre_ping=False,
+    )
+    trips = RoundTrips()
+
+    # prepared statement 실행 (SELECT/INSERT/UPDATE)
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        trips.record(statement)
+
+    # 트랜잭션 제어문 (BEGIN/COMMIT/ROLLBACK)은 asyncpg 쿼리 로거로 기록
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection._connection.add_query_logger(lambda record: trips.record(record.query))
+
+    router = ReplicaRouter(engine, read_only_transactions=read_only_transactions)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    async def override_get_db_session():
+        async with unit_of_work(session_factory) as session:
+            yield session
+
+    async def override_get_read_db_session(
+        user_id: Optional[int] = Depends(get_current_user_id_optional),
+    ):
+        async with router.session(user_id) as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_db_session] = override_get_read_db_session
+
+    # 커넥션 초기화 쿼리가 집계되지 않도록 미리 연결
+    async with engine.connect():
+        pass
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac, trips
+
+    app.dependency_overrides.clear()
+    board_list_cache.invalidate()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def counting_client(db_session: AsyncSession):
+    async for value in _client_with(read_only_transactions=False):
+        yield value
+
+
+@pytest_asyncio.fixture(scope="function")
+async def read_only_counting_client(db_session: AsyncSession):
+    async for value in _client_with(read_only_transactions=True):
+        yield value
+
+
+async def _measure(trips: RoundTrips, request) -> Tuple[int, List[str]]:
+    user_cache.clear()
+    board_list_cache.invalidate()
+    trips.reset()
+    response = await request
+    await asyncio.sleep(0)  # asyncpg 쿼리 로거 콜백은 call_soon으로 실행됨
+    return response.status_code, list(trips.statements)
+
+
+@pytest.mark.asyncio
+async def test_round_trips_per_endpoint(counting_client, db_session: AsyncSession):
+    """읽기는 쿼리만 (BEGIN/COMMIT 없음), 쓰기는 BEGIN ... COMMIT 1회 (수정/삭제는 작성자 확인 포함 UPDATE 1회)"""
+    client, trips = counting_client
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    status, statements = await _measure(trips, client.post(
+        "/api/v1/boards", json={"title": "제목", "content": "내용"}, headers=headers
+    ))
+    assert status == 201
+    assert statements == ["BEGIN", "SELECT", "INSERT", "COMMIT"]
+    board_id = (await client.get("/api/v1/boards")).json()["items"][0]["id"]
+
+    # 일괄 작성은 항목 수와 관계없이 INSERT 1회
+    status, statements = await _measure(trips, client.post(
+        "/api/v1/boards/bulk",
+        json={"items": [{"title": f"제목 {i}", "content": "내용"} for i in range(3)]},
+        headers=headers,
+    ))
+    assert status == 201
+    assert statements == ["BEGIN", "SELECT", "INSERT", "COMMIT"]
+
+    status, statements = await _measure(trips, client.get("/api/v1/boards"))
+    assert status == 200
+    assert statements == ["SELECT"]
+
+    status, statements = await _measure(trips, client.get(f"/api/v1/boards/{board_id}"))
+    assert status == 200
+    assert statements == ["SELECT"]
+
+    status, statements = await _measure(trips, client.get("/api/v1/auth/me", headers=headers))
+    assert status == 200
+    assert statements == ["SELECT"]
+
+    status, statements = await _measure(trips, client.get(f"/api/v1/users/{user.id}/boards"))
+    assert status == 200
+    assert statements == ["SELECT"]
+
+    # 인기 게시글은 메모리에서 응답
+    status, statements = await _measure(trips, client.get("/api/v1/boards/trending"))
+    assert status == 200
+    assert statements == []
+
+    status, statements = await _measure(trips, client.put(
+        f"/api/v1/boards/{board_id}", json={"title": "수정"}, headers=headers
+    ))
+    assert status == 200
+    assert statements == ["BEGIN", "SELECT", "UPDATE", "COMMIT"]
+
+    status, statements = await _measure(trips, client.delete(
+        f"/api/v1/boards/{board_id}", headers=headers
+    ))
+    assert status == 204
+    assert statements == ["BEGIN", "SELECT", "UPDATE", "COMMIT"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_transaction_mode(read_only_counting_client):
+    """DB_READ_ONLY_TRANSACTIONS: 읽기는 BEGIN READ ONLY 후 rollback"""
+    client, trips = read_only_counting_client
+
+    status, statements = await _measure(trips, client.get("/api/v1/boards"))
+    assert status == 200
+    assert statements == ["BEGIN", "SELECT", "ROLLBACK"]
@@ -0,0 +1,70 @@
+"""
+사용자 API 엔드포인트 테스트 (작성자별 게시글)
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.test_api.test_boards import create_test_user, get_auth_header
+
+
+async def _create_boards(client: AsyncClient, user_id: int, count: int) -> list:
+    """게시글 일괄 작성 후 ID 목록 반환"""
+    items = [{"title": f"제목 {i}", "content": "내용"} for i in range(count)]
+    response = await client.post(
+        "/api/v1/boards/bulk", json={"items": items}, headers=get_auth_header(user_id)
+    )
+    return [item["id"] for item in response.json()["created"]]
+
+
+@pytest.mark.asyncio
+async def test_get_user_boards(client: AsyncClient, db_session: AsyncSession):
+    """작성자 게시글만 최신순, 삭제 글 제외, 커서 페이지네이션"""
+    writer = await create_test_user(db_session)
+    other = await create_test_user(db_session, email="other@example.com", username="다른사람")
+    ids = await _create_boards(client, writer.id, 4)
+    await _create_boards(client, other.id, 2)
+    await client.delete(f"/api/v1/boards/{ids[1]}", headers=get_auth_header(writer.id))
+
+    response = await client.get(f"/api/v1/users/{writer.id}/boards", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [ids[3], ids[2]]
+    assert all(item["author_name"] == "테스터" for item in data["items"])
+    assert data["has_more"] is True
+
+    response = await client.get(
+        f"/api/v1/users/{writer.id}/boards", params={"limit": 2, "cursor": data["next_cursor"]}
+    )
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [ids[0]]
+    assert data["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_user_boards_empty_and_not_found(client: AsyncClient, db_session: AsyncSession):
+    """게시글 없는 사용자는 빈 목록, 없는 사용자는 404"""
+    user = await create_test_user(db_session)
+
+    response = await client.get(f"/api/v1/users/{user.id}/boards")
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+    response = await client.get(f"/api/v1/users/{user.id + 1000}/boards")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_my_boards(client: AsyncClient, db_session: AsyncSession):
+    """내 게시글 목록 (인증 필요)"""
+    user = await create_test_user(db_session)
+    other = await create_test_user(db_session, email="other@example.com", username="다른사람")
+    ids = await _create_boards(client, user.id, 2)
+    await _create_boards(client, other.id, 1)
+
+    response = await client.get("/api/v1/users/me/boards", headers=get_auth_header(user.id))
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == ids[::-1]
+
+    response = await client.get("/api/v1/users/me/boards")
+    assert response.status_code == 401
@@ -0,0 +1,68 @@
+"""
+부하 테스트 하네스 테스트 (시나리오 동작, 기준값 회귀 판정)
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.loadtest import SCENARIOS, Context, compare, run_scenario
+from tests.test_api.test_boards import create_test_user, get_auth_header
+
+
+def _endpoint(p50: float, p95: float, rps: float) -> dict:
+    return {"requests": 100, "errors": 0, "rps": rps, "p50": p50, "p95": p95, "p99": p95}
+
+
+def test_compare_detects_latency_and_throughput_regressions():
+    baseline = {"list_scroll": {"GET /boards": _endpoint(10.0, 20.0, 100.0)}}
+
+    # 허용 범위: p50 <= 10 * 1.3 + 2, p95 <= 20 * 1.3 + 2, rps >= 70
+    ok = {"list_scroll": {"GET /boards": _endpoint(14.9, 27.9, 71.0)}}
+    assert compare(baseline, ok, tolerance=0.3, slack_ms=2.0) == []
+
+    slow = {"list_scroll": {"GET /boards": _endpoint(16.0, 20.0, 60.0)}}
+    regressions = compare(baseline, slow, tolerance=0.3, slack_ms=2.0)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("list_scroll GET /boards p50")
+    assert regressions[1].startswith("list_scroll GET /boards rps")
+
+
+def test_compare_ignores_endpoints_missing_from_baseline():
+    baseline = {"list_scroll": {"GET /boards": _endpoint(10.0, 20.0, 100.0)}}
+    results = {
+        "list_scroll": {"GET /boards?cursor": _endpoint(100.0, 200.0, 1.0)},
+        "create_post": {"POST /boards": _endpoint(100.0, 200.0, 1.0)},
+    }
+    assert compare(baseline, results) == []
+
+
+@pytest.mark.asyncio
+async def test_scenarios_run_against_app(client: AsyncClient, db_session: AsyncSession):
+    """모든 시나리오가 오류 없이 요청하고 엔드포인트별로 집계 (테스트 세션 공유로 worker 1개)"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+    response = await client.post(
+        "/api/v1/boards/bulk",
+        json={"items": [{"title": f"제목 {i}", "content": "내용"} for i in range(45)]},
+        headers=headers,
+    )
+    ctx = Context(
+        user_id=user.id,
+        email=user.email,
+        headers=headers,
+        board_ids=[item["id"] for item in response.json()["created"]],
+    )
+
+    expected = {
+        "list_scroll": {"GET /boards", "GET /boards?cursor"},
+        "detail_view": {"GET /boards/{id}"},
+        "login_storm": {"POST /auth/login"},
+        "create_post": {"POST /boards"},
+    }
+    for name, scenario in SCENARIOS.items():
+        results = await run_scenario(client, scenario, ctx, concurrency=1, duration=0.2, warmup=0)
+        assert set(results) == expected[name]
+        for endpoint in results.values():
+            assert endpoint["requests"] > 0
+            assert endpoint["errors"] == 0
+            assert endpoint["p50"] <= endpoint["p95"] <= endpoint["p99"]
@@ -0,0 +1,61 @@
+"""
+대용량 합성 데이터 생성기 테스트
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.security import verify_password
+from app.models.board import Board
+from app.models.user import User
+from benchmarks.seed import PASSWORD, generate_boards, parse_args, seed, seeded_password_hash
+
+START = datetime(2026, 1, 1)
+
+
+def test_generate_boards_is_deterministic_and_ordered():
+    """같은 seed/배치는 같은 행, ID 순서 = 작성 시각 순서"""
+    args = (42, 3, 101, 500, 1, 50, START, 60.0, 0.1)
+    rows = generate_boards(*args)
+    assert rows == generate_boards(*args)
+    assert rows != generate_boards(43, *args[1:])
+
+    assert [row[0] for row in rows] == list(range(101, 601))
+    created = [row[5] for row in rows]
+    assert created == sorted(created)
+    assert all(1 <= row[1] <= 50 for row in rows)
+    assert all(len(row[2]) <= 200 for row in rows)
+    assert all(row[6] >= row[5] for row in rows)
+    assert 0 < sum(row[7] is not None for row in rows) < 100
+
+
+def test_seeded_password_hash():
+    hashed = seeded_password_hash(42)
+    assert hashed == seeded_password_hash(42)
+    assert verify_password(PASSWORD, hashed)
+
+
+@pytest.mark.asyncio
+async def test_seed_loads_tables_and_restores_indexes(db_session: AsyncSession):
+    """COPY 적재 후 인덱스 재생성, 시퀀스 조정"""
+    index_query = text("SELECT count(*) FROM pg_indexes WHERE tablename = 'boards'")
+    indexes = (await db_session.execute(index_query)).scalar_one()
+    await db_session.commit()
+
+    await seed(parse_args([
+        "--users", "20", "--boards", "300", "--batch-size", "70", "--workers", "2",
+        "--database-url", settings.DATABASE_URL_TEST or settings.DATABASE_URL,
+        "--until", "2026-01-01",
+    ]))
+
+    assert (await db_session.execute(select(func.count()).select_from(User))).scalar_one() == 20
+    assert (await db_session.execute(select(func.count()).select_from(Board))).scalar_one() == 300
+    assert (await db_session.execute(index_query)).scalar_one() == indexes
+
+    # 적재 후 일반 INSERT는 다음 ID 사용
+    max_id = (await db_session.execute(select(func.max(Board.id)))).scalar_one()
+    next_id = (await db_session.execute(text("SELECT nextval('boards_id_seq')"))).scalar_one()
+    assert next_id == max_id + 1
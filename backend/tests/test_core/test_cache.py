@@ -0,0 +1,67 @@
+"""
+인메모리 TTL/LRU 캐시 테스트
+"""
+from app.core.cache import TTLCache
+
+
+class FakeTimer:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction():
+    """maxsize 초과 시 가장 오래 사용되지 않은 항목 제거"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_expiry_and_stats():
+    """TTL 경과 시 만료, hit/miss 카운트"""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=5, timer=timer)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    assert cache.get("a") == 1
+    timer.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    assert cache.stats["hits"] == 2
+    assert cache.stats["misses"] == 1
+    assert len(cache) == 1
+
+
+def test_invalidate_and_disabled():
+    """명시적 무효화 및 maxsize=0 비활성화"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    disabled = TTLCache(maxsize=0, ttl=60)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+
+def test_invalidate_where():
+    """조건에 맞는 항목만 삭제"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    for key, value in (("a", 1), ("b", 2), ("c", 1)):
+        cache.set(key, value)
+
+    assert cache.invalidate_where(lambda key, value: value == 1) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
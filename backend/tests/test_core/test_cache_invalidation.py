@@ -0,0 +1,81 @@
+"""
+프로세스 간 캐시 무효화 (LISTEN/NOTIFY) 테스트
+"""
+import asyncio
+
+import asyncpg
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.cache import token_cache, user_cache
+from app.core.cache_invalidation import CacheInvalidationListener
+from app.schemas.user import UserUpdate
+from app.services.user import UserService
+from tests.test_api.test_boards import create_test_user
+
+TEST_URL = settings.DATABASE_URL_TEST or settings.DATABASE_URL
+
+
+async def _wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        if condition():
+            return True
+        await asyncio.sleep(0.02)
+    return condition()
+
+
+@pytest.mark.asyncio
+async def test_user_update_notifies_on_commit_only(db_session: AsyncSession):
+    """사용자 변경 NOTIFY는 커밋된 경우에만 전달"""
+    user = await create_test_user(db_session)
+    user_id = user.id
+    listener = CacheInvalidationListener(url=TEST_URL)
+    received = []
+    connection = await asyncpg.connect(listener.dsn)
+    await connection.add_listener(
+        settings.CACHE_INVALIDATION_CHANNEL,
+        lambda conn, pid, channel, payload: received.append(payload),
+    )
+    try:
+        service = UserService(db_session)
+        await service.update(user, UserUpdate(username="롤백"))
+        await db_session.rollback()
+        await asyncio.sleep(0.2)
+        assert received == []
+
+        user = await service.get_by_id(user_id)
+        await service.update(user, UserUpdate(is_active=False))
+        await db_session.commit()
+        assert await _wait_until(lambda: received == [str(user_id)])
+    finally:
+        await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_listener_invalidates_user_and_tokens(db_session: AsyncSession):
+    """다른 프로세스의 NOTIFY로 사용자 캐시와 해당 사용자 토큰 캐시 삭제"""
+    listener = CacheInvalidationListener(url=TEST_URL)
+    listener.start()
+    try:
+        await asyncio.wait_for(listener.connected.wait(), timeout=5)
+        user_cache.set(987654, {"id": 987654})
+        token_cache.set("token-a", {"sub": "987654"})
+        token_cache.set("token-b", {"sub": "1"})
+
+        connection = await asyncpg.connect(listener.dsn)
+        try:
+            await connection.execute(
+                "SELECT pg_notify($1, $2)", listener.channel, "987654"
+            )
+        finally:
+            await connection.close()
+
+        assert await _wait_until(lambda: user_cache.get(987654) is None)
+        assert token_cache.get("token-a") is None
+        assert token_cache.get("token-b") == {"sub": "1"}
+    finally:
+        await listener.stop()
+        token_cache.invalidate("token-b")
+    assert not listener.connected.is_set()
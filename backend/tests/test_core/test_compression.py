@@ -0,0 +1,116 @@
+"""
+응답 압축 미들웨어 테스트
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.compression import (
+    CompressionMiddleware,
+    CompressionStats,
+    no_compression,
+    select_encoding,
+)
+
+LARGE = "가나다라마바사" * 500
+
+
+def create_app(stats: CompressionStats) -> FastAPI:
+    """테스트용 앱"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, stats=stats)
+
+    @app.get("/large")
+    async def large():
+        return {"content": LARGE}
+
+    @app.get("/small")
+    async def small():
+        return {"content": "작음"}
+
+    @app.get("/image")
+    async def image():
+        return Response(b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/opt-out")
+    @no_compression
+    async def opt_out():
+        return PlainTextResponse(LARGE)
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(100):
+                yield f'{{"line": {i}, "content": "{LARGE[:50]}"}}\n'
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+@pytest.fixture
+def stats() -> CompressionStats:
+    return CompressionStats()
+
+
+@pytest.fixture
+async def app_client(stats: CompressionStats):
+    transport = ASGITransport(app=create_app(stats))
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+def test_select_encoding():
+    """서버 선호 순서 + q값 협상"""
+    assert select_encoding("gzip, deflate", ["br", "gzip"]) == "gzip"
+    assert select_encoding("gzip;q=0, identity", ["gzip"]) is None
+    assert select_encoding("*", ["gzip"]) == "gzip"
+    assert select_encoding("", ["gzip"]) is None
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_json(app_client: AsyncClient, stats: CompressionStats):
+    """최소 크기 이상 JSON 응답은 gzip 압축"""
+    response = await app_client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["content"] == LARGE
+
+    snapshot = stats.snapshot()["gzip"]
+    assert snapshot["responses"] == 1
+    assert snapshot["ratio"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_skips_small_disallowed_and_opt_out(app_client: AsyncClient, stats: CompressionStats):
+    """작은 응답, 허용되지 않은 Content-Type, 제외 라우트는 압축하지 않음"""
+    for path in ("/small", "/image", "/opt-out"):
+        response = await app_client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+    assert stats.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_compresses_streaming_response(app_client: AsyncClient):
+    """스트리밍 응답은 청크 단위 압축"""
+    response = await app_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert len(response.text.splitlines()) == 100
+
+
+@pytest.mark.asyncio
+async def test_no_accept_encoding(app_client: AsyncClient):
+    """Accept-Encoding이 없으면 압축하지 않음"""
+    response = await app_client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.json()["content"] == LARGE
+
+
+@pytest.mark.asyncio
+async def test_prefers_brotli_when_installed(app_client: AsyncClient):
+    """brotli 설치 시 서버 선호 순서에 따라 br 사용"""
+    pytest.importorskip("brotli")
+    response = await app_client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.json()["content"] == LARGE
@@ -0,0 +1,19 @@
+"""
+불투명 커서 테스트
+"""
+import pytest
+
+from app.core.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """float 정렬 키도 정확히 복원"""
+    cursor = encode_cursor(0.1 + 0.2, 123)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == [0.1 + 0.2, 123]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", encode_cursor(1), encode_cursor({"a": 1}), "!!!"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
@@ -0,0 +1,36 @@
+"""
+DB 커넥션 풀 계측 테스트
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.core.db_pool import pool_status, prewarm_pool
+from app.database import build_engine
+
+
+@pytest.mark.asyncio
+async def test_prewarm_and_pool_status():
+    """pre-warm 후 유휴 커넥션 수, 체크아웃 통계"""
+    engine = build_engine(settings.DATABASE_URL_TEST or settings.DATABASE_URL)
+    try:
+        assert await prewarm_pool(engine, 2) == 2
+
+        status = pool_status(engine)
+        assert status["pool_class"] == "InstrumentedQueuePool"
+        assert status["idle"] == 2
+        assert status["checked_out"] == 0
+        assert status["checkouts"] == 2
+
+        async with engine.connect():
+            assert pool_status(engine)["checked_out"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_db_pool_status_endpoint(client: AsyncClient):
+    """/health/db 풀 상태 조회"""
+    response = await client.get("/health/db")
+    assert response.status_code == 200
+    assert response.json()["size"] == settings.DB_POOL_SIZE
@@ -0,0 +1,23 @@
+"""
+ETag 유틸리티 테스트
+"""
+from app.core.etag import etag_matches, make_etag
+
+
+def test_make_etag():
+    """같은 값이면 같은 ETag, 약한/강한 ETag 형식"""
+    assert make_etag(1, "a") == make_etag(1, "a")
+    assert make_etag(1, "a") != make_etag(1, "b")
+    assert make_etag(1).startswith('W/"')
+    assert make_etag(1, weak=False).startswith('"')
+
+
+def test_etag_matches():
+    """If-None-Match 목록, *, 약한 비교"""
+    etag = make_etag(1)
+    strong = etag.removeprefix("W/")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {strong}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
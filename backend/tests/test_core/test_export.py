@@ -0,0 +1,74 @@
+"""
+내보내기 인코딩 및 스냅샷 세션 스트리밍 테스트
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.export import encode_csv, encode_ndjson, export_chunks
+from app.core.replicas import ReplicaRouter
+from app.database import build_engine
+from app.repositories.board import BoardRepository
+from app.schemas.board import BoardCreate
+from app.services.board import EXPORT_FIELDS
+from tests.test_api.test_boards import create_test_user
+
+
+async def _partitions(batches):
+    for rows in batches:
+        yield rows
+
+
+@pytest.mark.asyncio
+async def test_export_chunks_one_chunk_per_batch(db_session: AsyncSession):
+    """배치 하나당 청크 하나, CSV는 빈 결과에도 헤더 출력"""
+    user = await create_test_user(db_session)
+    await BoardRepository(db_session).bulk_create(
+        user.id, [BoardCreate(title=f"제목 {i}", content="내용") for i in range(5)]
+    )
+    await db_session.commit()
+
+    repository = BoardRepository(db_session)
+    batches = [rows async for rows in repository.stream_for_export(batch_size=2)]
+    assert [len(rows) for rows in batches] == [2, 2, 1]
+
+    chunks = [chunk async for chunk in export_chunks(_partitions(batches), "ndjson", EXPORT_FIELDS)]
+    assert len(chunks) == 3
+    assert chunks[0].count(b"\n") == 2
+
+    chunks = [chunk async for chunk in export_chunks(_partitions([]), "csv", EXPORT_FIELDS)]
+    assert chunks == [encode_csv((), EXPORT_FIELDS)]
+    assert chunks[0].startswith("\ufeffid,user_id".encode())
+
+
+def test_encode_ndjson_datetime():
+    class FakeRow:
+        def _asdict(self):
+            return {"id": 1, "created_at": datetime(2024, 1, 2, 3, 4, 5)}
+
+    assert encode_ndjson([FakeRow()]) == b'{"id":1,"created_at":"2024-01-02T03:04:05"}\n'
+
+
+@pytest.mark.asyncio
+async def test_snapshot_session_streams_with_server_side_cursor(db_session: AsyncSession):
+    """스냅샷 세션(REPEATABLE READ, READ ONLY)에서 서버 사이드 커서 스트리밍"""
+    user = await create_test_user(db_session)
+    await BoardRepository(db_session).bulk_create(
+        user.id, [BoardCreate(title="제목", content="내용") for _ in range(3)]
+    )
+    await db_session.commit()
+
+    engine = build_engine(settings.DATABASE_URL_TEST or settings.DATABASE_URL)
+    try:
+        router = ReplicaRouter(engine)
+        async with router.session(snapshot=True) as session:
+            rows = [
+                row
+                async for rows in BoardRepository(session).stream_for_export(batch_size=2)
+                for row in rows
+            ]
+        assert len(rows) == 3
+    finally:
+        await engine.dispose()
@@ -0,0 +1,46 @@
+"""
+Prometheus 메트릭 테스트
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import MetricsRegistry
+
+
+def test_counter_and_histogram_render():
+    """카운터/히스토그램 text format (누적 버킷, 라벨 이스케이프)"""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "요청 수", ("route",))
+    histogram = registry.histogram("latency_seconds", "처리 시간", buckets=(0.1, 1.0))
+
+    counter.inc(('/a"b',))
+    counter.inc(('/a"b',))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    text = registry.render()
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{route="/a\\"b"} 2' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert "latency_seconds_sum 5.55" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """요청 후 /metrics에 라우트 템플릿 라벨로 집계"""
+    await client.get("/api/v1/boards/99999")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/boards/{board_id}",status="404"}' in text
+    )
+    assert "http_requests_in_flight 1" in text  # /metrics 요청 자신
+    assert 'db_pool_connections{state="size"}' in text
+    assert 'cache_hit_ratio{cache="user"}' in text
@@ -0,0 +1,49 @@
+"""
+요청별 SQL 계측 테스트
+"""
+import logging
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.query_stats import QueryStats
+
+
+def test_query_stats_record():
+    """쿼리 수, 총 시간, 가장 느린 쿼리 집계"""
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.002)
+    stats.record("SELECT 2", 0.010)
+    stats.record("SELECT 3", 0.001)
+
+    assert stats.count == 3
+    assert stats.slowest_statement == "SELECT 2"
+    assert stats.server_timing(0.05) == 'db;dur=13.00;desc="3 queries", app;dur=50.00'
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient, caplog):
+    """응답에 Server-Timing 헤더, 요청 로그에 DB 필드 기록"""
+    with caplog.at_level(logging.INFO, logger="app.request"):
+        response = await client.get("/api/v1/boards")
+
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+    record = next(r for r in caplog.records if r.name == "app.request")
+    assert record.path == "/api/v1/boards"
+    assert record.db_queries == 1
+    assert record.db_slowest_statement.startswith("SELECT")
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(db_session: AsyncSession, monkeypatch, caplog):
+    """임계치 이상 쿼리는 느린 쿼리 로그에 기록"""
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+    with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+        await db_session.execute(text("SELECT pg_sleep(0.01)"))
+
+    record = next(r for r in caplog.records if r.name == "app.slow_query")
+    assert record.duration_ms >= 10
+    assert "pg_sleep" in record.statement
@@ -0,0 +1,35 @@
+"""
+JSON 응답 유틸리티 테스트
+"""
+import json
+from datetime import datetime
+
+from app.core.responses import ModelJSONResponse, dump_json
+from app.schemas.board import BoardListItem, BoardListResponse
+
+
+def test_dump_json_matches_pydantic():
+    """orjson 직렬화 결과가 pydantic JSON 직렬화와 동일"""
+    result = BoardListResponse(
+        items=[
+            BoardListItem(
+                id=1,
+                title="제목",
+                content="내용",
+                view_count=3,
+                author_name="테스터",
+                created_at=datetime(2026, 1, 28, 12, 30, 15, 123456),
+            )
+        ],
+        next_cursor=1,
+        has_more=False,
+    )
+    assert json.loads(dump_json(result)) == json.loads(result.model_dump_json())
+
+
+def test_model_json_response_accepts_bytes():
+    """직렬화된 bytes는 그대로 응답 본문으로 사용"""
+    response = ModelJSONResponse(b'{"a":1}', status_code=201)
+    assert response.body == b'{"a":1}'
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
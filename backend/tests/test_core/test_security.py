@@ -0,0 +1,58 @@
+"""
+보안 유틸리티 테스트
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.core.cache import token_cache
+from app.core.security import (
+    PasswordHashBusyError,
+    PasswordHashPool,
+    create_access_token,
+    decode_access_token,
+    get_password_hash_async,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_async_roundtrip():
+    """비동기 해싱/검증"""
+    hashed = await get_password_hash_async("password123")
+    assert await verify_password_async("password123", hashed) is True
+    assert await verify_password_async("wrong", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_when_saturated():
+    """실행 + 대기 작업이 한도에 도달하면 즉시 거절"""
+    pool = PasswordHashPool(max_workers=1, max_queue=1, retry_after=3)
+    release = threading.Event()
+
+    running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert pool.pending == 2
+
+    with pytest.raises(PasswordHashBusyError) as exc_info:
+        await pool.run(release.wait)
+    assert exc_info.value.retry_after == 3
+    assert pool.rejected == 1
+
+    release.set()
+    await asyncio.gather(*running)
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_decode_access_token_cached():
+    """검증된 토큰은 캐시에서 반환, 위조 토큰은 거부"""
+    token = create_access_token(data={"sub": "1"})
+    hits = token_cache.hits
+
+    assert decode_access_token(token)["sub"] == "1"
+    assert decode_access_token(token)["sub"] == "1"
+    assert token_cache.hits == hits + 1
+
+    assert decode_access_token(token[:-2] + "xx") is None
@@ -0,0 +1,84 @@
+"""
+운영 서버 실행 설정 테스트
+"""
+import pytest
+import uvicorn
+
+from app.config import settings
+from app.server import (
+    DrainingServer,
+    ServerWorker,
+    divide_pool,
+    gunicorn_options,
+    worker_count,
+)
+
+
+def test_divide_pool_splits_budget_with_spare_worker():
+    """롤링 재시작 중 워커 1개 추가분까지 예산 안에 들어감"""
+    assert divide_pool(90, 5, 5, 10) == (5, 10)
+    assert divide_pool(90, 8, 5, 10) == (5, 5)
+    assert divide_pool(40, 7, 5, 10) == (5, 0)
+    assert divide_pool(10, 4, 5, 10) == (2, 0)
+    # 0이면 설정값 그대로
+    assert divide_pool(0, 8, 5, 10) == (5, 10)
+
+
+def test_divide_pool_reserved_per_worker():
+    """워커당 풀 밖 커넥션(캐시 무효화 리스너)은 몫에서 제외"""
+    assert divide_pool(90, 8, 5, 10, reserved_per_worker=1) == (5, 4)
+    assert divide_pool(20, 4, 5, 10, reserved_per_worker=1) == (3, 0)
+
+
+def test_divide_pool_rejects_insufficient_budget():
+    """워커당 풀 커넥션이 1개도 안 되면 시작 시 실패"""
+    with pytest.raises(ValueError):
+        divide_pool(3, 8, 5, 10)
+    with pytest.raises(ValueError):
+        divide_pool(17, 8, 5, 10, reserved_per_worker=1)
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 3)
+    assert worker_count() == 3
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 0)
+    assert worker_count() >= 1
+
+
+def test_gunicorn_options():
+    options = gunicorn_options(4)
+
+    assert options["workers"] == 4
+    assert options["worker_class"] == "app.server.ServerWorker"
+    assert options["bind"] == f"{settings.HOST}:{settings.PORT}"
+    assert options["backlog"] == settings.SERVER_BACKLOG
+    assert options["keepalive"] == settings.SERVER_KEEPALIVE
+    # 롤링 재시작 시 새 코드가 적용되도록 워커에서 앱 import
+    assert options["preload_app"] is False
+    assert ServerWorker.CONFIG_KWARGS["loop"] == "uvloop"
+    assert ServerWorker.CONFIG_KWARGS["http"] == "httptools"
+
+
+@pytest.mark.asyncio
+async def test_draining_server_adds_connection_close():
+    """drain 중에만 응답에 Connection: close 추가"""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"x", b"1")]})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    server = DrainingServer(uvicorn.Config(app), drain_seconds=0.1)
+    wrapped = server.wrap(app)
+
+    async def run():
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await wrapped({"type": "http"}, None, send)
+        return sent[0]["headers"]
+
+    assert await run() == [(b"x", b"1")]
+    server.draining = True
+    assert await run() == [(b"x", b"1"), (b"connection", b"close")]
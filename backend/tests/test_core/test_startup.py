@@ -0,0 +1,96 @@
+"""
+시작 준비 (warm startup) 테스트
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.db_pool import prewarm_pool
+from app.core.startup import StartupReport, warm_queries
+from app.database import build_engine
+from app.main import create_app
+
+
+def test_startup_report_phases():
+    report = StartupReport()
+    with report.phase("a"):
+        pass
+    with report.phase("b"):
+        pass
+
+    assert list(report.phases) == ["a", "b"]
+    assert report.total == pytest.approx(sum(report.phases.values()))
+    assert report.summary().startswith("a=")
+    assert "total=" in report.summary()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_with_warm_queries_prepares_statements(db_session: AsyncSession):
+    """pre-warm 커넥션마다 주요 쿼리가 prepare되어 풀에 반환됨"""
+    engine = build_engine(settings.DATABASE_URL_TEST or settings.DATABASE_URL)
+    try:
+        assert await prewarm_pool(engine, 2) == 2
+        assert await prewarm_pool(engine, 2, warm_queries) == 2
+
+        # 추가 커넥션을 열지 않고 기존 유휴 커넥션 재사용
+        assert engine.pool.checkedin() == 2
+        async with engine.connect() as first, engine.connect() as second:
+            for conn in (first, second):
+                raw = await conn.get_raw_connection()
+                assert len(raw.dbapi_connection._prepared_statement_cache) >= 10
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_queries_runs_cursor_pages():
+    """목록 첫 페이지와 커서 페이지(id < :cursor)가 모두 실행됨"""
+    engine = build_engine(settings.DATABASE_URL_TEST or settings.DATABASE_URL)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with engine.connect() as conn:
+            await warm_queries(conn)
+    finally:
+        await engine.dispose()
+
+    lists = [s for s in statements if "ORDER BY boards.id DESC LIMIT" in s and "candidates" not in s]
+    assert any("boards.id <" in s for s in lists)
+    assert any("boards.id <" not in s for s in lists)
+    # 작성자별 목록도 두 변형 모두
+    by_author = [s for s in lists if "boards.user_id =" in s]
+    assert {"boards.id <" in s for s in by_author} == {True, False}
+
+
+@pytest.mark.asyncio
+async def test_prewarm_continues_when_warmup_fails():
+    """warm-up 실패는 로그만 남기고 커넥션은 풀로 반환"""
+    engine = build_engine(settings.DATABASE_URL_TEST or settings.DATABASE_URL)
+
+    async def failing(connection):
+        raise RuntimeError("warm-up 실패")
+
+    try:
+        assert await prewarm_pool(engine, 2, failing) == 2
+        assert engine.pool.checkedin() == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_app_records_startup(client: AsyncClient):
+    """팩토리는 새 앱마다 시작 보고서를 두고 라우터/메트릭을 등록"""
+    app = create_app()
+    assert "create_app" in app.state.startup.phases
+    paths = {route.path for route in app.routes}
+    assert {"/health", "/health/db", f"{settings.API_V1_STR}/boards"} <= paths
+
+    if settings.METRICS_ENABLED:
+        response = await client.get(settings.METRICS_PATH)
+        assert 'app_startup_seconds{phase="create_app"}' in response.text
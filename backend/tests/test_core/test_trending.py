@@ -0,0 +1,124 @@
+"""
+인기 게시글 집계 테스트
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.trending import TrendingBoards
+from app.models.board import Board
+from tests.test_api.test_boards import create_test_user
+from tests.test_core.test_view_counter import create_test_board
+
+
+class FakeTimer:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _item(board_id: int) -> dict:
+    return {"id": board_id, "title": f"제목 {board_id}"}
+
+
+def _ranking(trending: TrendingBoards, k: int = 10) -> list:
+    return [item["id"] for item, _ in trending.top(k)]
+
+
+def test_recent_views_outrank_old_views():
+    """오래된 조회는 반감기마다 절반 가치"""
+    timer = FakeTimer()
+    trending = TrendingBoards(capacity=10, half_life=60.0, timer=timer)
+
+    for _ in range(3):
+        trending.add(1, _item(1))
+    timer.now += 120  # 2 반감기 → 3회 조회는 0.75
+    trending.add(2, _item(2))
+
+    assert _ranking(trending) == [2, 1]
+    scores = dict((item["id"], score) for item, score in trending.top(10))
+    assert scores[1] == pytest.approx(0.75)
+    assert scores[2] == pytest.approx(1.0)
+
+
+def test_capacity_evicts_lowest_score():
+    """가득 차면 최소 점수 게시글 제거, 더 낮은 신규 게시글은 추가하지 않음"""
+    timer = FakeTimer()
+    trending = TrendingBoards(capacity=2, half_life=60.0, timer=timer)
+    trending.add(1, _item(1), views=5)
+    trending.add(2, _item(2), views=2)
+
+    trending.add(3, _item(3), views=1)
+    assert 3 not in trending
+
+    trending.add(3, _item(3), views=3)
+    assert len(trending) == 2
+    assert _ranking(trending) == [1, 3]
+
+
+def test_discard_and_update_board():
+    trending = TrendingBoards(capacity=10, half_life=60.0, timer=FakeTimer())
+    for board_id in (1, 2):
+        trending.add(board_id, _item(board_id))
+
+    trending.discard(1)
+    trending.update_board(Board(id=2, title="수정", content="가" * 150))
+
+    [(item, _)] = trending.top(10)
+    assert item["title"] == "수정"
+    assert item["content"] == "가" * 100 + "..."
+
+
+def test_rebase_keeps_ranking():
+    """기준 시각 이동 후에도 순서와 감쇠 점수 유지"""
+    timer = FakeTimer()
+    trending = TrendingBoards(capacity=10, half_life=1.0, timer=timer)
+    trending.add(1, _item(1), views=4)
+    timer.now += 1
+    trending.add(2, _item(2), views=1)
+
+    timer.now += 100  # exp 지수 한계를 넘어 rebase 발생
+    trending.add(3, _item(3), views=1)
+
+    # 1반감기 전 4회(=2) > 1회
+    assert _ranking(trending) == [3, 1, 2]
+    scores = [score for _, score in trending.top(10)]
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[1] / scores[2] == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_seeds_and_syncs(db_session: AsyncSession):
+    """빈 상태에서 최근 게시글 조회수로 채우고, 이후 스냅샷 갱신 및 삭제 게시글 제외"""
+    user = await create_test_user(db_session)
+    boards = [await create_test_board(db_session, user.id) for _ in range(3)]
+    for board, view_count in zip(boards, (5, 0, 9)):
+        await db_session.execute(
+            update(Board).where(Board.id == board.id).values(view_count=view_count)
+        )
+    await db_session.commit()
+
+    trending = TrendingBoards(
+        capacity=10,
+        half_life=3600.0,
+        session_factory=async_sessionmaker(db_session.bind, expire_on_commit=False),
+    )
+    await trending.reconcile()
+    assert _ranking(trending) == [boards[2].id, boards[0].id]
+
+    await db_session.execute(
+        update(Board).where(Board.id == boards[2].id).values(deleted_at=datetime.utcnow())
+    )
+    await db_session.execute(
+        update(Board).where(Board.id == boards[0].id).values(title="새 제목")
+    )
+    await db_session.commit()
+
+    await trending.reconcile()
+    [(item, _)] = trending.top(10)
+    assert item["id"] == boards[0].id
+    assert item["title"] == "새 제목"
@@ -0,0 +1,76 @@
+"""
+조회수 write-behind 버퍼 테스트
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.view_counter import ViewCountBuffer
+from app.models.board import Board
+from tests.test_api.test_boards import create_test_user, get_auth_header
+
+
+async def create_test_board(db: AsyncSession, user_id: int) -> Board:
+    """테스트용 게시글 생성"""
+    board = Board(user_id=user_id, title="조회수 테스트", content="내용", view_count=0)
+    db.add(board)
+    await db.commit()
+    await db.refresh(board)
+    return board
+
+
+@pytest.mark.asyncio
+async def test_flush_applies_batched_increments(db_session: AsyncSession):
+    """누적된 증가분이 flush 시 한 번에 반영되고 updated_at은 유지"""
+    user = await create_test_user(db_session)
+    board1 = await create_test_board(db_session, user.id)
+    board2 = await create_test_board(db_session, user.id)
+    updated_at = board1.updated_at
+
+    buffer = ViewCountBuffer(
+        session_factory=async_sessionmaker(db_session.bind, expire_on_commit=False)
+    )
+    for _ in range(3):
+        buffer.increment(board1.id)
+    assert buffer.increment(board2.id) == 1
+    assert buffer.pending(board1.id) == 3
+
+    assert await buffer.flush() == 2
+    assert buffer.pending(board1.id) == 0
+
+    result = await db_session.execute(
+        select(Board.id, Board.view_count, Board.updated_at).where(
+            Board.id.in_([board1.id, board2.id])
+        )
+    )
+    rows = {row.id: row for row in result}
+    assert rows[board1.id].view_count == 3
+    assert rows[board2.id].view_count == 1
+    assert rows[board1.id].updated_at == updated_at
+
+    # 누적분이 없으면 아무것도 하지 않음
+    assert await buffer.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_board_detail_does_not_write(client: AsyncClient, db_session: AsyncSession):
+    """상세 조회는 DB에 쓰지 않고 실시간 조회수(저장값 + 미반영분)를 반환"""
+    user = await create_test_user(db_session)
+    headers = get_auth_header(user.id)
+
+    create_res = await client.post(
+        "/api/v1/boards",
+        json={"title": "조회수", "content": "내용"},
+        headers=headers,
+    )
+    board_id = create_res.json()["id"]
+
+    await client.get(f"/api/v1/boards/{board_id}")
+    response = await client.get(f"/api/v1/boards/{board_id}")
+    assert response.json()["view_count"] == 2
+
+    result = await db_session.execute(
+        select(Board.view_count).where(Board.id == board_id)
+    )
+    assert result.scalar_one() == 0
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+echo "🚀 Infolink 운영 서버를 시작합니다..."
+
+# gunicorn 마스터 + uvicorn 워커 (워커 수: WEB_CONCURRENCY, 기본 CPU 코어 수)
+# 사용자/토큰 캐시는 워커별 메모리에 있으며 CACHE_INVALIDATION_CHANNEL(LISTEN/NOTIFY)로
+# 모든 워커에서 무효화됨. 채널을 비우면 사용자 비활성화/권한 변경이 다른 워커에는
+# 최대 USER_CACHE_TTL초 늦게 반영되므로 USER_CACHE_TTL을 몇 초로 줄일 것.
+cd backend
+echo "✅ 코드 교체 후 무중단 재시작: cd backend && python -m app.server restart"
+exec python -m app.server